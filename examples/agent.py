@@ -20,13 +20,49 @@ Usage:
     python examples/agent.py
 """
 
+import functools
+import io
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from pytfe.client import TFEClient
 from pytfe.config import TFEConfig
 from pytfe.errors import NotFound
 from pytfe.models import AgentListOptions
 
+# Upper bound on concurrent API requests issued by this example.
+MAX_WORKERS = 8
+
+# Display template for a listed agent, bound once so rendering an agent is a
+# single call on a tuple from _agent_fields().
+_format_agent = (
+    "Agent %s\nName: %s\nStatus: %s\nVersion: %s\nIP: %s\nLast Ping: %s\n\n"
+).__mod__
+
+
+def _agent_fields(agent):
+    """Return the values shown by _format_agent for an agent."""
+    return (
+        agent.id,
+        agent.name or "Unnamed",
+        agent.status,
+        agent.version or "Unknown",
+        agent.ip_address or "Unknown",
+        agent.last_ping_at or "Never",
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _build_client(token, address):
+    """Build a client once per credentials so repeated runs reuse its pool."""
+    return TFEClient(TFEConfig(token=token, address=address))
+
+
+def _list_agents(client, pool_id, list_options):
+    """Fetch every agent in a pool, prefetching pages as it goes."""
+    return list(client.agents.list(pool_id, options=list_options, prefetch=True))
+
 
 def main():
     """Main function demonstrating agent operations."""
@@ -44,65 +80,78 @@ def main():
         return 1
 
     # Create TFE client
-    config = TFEConfig(token=token, address=address)
-    client = TFEClient(config)
+    client = _build_client(token, address)
 
     print(f"Connected to: {address}")
     print(f" Organization: {org}")
 
     try:
+        # Use optional parameters for listing
+        list_options = AgentListOptions(page_size=100)  # Optional parameter
+
         # Example 1: Find agent pools to demonstrate agent operations
         print("\n Finding agent pools...")
-        agent_pools = client.agent_pools.list(org)
 
-        # Convert to list to check if empty and get count
-        pool_list = list(agent_pools)
-        if not pool_list:
+        # Pools are consumed as their pages stream in. The per-pool agent
+        # listings are independent of each other, so each one is submitted as
+        # soon as its pool arrives and the results are printed in order below.
+        pool_listings = []
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for pool in client.agent_pools.list(org, prefetch=True):
+                print(f"  - {pool.name} (ID: {pool.id}, Agents: {pool.agent_count})")
+                # A pool that reports no agents needs no listing request
+                listing = None
+                if pool.agent_count != 0:
+                    listing = executor.submit(
+                        _list_agents, client, pool.id, list_options
+                    )
+                pool_listings.append((pool, listing))
+
+        if not pool_listings:
             print("No agent pools found. Create an agent pool first.")
             return 1
 
-        print(f"Found {len(pool_list)} agent pools:")
-        for pool in pool_list:
-            print(f"  - {pool.name} (ID: {pool.id}, Agents: {pool.agent_count})")
+        print(f"Found {len(pool_listings)} agent pools")
 
         # Example 2: List agents in each pool
         print("\n Listing agents in each pool...")
-        total_agents = 0
-
-        for pool in pool_list:
+        agent_lists = [
+            listing.result() if listing is not None else []
+            for _, listing in pool_listings
+        ]
+        total_agents = sum(map(len, agent_lists))
+
+        # The list response already carries every field displayed below, so
+        # agents are printed from it directly rather than re-read one by one.
+        for (pool, _), agent_list in zip(pool_listings, agent_lists, strict=True):
             print(f"\n Agents in pool '{pool.name}':")
 
-            # Use optional parameters for listing
-            list_options = AgentListOptions(page_size=10)  # Optional parameter
-            agents = client.agents.list(pool.id, options=list_options)
-
-            # Convert to list to check if empty and iterate
-            agent_list = list(agents)
             if agent_list:
-                total_agents += len(agent_list)
+                # Collect the whole pool's output and write it in one call
+                # rather than issuing several print() calls per agent.
+                buf = io.StringIO()
                 for agent in agent_list:
-                    print(f"Agent {agent.id}")
-                    print(f"Name: {agent.name or 'Unnamed'}")
-                    print(f"Status: {agent.status}")
-                    print(f"Version: {agent.version or 'Unknown'}")
-                    print(f"IP: {agent.ip_address or 'Unknown'}")
-                    print(f"Last Ping: {agent.last_ping_at or 'Never'}")
-
-                    # Example 3: Read detailed agent information
-                    try:
-                        agent_details = client.agents.read(agent.id)
-                        print("Agent details retrieved successfully")
-                        print(f"Full name: {agent_details.name or 'Unnamed'}")
-                        print(f"Current status: {agent_details.status}")
-                    except NotFound:
-                        print("Agent details not accessible")
-                    except Exception as e:
-                        print(f"Error reading agent details: {e}")
-
-                    print("")
+                    buf.write(_format_agent(_agent_fields(agent)))
+                sys.stdout.write(buf.getvalue())
             else:
                 print("No agents found in this pool")
 
+        # Example 3: Read detailed agent information for a single agent
+        first_agent = next(
+            (agent for agent_list in agent_lists for agent in agent_list), None
+        )
+        if first_agent is not None:
+            print(f"\n Reading details for agent {first_agent.id}...")
+            try:
+                agent_details = client.agents.read(first_agent.id)
+                print("Agent details retrieved successfully")
+                print(f"Full name: {agent_details.name or 'Unnamed'}")
+                print(f"Current status: {agent_details.status}")
+            except NotFound:
+                print("Agent details not accessible")
+            except Exception as e:
+                print(f"Error reading agent details: {e}")
+
         if total_agents == 0:
             print("\n No agents found in any pools.")
             print("To see agents in action:")
@@ -124,4 +173,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -17,8 +17,11 @@ Usage:
     python examples/agent_pool.py
 """
 
+import functools
 import os
+import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 from pytfe import TFEClient, TFEConfig
 from pytfe.errors import NotFound
@@ -31,6 +34,14 @@ from pytfe.models import (
 )
 
 
+@functools.lru_cache(maxsize=4)
+def _build_client(token, address):
+    """Build a client once per credentials so repeated runs reuse its pool."""
+    # Caching read results lets the read that follows the create below be
+    # served from memory instead of another API call.
+    return TFEClient(TFEConfig(token=token, address=address, cache_ttl=30))
+
+
 def main():
     """Main function demonstrating agent pool operations."""
     # Get environment variables
@@ -47,8 +58,7 @@ def main():
         return 1
 
     # Create TFE client
-    config = TFEConfig(token=token, address=address)
-    client = TFEClient(config=config)
+    client = _build_client(token, address)
 
     print(f"Connected to: {address}")
     print(f" Organization: {org}")
@@ -56,14 +66,15 @@ def main():
     try:
         # Example 1: List existing agent pools
         print("\n Listing existing agent pools...")
-        list_options = AgentPoolListOptions(page_size=10)  # Optional parameters
-        agent_pools = client.agent_pools.list(org, options=list_options)
+        list_options = AgentPoolListOptions(page_size=100)  # Optional parameters
+        agent_pools = client.agent_pools.list(org, options=list_options, prefetch=True)
 
-        # Convert to list to get count and iterate
-        pool_list = list(agent_pools)
-        print(f"Found {len(pool_list)} agent pools:")
-        for pool in pool_list:
+        # Consume pools as their pages stream in and count them along the way
+        pool_count = 0
+        for pool in agent_pools:
+            pool_count += 1
             print(f"  - {pool.name} (ID: {pool.id}, Agents: {pool.agent_count})")
+        print(f"Found {pool_count} agent pools")
 
         # Example 2: Create a new agent pool
         print("\n Creating a new agent pool...")
@@ -111,19 +122,31 @@ def main():
         print("\n Listing agent tokens...")
         tokens = client.agent_tokens.list(new_pool.id)
 
-        # Convert to list to get count and iterate
-        token_list = list(tokens)
-        print(f"Found {len(token_list)} tokens:")
-        for token in token_list:
+        # Consume tokens as they stream in and count them along the way
+        token_count = 0
+        for token in tokens:
+            token_count += 1
             print(f"  - {token.description or 'No description'} (ID: {token.id})")
+        print(f"Found {token_count} tokens")
 
         # Example 7: Clean up - delete the token and pool
         print("\n Cleaning up...")
-        client.agent_tokens.delete(agent_token.id)
-        print("Deleted agent token")
 
-        client.agent_pools.delete(new_pool.id)
-        print("Deleted agent pool")
+        def delete_token():
+            try:
+                client.agent_tokens.delete(agent_token.id)
+            except NotFound:
+                pass  # Already removed along with its pool
+
+        # Both deletes are issued in parallel; deleting the pool also removes
+        # its tokens server-side, so the token delete may find nothing left.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            token_deleted = executor.submit(delete_token)
+            pool_deleted = executor.submit(client.agent_pools.delete, new_pool.id)
+            token_deleted.result()
+            print("Deleted agent token")
+            pool_deleted.result()
+            print("Deleted agent pool")
 
         print("\n Agent pool operations completed successfully!")
         return 0
@@ -137,4 +160,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -6,13 +6,23 @@ This example demonstrates how to use the Python TFE library to manage
 notification configurations for workspaces and teams.
 """
 
+import io
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the src directory to the Python path so we can import the tfe module
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from pytfe.client import TFEClient
+from pytfe.config import TFEConfig
+from pytfe.errors import (
+    AuthError,
+    InvalidOrgError,
+    NotFound,
+    TFEError,
+    ValidationError,
+)
 from pytfe.models.notification_configuration import (
     NotificationConfigurationCreateOptions,
     NotificationConfigurationListOptions,
@@ -22,13 +32,62 @@ from pytfe.models.notification_configuration import (
     NotificationTriggerType,
 )
 
+# Webhook destinations, overridable from the environment
+SLACK_WEBHOOK_URL = os.getenv(
+    "WEBHOOK_URL",
+    "https://hooks.slack.com/services/YOUR_SLACK_WORKSPACE/YOUR_CHANNEL/YOUR_WEBHOOK_TOKEN",
+)
+TEAMS_WEBHOOK_URL = os.getenv(
+    "TEAMS_WEBHOOK_URL",
+    "https://outlook.office.com/webhook/YOUR_TENANT_ID@YOUR_TENANT_ID/IncomingWebhook/YOUR_CONNECTOR_ID/YOUR_TEAMS_WEBHOOK_TOKEN",
+)
+
+# Trigger sets used by the examples below
+DEFAULT_TRIGGERS = (NotificationTriggerType.COMPLETED, NotificationTriggerType.ERRORED)
+ERROR_TRIGGERS = (NotificationTriggerType.ERRORED,)
+TEAMS_TRIGGERS = (
+    NotificationTriggerType.ERRORED,
+    NotificationTriggerType.NEEDS_ATTENTION,
+)
+
+
+def list_team_notifications(client, team_id):
+    """List the team notification configurations shown in step 2."""
+    team_choice = NotificationConfigurationSubscribableChoice(team={"id": team_id})
+    options = NotificationConfigurationListOptions(subscribable_choice=team_choice)
+    return client.notification_configurations.list(
+        subscribable_id=team_id, options=options
+    )
+
+
+def create_teams_notification(client, workspace_id):
+    """Create the Microsoft Teams workspace notification used in step 9."""
+    workspace_choice = NotificationConfigurationSubscribableChoice(
+        workspace={"id": workspace_id}
+    )
+    teams_create_options = NotificationConfigurationCreateOptions(
+        destination_type=NotificationDestinationType.MICROSOFT_TEAMS,
+        enabled=True,
+        name="Teams Notifications",
+        subscribable_choice=workspace_choice,
+        url=TEAMS_WEBHOOK_URL,
+        triggers=list(TEAMS_TRIGGERS),
+    )
+    return client.notification_configurations.create(workspace_id, teams_create_options)
+
 
 def main():
     """Demonstrate notification configuration operations."""
 
     # Initialize the TFE client
-    # Make sure to set TFE_ADDRESS and TFE_TOKEN environment variables
-    client = TFEClient()
+    # Make sure to set TFE_ADDRESS and TFE_TOKEN environment variables.
+    # Prewarming connects to TFE_ADDRESS while the setup below runs.
+    client = TFEClient(TFEConfig(prewarm=True))
+
+    # Buffer stdout across a step's status lines so each step's output is
+    # flushed in one write when the next step heading is printed
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
 
     print("=== Python TFE Notification Configuration Example ===\n")
 
@@ -38,75 +97,84 @@ def main():
     print(f"Using workspace: {workspace_name} (ID: {workspace_id})")
 
     team_id = os.getenv("TFE_TEAM_ID", "team-example123456789")
-    if team_id == "team-example123456789":
+    using_fake_team = team_id == "team-example123456789"
+    if using_fake_team:
         print("Using fake team ID for demonstration (teams may require paid plan)")
     else:
         print(f"Using real team ID: {team_id}")
 
+    # Notifications created in steps 8 and 9, deleted together at the end
+    created_notifications = []
+
     try:
+        # Steps 1 and 2 are independent reads, so issue them concurrently and
+        # report the results in order below
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            workspace_list_future = executor.submit(
+                client.notification_configurations.list, subscribable_id=workspace_id
+            )
+            team_list_future = executor.submit(list_team_notifications, client, team_id)
+
         # ===== List notification configurations for workspace =====
-        print("1. Listing notification configurations for workspace...")
+        print("1. Listing notification configurations for workspace...", flush=True)
         try:
-            workspace_notifications = client.notification_configurations.list(
-                subscribable_id=workspace_id
-            )
+            workspace_notifications = workspace_list_future.result()
             print(
                 f"Found {len(workspace_notifications.items)} notification configurations"
             )
-            for nc in workspace_notifications.items:
-                print(f"- {nc.name} (ID: {nc.id}, Enabled: {nc.enabled})")
+            if workspace_notifications.items:
+                print(
+                    "\n".join(
+                        f"- {nc.name} (ID: {nc.id}, Enabled: {nc.enabled})"
+                        for nc in workspace_notifications.items
+                    )
+                )
         except Exception as e:
             print(f"Error listing workspace notifications: {e}")
 
         print()
 
         # ===== List notification configurations for team =====
-        print("2. Listing notification configurations for team...")
+        print("2. Listing notification configurations for team...", flush=True)
         try:
-            team_choice = NotificationConfigurationSubscribableChoice(
-                team={"id": team_id}
-            )
-            options = NotificationConfigurationListOptions(
-                subscribable_choice=team_choice
-            )
-            team_notifications = client.notification_configurations.list(
-                subscribable_id=team_id, options=options
-            )
+            team_notifications = team_list_future.result()
             print(
                 f"Found {len(team_notifications.items)} team notification configurations"
             )
-            for nc in team_notifications.items:
-                print(f"- {nc.name} (ID: {nc.id}, Enabled: {nc.enabled})")
+            if team_notifications.items:
+                print(
+                    "\n".join(
+                        f"- {nc.name} (ID: {nc.id}, Enabled: {nc.enabled})"
+                        for nc in team_notifications.items
+                    )
+                )
+        except NotFound:
+            print(f"Team not found (expected with fake team ID): {team_id}")
+            print("Teams are not available in HCP Terraform free plan")
         except Exception as e:
-            error_msg = str(e).lower()
-            if "not found" in error_msg:
-                print(f"Team not found (expected with fake team ID): {team_id}")
-                print("Teams are not available in HCP Terraform free plan")
-            else:
-                print(f"Error listing team notifications: {e}")
+            print(f"Error listing team notifications: {e}")
 
         print()
 
+        # The Teams notification of step 9 doesn't depend on steps 3-8, so
+        # create it in the background while they run
+        executor = ThreadPoolExecutor(max_workers=1)
+        teams_future = executor.submit(create_teams_notification, client, workspace_id)
+        executor.shutdown(wait=False)
+
         # ===== Create a new workspace notification configuration =====
-        print("3. Creating a new workspace notification configuration...")
+        print("3. Creating a new workspace notification configuration...", flush=True)
         try:
             workspace_choice = NotificationConfigurationSubscribableChoice(
                 workspace={"id": workspace_id}
             )
-            slack_url = os.getenv(
-                "WEBHOOK_URL",
-                "https://hooks.slack.com/services/YOUR_SLACK_WORKSPACE/YOUR_CHANNEL/YOUR_WEBHOOK_TOKEN",
-            )
             create_options = NotificationConfigurationCreateOptions(
                 destination_type=NotificationDestinationType.SLACK,
                 enabled=True,
                 name="Python TFE Example Slack Notification",
                 subscribable_choice=workspace_choice,
-                url=slack_url,
-                triggers=[
-                    NotificationTriggerType.COMPLETED,
-                    NotificationTriggerType.ERRORED,
-                ],
+                url=SLACK_WEBHOOK_URL,
+                triggers=list(DEFAULT_TRIGGERS),
             )
 
             new_notification = client.notification_configurations.create(
@@ -118,22 +186,21 @@ def main():
 
             notification_id = new_notification.id
 
-            # ===== Read the notification configuration =====
-            print("\n4. Reading the notification configuration...")
-            read_notification = client.notification_configurations.read(
-                notification_config_id=notification_id
-            )
-            print(f"Read notification: {read_notification.name}")
-            print(f"Destination type: {read_notification.destination_type}")
-            print(f"Enabled: {read_notification.enabled}")
-            print(f"Triggers: {read_notification.triggers}")
+            # ===== Use the created notification configuration =====
+            # The create response already carries every attribute, so there's
+            # no need for a separate read() round trip here
+            print("\n4. Using the created notification configuration...", flush=True)
+            print(f"Notification: {new_notification.name}")
+            print(f"Destination type: {new_notification.destination_type}")
+            print(f"Enabled: {new_notification.enabled}")
+            print(f"Triggers: {new_notification.triggers}")
 
             # ===== Update the notification configuration =====
-            print("\n5. Updating the notification configuration...")
+            print("\n5. Updating the notification configuration...", flush=True)
             update_options = NotificationConfigurationUpdateOptions(
                 name="Updated Python TFE Example Webhook",
                 enabled=False,
-                triggers=[NotificationTriggerType.ERRORED],  # Only notify on errors
+                triggers=list(ERROR_TRIGGERS),  # Only notify on errors
             )
 
             updated_notification = client.notification_configurations.update(
@@ -143,7 +210,7 @@ def main():
             print(f"Enabled: {updated_notification.enabled}")
 
             # ===== Verify the notification configuration =====
-            print("\n6. Verifying the notification configuration...")
+            print("\n6. Verifying the notification configuration...", flush=True)
             print("Note: This will fail with fake URLs - that's expected!")
             try:
                 client.notification_configurations.verify(
@@ -151,14 +218,17 @@ def main():
                 )
                 print(f"Verification successful for notification ID: {notification_id}")
                 print("Note: Verification sends a test payload to the configured URL")
-            except Exception as e:
+            except TFEError as e:
                 print(f"Verification failed (expected with fake URL): {e}")
                 print(
                     "To test verification, use a real webhook URL from Slack, Teams, or Discord"
                 )
+            except Exception as e:
+                # Still fall through to step 7 so the configuration is deleted
+                print(f"Verification error: {type(e).__name__}: {e}")
 
             # ===== Delete the notification configuration =====
-            print("\n7. Deleting the notification configuration...")
+            print("\n7. Deleting the notification configuration...", flush=True)
             client.notification_configurations.delete(
                 notification_config_id=notification_id
             )
@@ -170,12 +240,11 @@ def main():
                     notification_config_id=notification_id
                 )
                 print("ERROR: Notification still exists after deletion!")
-            except Exception:
+            except (NotFound, InvalidOrgError):
                 print("Confirmed: Notification configuration has been deleted")
 
-        except Exception as e:
-            error_msg = str(e).lower()
-            if "verification failed" in error_msg and "404" in error_msg:
+        except ValidationError as e:
+            if "verification failed" in str(e).lower():
                 print(" Webhook verification failed (expected with fake URL)")
                 print("The fake Slack URL returns 404 - this is normal for testing")
                 print("To test real verification, use a webhook from:")
@@ -183,27 +252,30 @@ def main():
                 print("Slack, Teams, or Discord webhook")
             else:
                 print(f" Error in workspace notification operations: {e}")
+        except Exception as e:
+            print(f" Error in workspace notification operations: {e}")
 
         print()
 
         # ===== Create a team notification configuration =====
-        print("8. Creating a team notification configuration...")
-        try:
-            if team_id != "team-example123456789":  # Only try if we have a real team ID
+        print("8. Creating a team notification configuration...", flush=True)
+        # Only try if we have a real team ID; the fake one would just 404
+        if using_fake_team:
+            print(
+                f"Skipping team notifications - no real team ID available (using: {team_id})"
+            )
+        else:
+            try:
                 team_choice = NotificationConfigurationSubscribableChoice(
                     team={"id": team_id}
                 )
-                team_slack_url = os.getenv(
-                    "WEBHOOK_URL",
-                    "https://hooks.slack.com/services/YOUR_SLACK_WORKSPACE/YOUR_CHANNEL/YOUR_WEBHOOK_TOKEN",
-                )
                 # Try with minimal triggers for teams - some triggers may not be supported
                 team_create_options = NotificationConfigurationCreateOptions(
                     destination_type=NotificationDestinationType.SLACK,
                     enabled=True,
                     name="Team Slack Notifications",
                     subscribable_choice=team_choice,
-                    url=team_slack_url,
+                    url=SLACK_WEBHOOK_URL,
                     triggers=[],  # Try with no triggers first
                 )
 
@@ -214,61 +286,30 @@ def main():
                     f"Created team notification: {team_notification.name} (ID: {team_notification.id})"
                 )
 
-                # Clean up team notification
-                client.notification_configurations.delete(
-                    notification_config_id=team_notification.id
-                )
-                print(f"Cleaned up team notification: {team_notification.id}")
-            else:
-                print(
-                    f"Skipping team notifications - no real team ID available (using: {team_id})"
-                )
+                created_notifications.append(("team", team_notification.id))
 
-        except Exception as e:
-            print(f" Error in team notification operations: {e}")
-            error_msg = str(e).lower()
-            if "not found" in error_msg:
+            except (NotFound, InvalidOrgError) as e:
+                print(f" Error in team notification operations: {e}")
                 print("Team may not exist or token lacks team permissions")
-            elif "forbidden" in error_msg or "unauthorized" in error_msg:
+            except AuthError as e:
+                print(f" Error in team notification operations: {e}")
                 print("Token may lack team notification permissions")
-            elif "team" in error_msg:
-                print("Team-specific error - check team settings or plan level")
+            except Exception as e:
+                print(f" Error in team notification operations: {e}")
+                if "team" in str(e).lower():
+                    print("Team-specific error - check team settings or plan level")
 
         print()
 
         # ===== Create a Microsoft Teams notification configuration =====
-        print("9. Creating a Microsoft Teams notification configuration...")
+        print("9. Creating a Microsoft Teams notification configuration...", flush=True)
         try:
-            workspace_choice = NotificationConfigurationSubscribableChoice(
-                workspace={"id": workspace_id}
-            )
-            teams_create_options = NotificationConfigurationCreateOptions(
-                destination_type=NotificationDestinationType.MICROSOFT_TEAMS,
-                enabled=True,
-                name="Teams Notifications",
-                subscribable_choice=workspace_choice,
-                url=os.getenv(
-                    "TEAMS_WEBHOOK_URL",
-                    "https://outlook.office.com/webhook/YOUR_TENANT_ID@YOUR_TENANT_ID/IncomingWebhook/YOUR_CONNECTOR_ID/YOUR_TEAMS_WEBHOOK_TOKEN",
-                ),
-                triggers=[
-                    NotificationTriggerType.ERRORED,
-                    NotificationTriggerType.NEEDS_ATTENTION,
-                ],
-            )
-
-            teams_notification = client.notification_configurations.create(
-                workspace_id, teams_create_options
-            )
+            teams_notification = teams_future.result()
             print(
                 f"Created Teams notification: {teams_notification.name} (ID: {teams_notification.id})"
             )
 
-            # Clean up Teams notification
-            client.notification_configurations.delete(
-                notification_config_id=teams_notification.id
-            )
-            print(f"Cleaned up Teams notification: {teams_notification.id}")
+            created_notifications.append(("Teams", teams_notification.id))
 
         except Exception as e:
             print(f"Error in Teams notification operations: {e}")
@@ -284,6 +325,28 @@ def main():
             "3. Replace workspace_id and team_id with actual values from your organization"
         )
 
+    # ===== Clean up the notifications created in steps 8 and 9 =====
+    if created_notifications:
+        print("\n10. Cleaning up created notification configurations...", flush=True)
+        with ThreadPoolExecutor(max_workers=len(created_notifications)) as executor:
+            cleanups = [
+                (
+                    kind,
+                    notification_id,
+                    executor.submit(
+                        client.notification_configurations.delete,
+                        notification_config_id=notification_id,
+                    ),
+                )
+                for kind, notification_id in created_notifications
+            ]
+        for kind, notification_id, future in cleanups:
+            try:
+                future.result()
+                print(f"Cleaned up {kind} notification: {notification_id}")
+            except Exception as e:
+                print(f"Error cleaning up {kind} notification {notification_id}: {e}")
+
     print("\n=== Notification Configuration Example Complete ===")
 
 
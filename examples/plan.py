@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import argparse
-import json
+import io
 import os
+import sys
+from itertools import islice
 
 from pytfe import TFEClient, TFEConfig
 
@@ -10,10 +12,14 @@ from pytfe import TFEClient, TFEConfig
 def _print_header(title: str):
     print("\n" + "=" * 80)
     print(title)
-    print("=" * 80)
+    print("=" * 80, flush=True)
 
 
 def main():
+    # Block-buffer stdout; _print_header flushes at each section boundary
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=False)
+
     parser = argparse.ArgumentParser(description="Plans demo for python-tfe SDK")
     parser.add_argument(
         "--address", default=os.getenv("TFE_ADDRESS", "https://app.terraform.io")
@@ -46,34 +52,41 @@ def main():
     # 2) Get JSON output if the plan has it
     _print_header("Reading JSON Output")
     try:
-        json_output = client.plans.read_json_output(args.plan_id)
-        print(
-            f"JSON Output Keys: {list(json_output.keys()) if isinstance(json_output, dict) else 'Not a dict'}"
-        )
+        if args.save_json:
+            # Write the server's bytes straight to disk without parsing them,
+            # so memory stays flat however large the plan is; the summary
+            # below needs the whole document, so it is skipped here
+            size = 0
+            with open(args.save_json, "wb") as f:
+                for chunk in client.plans.stream_json_output(args.plan_id):
+                    size += f.write(chunk)
+            print(f"JSON output saved to: {args.save_json} ({size} bytes)")
+            print("Run without --save-json to print a summary of the JSON output")
+            json_output = None
+        else:
+            json_output = client.plans.read_json_output(args.plan_id)
+        if json_output is not None:
+            print(
+                f"JSON Output Keys: {list(json_output.keys()) if isinstance(json_output, dict) else 'Not a dict'}"
+            )
 
         if isinstance(json_output, dict):
-            # Print some key information from the JSON output
-            if "format_version" in json_output:
-                print(f"Format Version: {json_output['format_version']}")
-            if "terraform_version" in json_output:
-                print(f"Terraform Version: {json_output['terraform_version']}")
-            if "resource_changes" in json_output:
-                changes = json_output["resource_changes"]
-                print(f"Number of Resource Changes: {len(changes) if changes else 0}")
+            # Print some key information from the JSON output, looking each
+            # top-level key up once
+            if (format_version := json_output.get("format_version")) is not None:
+                print(f"Format Version: {format_version}")
+            if (tf_version := json_output.get("terraform_version")) is not None:
+                print(f"Terraform Version: {tf_version}")
+            if (changes := json_output.get("resource_changes")) is not None:
+                print(f"Number of Resource Changes: {len(changes)}")
 
                 # Show first few resource changes
                 if changes:
                     print("\nFirst few resource changes:")
-                    for i, change in enumerate(changes[:3]):
+                    for i, change in enumerate(islice(changes, 3), 1):
                         action = change.get("change", {}).get("actions", [])
                         address = change.get("address", "unknown")
-                        print(f"  {i + 1}. {address}: {action}")
-
-        # Save JSON output if requested
-        if args.save_json:
-            with open(args.save_json, "w") as f:
-                json.dump(json_output, f, indent=2, default=str)
-            print(f"\nJSON output saved to: {args.save_json}")
+                        print(f"  {i}. {address}: {action}")
 
     except Exception as e:
         print(f"Error reading JSON output: {e}")
@@ -85,4 +98,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
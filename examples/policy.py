@@ -20,6 +20,8 @@ from __future__ import annotations
 
 import argparse
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pytfe import TFEClient, TFEConfig
@@ -31,6 +33,9 @@ from pytfe.models import (
     PolicyUpdateOptions,
 )
 
+# Upper bound on page requests in flight when listing the remaining pages
+PAGE_WORKERS = 8
+
 
 def _print_header(title: str):
     print("\n" + "=" * 80)
@@ -38,6 +43,12 @@ def _print_header(title: str):
     print("=" * 80)
 
 
+def _list_page(client, organization, options, page_number):
+    """Fetch one page of policies, reusing ``options`` for the filters."""
+    page_options = options.model_copy(update={"page_number": page_number})
+    return client.policies.list(organization, page_options)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Policy management demo for python-tfe SDK"
@@ -94,13 +105,28 @@ def main():
         )
 
     policy_list = client.policies.list(args.org, list_options)
+    policies = list(policy_list.items)
+
+    # The first response reports total_pages, so the pages after it are
+    # requested concurrently instead of one round trip at a time
+    remaining = range(args.page + 1, (policy_list.total_pages or 0) + 1)
+    if remaining:
+        with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+            pages = executor.map(
+                lambda n: _list_page(client, args.org, list_options, n), remaining
+            )
+            for page in pages:
+                policies.extend(page.items)
 
     print(f"Total policies: {policy_list.total_count}")
-    print(f"Page {policy_list.current_page} of {policy_list.total_pages}")
+    if remaining:
+        print(f"Pages {args.page}-{remaining[-1]} of {policy_list.total_pages}")
+    else:
+        print(f"Page {policy_list.current_page} of {policy_list.total_pages}")
     print()
 
     existing_policy = None
-    for policy in policy_list.items:
+    for policy in policies:
         print(
             f"- {policy.id} | {policy.name} | kind={policy.kind} | enforcement={policy.enforcement_level}"
         )
@@ -260,4 +286,4 @@ main {
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -36,6 +36,7 @@ from __future__ import annotations
 
 import argparse
 import os
+import sys
 
 from pytfe import TFEClient, TFEConfig
 from pytfe.models import (
@@ -146,4 +147,4 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -1,5 +1,27 @@
-from . import errors, models
-from .client import TFEClient
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from . import errors
 from .config import TFEConfig
 
+if TYPE_CHECKING:
+    from . import models
+    from .client import TFEClient
+
 __all__ = ["TFEConfig", "TFEClient", "errors", "models"]
+
+
+def __getattr__(name: str) -> Any:
+    # The client and models pull in every resource and pydantic model, so they
+    # are only imported on first access (PEP 562). This keeps imports such as
+    # ``pytfe.errors`` cheap for callers that never build a client.
+    if name == "TFEClient":
+        from .client import TFEClient
+
+        return TFEClient
+    if name == "models":
+        from . import models
+
+        return models
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
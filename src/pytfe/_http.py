@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import re
+import socket
+import threading
 import time
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Any
 from urllib.parse import urljoin
 
 import httpx
 
-from ._jsonapi import build_headers, parse_error_payload
+from ._jsonapi import build_headers, dumps, loads, parse_error_payload
 from .errors import (
     AuthError,
     NotFound,
@@ -21,6 +23,18 @@ _RETRY_STATUSES = {429, 502, 503, 504}
 
 ABSOLUTE_URL_RE = re.compile(r"^https?://", re.I)
 
+# Size of the chunks yielded by HTTPTransport.stream
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+# httpcore already disables Nagle (TCP_NODELAY) on every connection; enable
+# TCP keepalive as well so a pooled connection that was silently dropped is
+# noticed instead of stalling the next request. TCP_KEEPIDLE is Linux-only.
+_SOCKET_OPTIONS: list[tuple[int, int, int]] = [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+
 
 class HTTPTransport:
     def __init__(
@@ -38,6 +52,9 @@ class HTTPTransport:
         http2: bool,
         proxies: str | None,
         ca_bundle: str | None,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 32,
+        keepalive_expiry: float = 30.0,
     ):
         self.base = address.rstrip("/")
         self.headers = build_headers(user_agent_suffix)
@@ -52,13 +69,49 @@ class HTTPTransport:
         self.http2 = http2
         self.proxies = proxies
         self.ca_bundle = ca_bundle
+        # A single pooled client keeps TCP/TLS connections alive across calls
+        # so sequential requests don't each pay for a new handshake. httpx also
+        # advertises and transparently decodes gzip/deflate response bodies,
+        # adding br when a Brotli decoder is installed (``pytfe[brotli]``).
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # Mounted for "all://" rather than passed as ``transport=`` so that
+        # proxies from the environment still take precedence for their schemes.
+        transport = httpx.HTTPTransport(
+            http2=http2,
+            verify=ca_bundle or verify_tls,
+            proxy=proxies,
+            limits=self.limits,
+            socket_options=_SOCKET_OPTIONS,
+        )
         self._sync = httpx.Client(
             http2=http2,
             timeout=timeout,
             verify=ca_bundle or verify_tls,
             proxy=proxies,
+            limits=self.limits,
+            mounts={"all://": transport},
         )
 
+    def prewarm(self) -> threading.Thread:
+        """Open a pooled connection in the background so the first real call
+        doesn't pay for DNS resolution and the TLS handshake."""
+
+        def _ping() -> None:
+            try:
+                self._sync.head(
+                    self._build_url("/api/v2/ping"), headers=self.headers, timeout=2
+                )
+            except Exception:
+                pass
+
+        thread = threading.Thread(target=_ping, name="pytfe-prewarm", daemon=True)
+        thread.start()
+        return thread
+
     def _build_url(self, path: str) -> str:
         # IMPORTANT: don't prefix absolute URLs (hosted_state, signed blobs, etc.)
         if ABSOLUTE_URL_RE.match(path):
@@ -80,6 +133,8 @@ class HTTPTransport:
         hdrs = dict(self.headers)
         if headers:
             hdrs.update(headers)
+        if json_body is not None:
+            data = dumps(json_body)
         attempt = 0
         # print(method, url, params, json_body, hdrs)
         while True:
@@ -88,7 +143,6 @@ class HTTPTransport:
                     method,
                     url,
                     params=params,
-                    json=json_body,
                     content=data,
                     headers=hdrs,
                     follow_redirects=allow_redirects,
@@ -108,6 +162,51 @@ class HTTPTransport:
             self._raise_if_error(resp)
             return resp
 
+    def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        chunk_size: int = _STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Yield the response body in chunks instead of buffering it whole.
+
+        Errors are raised as in :meth:`request`. Retries only happen before
+        the first chunk has been yielded.
+        """
+        url = self._build_url(path)
+        hdrs = dict(self.headers)
+        if headers:
+            hdrs.update(headers)
+        req = self._sync.build_request(method, url, params=params, headers=hdrs)
+        attempt = 0
+        while True:
+            try:
+                resp = self._sync.send(req, stream=True, follow_redirects=True)
+            except httpx.HTTPError as e:
+                if attempt >= self.max_retries:
+                    raise ServerError(str(e)) from e
+                self._sleep(attempt, None)
+                attempt += 1
+                continue
+            if resp.status_code in _RETRY_STATUSES and attempt < self.max_retries:
+                resp.close()
+                self._sleep(attempt, _parse_retry_after(resp))
+                attempt += 1
+                continue
+            break
+        try:
+            if not 200 <= resp.status_code < 300:
+                resp.read()
+                self._raise_if_error(resp)
+            yield from resp.iter_bytes(chunk_size)
+        except httpx.HTTPError as e:
+            raise ServerError(str(e)) from e
+        finally:
+            resp.close()
+
     def _sleep(self, attempt: int, retry_after: float | None) -> None:
         if retry_after is not None:
             time.sleep(retry_after)
@@ -118,10 +217,11 @@ class HTTPTransport:
     def _raise_if_error(self, resp: httpx.Response) -> None:
         status = resp.status_code
 
-        if 200 <= status < 300:
+        # 304 only answers a conditional request the caller chose to send
+        if 200 <= status < 300 or status == 304:
             return
         try:
-            payload: Any = resp.json()
+            payload: Any = loads(resp.content)
         except Exception:
             payload = {}
         errors = parse_error_payload(payload)
@@ -1,7 +1,29 @@
 from __future__ import annotations
 
+import json
 from typing import Any
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def loads(content: bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if _HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(obj: Any) -> bytes:
+    """Encode a JSON document, using orjson when it is installed."""
+    if _HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
 
 def build_headers(user_agent_suffix: str | None = None) -> dict[str, str]:
     ua = "pytfe/0.1"
@@ -0,0 +1,188 @@
+"""In-process TTL + LRU cache for service read results.
+
+Services opt in by decorating their methods with :func:`cached`,
+:func:`cache_put` and :func:`cache_invalidate`. The decorators are no-ops
+unless the service was constructed with a :class:`TTLCache`, which
+``TFEClient`` only does when ``TFEConfig.cache_ttl`` is greater than zero.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire after ``ttl`` seconds.
+
+    Once ``maxsize`` entries are stored, the least recently used entry is
+    evicted to make room for a new one.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be greater than zero")
+        if ttl <= 0:
+            raise ValueError("ttl must be greater than zero")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_prefix(self, prefix: tuple[Any, ...]) -> None:
+        """Remove every tuple key that starts with ``prefix``."""
+        n = len(prefix)
+        with self._lock:
+            stale = [k for k in self._data if isinstance(k, tuple) and k[:n] == prefix]
+            for key in stale:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cached(
+    namespace: str, variant: Callable[..., Hashable] | None = None
+) -> Callable[[F], F]:
+    """Serve ``method(self, resource_id)`` from the service cache when possible.
+
+    Calls that pass any further non-``None`` argument (such as read options
+    requesting related resources) bypass the cache, as their responses differ.
+    Methods whose extra arguments select one of a few response shapes can pass
+    ``variant``: it is called with those arguments and its result becomes part
+    of the cache key, so each shape is cached separately.
+    """
+
+    def decorator(fn: F) -> F:
+        id_param = _resource_id_param(fn)
+
+        @functools.wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            cache: TTLCache | None = self._cache
+            if cache is None:
+                return fn(self, *args, **kwargs)
+            resource_id, rest, rest_kwargs = _split_resource_id(id_param, args, kwargs)
+            if resource_id is _MISSING:
+                return fn(self, *args, **kwargs)
+            if variant is not None:
+                key: tuple[Any, ...] = (
+                    namespace,
+                    resource_id,
+                    variant(*rest, **rest_kwargs),
+                )
+            elif _has_arguments(rest, rest_kwargs):
+                return fn(self, *args, **kwargs)
+            else:
+                key = (namespace, resource_id)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = fn(self, *args, **kwargs)
+                cache.set(key, value)
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def cache_put(namespace: str) -> Callable[[F], F]:
+    """Store the returned resource in the service cache under its ``id``."""
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            value = fn(self, *args, **kwargs)
+            cache: TTLCache | None = self._cache
+            if cache is not None and getattr(value, "id", None):
+                cache.set((namespace, value.id), value)
+            return value
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def cache_invalidate(namespace: str) -> Callable[[F], F]:
+    """Drop the cached entries for ``resource_id`` once the call returns.
+
+    Entries are dropped even when the call raises, since a write may have
+    changed server state before failing (e.g. a later request of a batch).
+    """
+
+    def decorator(fn: F) -> F:
+        id_param = _resource_id_param(fn)
+
+        @functools.wraps(fn)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return fn(self, *args, **kwargs)
+            finally:
+                cache: TTLCache | None = self._cache
+                if cache is not None:
+                    resource_id, _, _ = _split_resource_id(id_param, args, kwargs)
+                    if resource_id is not _MISSING:
+                        cache.pop_prefix((namespace, resource_id))
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _has_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> bool:
+    return any(a is not None for a in args) or any(
+        v is not None for v in kwargs.values()
+    )
+
+
+def _resource_id_param(fn: Callable[..., Any]) -> str:
+    # Name of the parameter following ``self``, so that callers may pass the
+    # resource ID either positionally or by keyword
+    return list(inspect.signature(fn).parameters)[1]
+
+
+def _split_resource_id(
+    name: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> tuple[Any, tuple[Any, ...], dict[str, Any]]:
+    """Separate the resource ID from the remaining call arguments."""
+    if args:
+        return args[0], args[1:], kwargs
+    if name in kwargs:
+        kwargs = dict(kwargs)
+        return kwargs.pop(name), args, kwargs
+    return _MISSING, args, kwargs
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from ._http import HTTPTransport
+from .cache import TTLCache
 from .config import TFEConfig
 from .resources.agent_pools import AgentPools
 from .resources.agents import Agents, AgentTokens
@@ -54,20 +55,32 @@ class TFEClient:
             http2=cfg.http2,
             proxies=cfg.proxies,
             ca_bundle=cfg.ca_bundle,
+            max_connections=cfg.max_connections,
+            max_keepalive_connections=cfg.max_keepalive_connections,
+            keepalive_expiry=cfg.keepalive_expiry,
         )
-        self.oauth_clients = OAuthClients(self._transport)
+        if cfg.prewarm:
+            self._transport.prewarm()
+        self._cache = (
+            TTLCache(maxsize=cfg.cache_maxsize, ttl=cfg.cache_ttl)
+            if cfg.cache_ttl > 0
+            else None
+        )
+        self.oauth_clients = OAuthClients(self._transport, self._cache)
         self.oauth_tokens = OAuthTokens(self._transport)
         # Agent resources
-        self.agent_pools = AgentPools(self._transport)
-        self.agents = Agents(self._transport)
+        self.agent_pools = AgentPools(self._transport, self._cache)
+        self.agents = Agents(self._transport, self._cache)
         self.agent_tokens = AgentTokens(self._transport)
 
         # Core resources
         self.configuration_versions = ConfigurationVersions(self._transport)
-        self.notification_configurations = NotificationConfigurations(self._transport)
+        self.notification_configurations = NotificationConfigurations(
+            self._transport, self._cache
+        )
         self.applies = Applies(self._transport)
         self.plans = Plans(self._transport)
-        self.organizations = Organizations(self._transport)
+        self.organizations = Organizations(self._transport, self._cache)
         self.organization_memberships = OrganizationMemberships(self._transport)
         self.projects = Projects(self._transport)
         self.variables = Variables(self._transport)
@@ -101,6 +114,11 @@ class TFEClient:
         # Reserved Tag Key
         self.reserved_tag_key = ReservedTagKeys(self._transport)
 
+    def cache_clear(self) -> None:
+        """Drop every cached read result, if caching is enabled."""
+        if self._cache is not None:
+            self._cache.clear()
+
     def close(self) -> None:
         try:
             self._transport._sync.close()
@@ -22,8 +22,17 @@ class TFEConfig(BaseModel):
     backoff_cap: float = 8.0
     backoff_jitter: bool = True
     http2: bool = True
+    max_connections: int = 32
+    max_keepalive_connections: int = 32
+    # Seconds an idle pooled connection is kept open for reuse.
+    keepalive_expiry: float = 30.0
     proxies: str | None = None
     ca_bundle: str | None = os.getenv("SSL_CERT_FILE", None)
+    # Seconds to keep read results in memory; 0 disables the cache.
+    cache_ttl: float = float(os.getenv("TFE_CACHE_TTL", "0"))
+    cache_maxsize: int = 1024
+    # Open the first pooled connection in the background at client creation.
+    prewarm: bool = os.getenv("TFE_PREWARM", "false").lower() in ("1", "true", "yes")
 
     @classmethod
     def from_env(cls) -> TFEConfig:
@@ -1,33 +1,71 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 from .._http import HTTPTransport
+from .._jsonapi import loads
+from ..cache import TTLCache
 
 
 class _Service:
-    def __init__(self, t: HTTPTransport) -> None:
+    def __init__(self, t: HTTPTransport, cache: TTLCache | None = None) -> None:
         self.t = t
+        self._cache = cache
 
     def _list(
-        self, path: str, *, params: dict | None = None
+        self, path: str, *, params: dict | None = None, prefetch: bool = False
     ) -> Iterator[dict[str, Any]]:
+        if prefetch:
+            yield from self._list_prefetch(path, params=params)
+            return
         page = 1
         while True:
-            p = dict(params or {})
-            p.setdefault("page[number]", page)
-            p.setdefault("page[size]", 100)
-            r = self.t.request("GET", path, params=p)
-
-            # Handle cases where r.json() returns None or is not a dict
-            json_response = r.json()
-            if json_response is None:
-                json_response = {}
-
-            data = json_response.get("data", [])
+            data, page_size = self._fetch_page(path, params, page)
             yield from data
-            page_size = int(p["page[size]"])
             if len(data) < page_size:
                 break
             page += 1
+
+    def _list_prefetch(
+        self, path: str, *, params: dict | None = None
+    ) -> Iterator[dict[str, Any]]:
+        # Request page k+1 in the background while the caller consumes page k,
+        # overlapping one page of network latency with processing.
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            page = 1
+            pending: Future | None = executor.submit(
+                self._fetch_page, path, params, page
+            )
+            while pending is not None:
+                data, page_size = pending.result()
+                pending = None
+                if len(data) >= page_size:
+                    page += 1
+                    pending = executor.submit(self._fetch_page, path, params, page)
+                yield from data
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_page(
+        self, path: str, params: dict | None, page: int
+    ) -> tuple[list[dict[str, Any]], int]:
+        p = dict(params or {})
+        p.setdefault("page[number]", page)
+        p.setdefault("page[size]", 100)
+        r = self.t.request("GET", path, params=p)
+
+        # Handle cases where the body decodes to None or is not a dict
+        json_response = loads(r.content)
+        if json_response is None:
+            json_response = {}
+
+        data = json_response.get("data", [])
+
+        # The server caps page[size] and reports the size it actually used;
+        # prefer that so an oversized request doesn't end pagination early.
+        pagination = (json_response.get("meta") or {}).get("pagination") or {}
+        page_size = pagination.get("page-size") or p["page[size]"]
+        return data, int(page_size)
@@ -9,6 +9,8 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any, cast
 
+from .._jsonapi import loads
+from ..cache import cache_invalidate, cache_put, cached
 from ..models.agent import (
     AgentPool,
     AgentPoolAllowedWorkspacePolicy,
@@ -108,13 +110,19 @@ class AgentPools(_Service):
     """Agent Pools service for managing Terraform Enterprise agent pools."""
 
     def list(
-        self, organization: str, options: AgentPoolListOptions | None = None
+        self,
+        organization: str,
+        options: AgentPoolListOptions | None = None,
+        *,
+        prefetch: bool = False,
     ) -> Iterator[AgentPool]:
         """List agent pools in an organization.
 
         Args:
             organization: Organization name
             options: Optional parameters for filtering and pagination
+            prefetch: Fetch the next page in the background while the current
+                page is being consumed
 
         Returns:
             Iterator of AgentPool objects
@@ -141,7 +149,7 @@ class AgentPools(_Service):
                     options.allowed_workspace_policy.value
                 )
 
-        items_iter = self._list(path, params=params)
+        items_iter = self._list(path, params=params, prefetch=prefetch)
 
         for item in items_iter:
             # Extract agent pool data from API response
@@ -176,6 +184,7 @@ class AgentPools(_Service):
                 agent_count=_safe_int(agent_pool_data["agent_count"]),
             )
 
+    @cache_put("agent_pools")
     def create(self, organization: str, options: AgentPoolCreateOptions) -> AgentPool:
         """Create a new agent pool in an organization.
 
@@ -206,7 +215,7 @@ class AgentPools(_Service):
         payload = {"data": {"type": "agent-pools", "attributes": attributes}}
 
         response = self.t.request("POST", path, json_body=payload)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract agent pool data from response
         attr = data.get("attributes", {}) or {}
@@ -230,6 +239,7 @@ class AgentPools(_Service):
             agent_count=_safe_int(agent_pool_data["agent_count"]),
         )
 
+    @cached("agent_pools")
     def read(
         self, agent_pool_id: str, options: AgentPoolReadOptions | None = None
     ) -> AgentPool:
@@ -260,7 +270,7 @@ class AgentPools(_Service):
         else:
             response = self.t.request("GET", path)
 
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract agent pool data from response
         attr = data.get("attributes", {}) or {}
@@ -290,6 +300,7 @@ class AgentPools(_Service):
             agent_count=_safe_int(agent_pool_data["agent_count"]),
         )
 
+    @cache_invalidate("agent_pools")
     def update(self, agent_pool_id: str, options: AgentPoolUpdateOptions) -> AgentPool:
         """Update an agent pool's properties.
 
@@ -329,7 +340,7 @@ class AgentPools(_Service):
         }
 
         response = self.t.request("PATCH", path, json_body=payload)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract agent pool data from response
         attr = data.get("attributes", {}) or {}
@@ -353,6 +364,7 @@ class AgentPools(_Service):
             agent_count=_safe_int(agent_pool_data["agent_count"]),
         )
 
+    @cache_invalidate("agent_pools")
     def delete(self, agent_pool_id: str) -> None:
         """Delete an agent pool.
 
@@ -9,6 +9,8 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any, cast
 
+from .._jsonapi import loads
+from ..cache import cache_invalidate, cached
 from ..models.agent import (
     Agent,
     AgentListOptions,
@@ -46,13 +48,19 @@ class Agents(_Service):
     """Agents service for managing individual Terraform Enterprise agents."""
 
     def list(
-        self, agent_pool_id: str, options: AgentListOptions | None = None
+        self,
+        agent_pool_id: str,
+        options: AgentListOptions | None = None,
+        *,
+        prefetch: bool = False,
     ) -> Iterator[Agent]:
         """List agents in an agent pool.
 
         Args:
             agent_pool_id: Agent pool ID
             options: Optional parameters for filtering and pagination
+            prefetch: Fetch the next page in the background while the current
+                page is being consumed
 
         Returns:
             Iterator of Agent objects
@@ -75,7 +83,7 @@ class Agents(_Service):
             if options.status:
                 params["filter[status]"] = options.status.value
 
-        items_iter = self._list(path, params=params)
+        items_iter = self._list(path, params=params, prefetch=prefetch)
 
         for item in items_iter:
             # Extract agent data from API response
@@ -108,6 +116,7 @@ class Agents(_Service):
                 ip_address=agent_data["ip_address"],
             )
 
+    @cached("agents")
     def read(self, agent_id: str, options: AgentReadOptions | None = None) -> Agent:
         """Get a specific agent by ID.
 
@@ -136,7 +145,7 @@ class Agents(_Service):
         else:
             response = self.t.request("GET", path)
 
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract agent data from response
         attr = data.get("attributes", {}) or {}
@@ -168,6 +177,7 @@ class Agents(_Service):
             ip_address=agent_data["ip_address"],
         )
 
+    @cache_invalidate("agents")
     def delete(self, agent_id: str) -> None:
         """Delete an agent.
 
@@ -267,7 +277,7 @@ class AgentTokens(_Service):
         payload = {"data": {"type": "authentication-tokens", "attributes": attributes}}
 
         response = self.t.request("POST", path, json_body=payload)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract token data from response
         attr = data.get("attributes", {}) or {}
@@ -307,7 +317,7 @@ class AgentTokens(_Service):
 
         path = f"/api/v2/authentication-tokens/{agent_token_id}"
         response = self.t.request("GET", path)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract token data from response
         attr = data.get("attributes", {}) or {}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .._jsonapi import loads
 from ..errors import InvalidApplyIDError
 from ..models.apply import (
     Apply,
@@ -18,7 +19,7 @@ class Applies(_Service):
             "GET",
             f"/api/v2/applies/{apply_id}",
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
         return Apply(
             id=d.get("id"),
@@ -4,6 +4,7 @@ import io
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     ERR_INVALID_CONFIG_VERSION_ID,
     ERR_INVALID_WORKSPACE_ID,
@@ -21,6 +22,9 @@ from ..models.configuration_version import (
 from ..utils import pack_contents, valid_string_id
 from ._base import _Service
 
+# Size of the reads used to stream file-backed archives to the upload URL
+_UPLOAD_CHUNK_SIZE = 64 * 1024
+
 
 class ConfigurationVersions(_Service):
     """Configuration versions service for managing Terraform configuration versions."""
@@ -79,7 +83,7 @@ class ConfigurationVersions(_Service):
             data["data"]["attributes"]["provisional"] = options.provisional
 
         response = self.t.request("POST", path, json_body=data)
-        response_data = response.json()
+        response_data = loads(response.content)
         return self._parse_configuration_version(response_data["data"])
 
     def create_for_registry_module(
@@ -97,7 +101,7 @@ class ConfigurationVersions(_Service):
         path = f"/api/v2/organizations/{org_name}/registry-modules/{registry_name}/{namespace}/{name}/provider/{provider}/test-runs/configuration-versions"
 
         response = self.t.request("POST", path)
-        response_data = response.json()
+        response_data = loads(response.content)
         return self._parse_configuration_version(response_data["data"])
 
     def read(self, cv_id: str) -> ConfigurationVersion:
@@ -118,7 +122,7 @@ class ConfigurationVersions(_Service):
             params["include"] = ",".join([opt.value for opt in options.include])
 
         response = self.t.request("GET", path, params=params)
-        response_data = response.json()
+        response_data = loads(response.content)
         return self._parse_configuration_version(response_data["data"])
 
     def upload(self, upload_url: str, path: str) -> None:
@@ -129,33 +133,43 @@ class ConfigurationVersions(_Service):
     def upload_tar_gzip(self, upload_url: str, archive: io.IOBase) -> None:
         """Upload a tar gzip archive to the configuration version upload URL."""
         # Get the binary content from the archive
+        current_pos = None
+        content: bytes | Iterator[bytes]
         if hasattr(archive, "getvalue"):
             # BytesIO case
             archive_bytes = archive.getvalue()
+            content = archive_bytes
+            content_length = len(archive_bytes)
         elif hasattr(archive, "read"):
             # File-like object case
             current_pos = archive.tell() if hasattr(archive, "tell") else None
             if current_pos is not None and hasattr(archive, "seek"):
+                # Seekable files are streamed in chunks instead of being read
+                # into memory; their size gives the Content-Length up front
+                content_length = archive.seek(0, io.SEEK_END)
                 archive.seek(0)
-            archive_bytes = archive.read()
-            if current_pos is not None and hasattr(archive, "seek"):
-                archive.seek(current_pos)
+                content = _iter_chunks(archive)
+            else:
+                archive_bytes = archive.read()
+                content = archive_bytes
+                content_length = len(archive_bytes)
         else:
             raise ValueError(
                 "Archive must be a file-like object with read() or getvalue() method"
             )
 
         # Use the transport layer's underlying httpx client for binary upload
-        # This is a foreign PUT request to the upload URL that requires binary content
+        # This is a foreign PUT request to the upload URL that requires binary content.
+        # The explicit Content-Length keeps httpx from using chunked encoding.
         headers = {
             "Content-Type": "application/octet-stream",
-            "Content-Length": str(len(archive_bytes)),
+            "Content-Length": str(content_length),
         }
 
         try:
             response = self.t._sync.put(
                 upload_url,
-                content=archive_bytes,
+                content=content,
                 headers=headers,
                 follow_redirects=True,
             )
@@ -177,6 +191,9 @@ class ConfigurationVersions(_Service):
             if isinstance(e, NotFound | AuthError | ServerError | TFEError):
                 raise
             raise TFEError(f"Upload failed: {str(e)}") from e
+        finally:
+            if current_pos is not None and hasattr(archive, "seek"):
+                archive.seek(current_pos)
 
     def archive(self, cv_id: str) -> None:
         """Archive a configuration version."""
@@ -250,3 +267,8 @@ class ConfigurationVersions(_Service):
         }
 
         return ConfigurationVersion(**cv_data)
+
+
+def _iter_chunks(f: Any) -> Iterator[bytes]:
+    while chunk := f.read(_UPLOAD_CHUNK_SIZE):
+        yield chunk
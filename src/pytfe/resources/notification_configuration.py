@@ -8,6 +8,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from .._jsonapi import loads
+from ..cache import cache_invalidate, cache_put, cached
 from ..errors import (
     InvalidOrgError,
     ValidationError,
@@ -44,7 +46,7 @@ class NotificationConfigurations(_Service):
         params = options.to_dict() if options else None
 
         r = self.t.request("GET", url, params=params)
-        jd = r.json()
+        jd = loads(r.content)
 
         items = []
         meta = jd.get("meta", {})
@@ -60,6 +62,7 @@ class NotificationConfigurations(_Service):
             }
         )
 
+    @cache_put("notification_configurations")
     def create(
         self, subscribable_id: str, options: NotificationConfigurationCreateOptions
     ) -> NotificationConfiguration:
@@ -84,7 +87,7 @@ class NotificationConfigurations(_Service):
 
         try:
             r = self.t.request("POST", url, json_body=payload)
-            jd = r.json()
+            jd = loads(r.content)
 
             if "data" in jd:
                 return self._parse_notification_configuration(jd["data"])
@@ -109,6 +112,7 @@ class NotificationConfigurations(_Service):
             else:
                 raise
 
+    @cached("notification_configurations")
     def read(self, notification_config_id: str) -> NotificationConfiguration:
         """Read a notification configuration by its ID."""
         if not valid_string_id(notification_config_id):
@@ -118,7 +122,7 @@ class NotificationConfigurations(_Service):
 
         try:
             r = self.t.request("GET", url)
-            jd = r.json()
+            jd = loads(r.content)
 
             if "data" in jd:
                 return self._parse_notification_configuration(jd["data"])
@@ -133,6 +137,7 @@ class NotificationConfigurations(_Service):
             else:
                 raise
 
+    @cache_invalidate("notification_configurations")
     def update(
         self,
         notification_config_id: str,
@@ -153,13 +158,14 @@ class NotificationConfigurations(_Service):
         payload["data"]["id"] = notification_config_id
 
         r = self.t.request("PATCH", url, json_body=payload)
-        jd = r.json()
+        jd = loads(r.content)
 
         if "data" in jd:
             return self._parse_notification_configuration(jd["data"])
 
         raise ValidationError("Invalid response format from API")
 
+    @cache_invalidate("notification_configurations")
     def delete(self, notification_config_id: str) -> None:
         """Delete a notification configuration by its ID."""
         if not valid_string_id(notification_config_id):
@@ -177,7 +183,7 @@ class NotificationConfigurations(_Service):
 
         try:
             r = self.t.request("POST", url, json_body={})
-            jd = r.json()
+            jd = loads(r.content)
 
             if "data" in jd:
                 return self._parse_notification_configuration(jd["data"])
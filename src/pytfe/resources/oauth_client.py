@@ -4,7 +4,9 @@ from collections.abc import Iterator
 from typing import Any
 from urllib.parse import quote
 
-from ..errors import ERR_INVALID_OAUTH_CLIENT_ID, ERR_INVALID_ORG
+from .._jsonapi import loads
+from ..cache import cache_invalidate, cached
+from ..errors import ERR_INVALID_OAUTH_CLIENT_ID, ERR_INVALID_ORG, NotFound
 from ..models.oauth_client import (
     OAuthClient,
     OAuthClientAddProjectsOptions,
@@ -22,6 +24,21 @@ from ..utils import (
 )
 from ._base import _Service
 
+# Most projects sent in one relationships request; longer lists are split
+_PROJECTS_BATCH_SIZE = 100
+
+
+def _project_batches(projects: list[dict]) -> Iterator[list[dict]]:
+    for start in range(0, len(projects), _PROJECTS_BATCH_SIZE):
+        yield projects[start : start + _PROJECTS_BATCH_SIZE]
+
+
+def _include_key(options: OAuthClientReadOptions | None = None) -> frozenset[str]:
+    """Related resources a read includes, which decide the response shape."""
+    if options is None or not options.include:
+        return frozenset()
+    return frozenset(opt.value for opt in options.include)
+
 
 class OAuthClients(_Service):
     """OAuth clients service for managing VCS provider connections."""
@@ -76,7 +93,7 @@ class OAuthClients(_Service):
 
         path = f"/api/v2/organizations/{quote(organization)}/oauth-clients"
         response = self.t.request("POST", path, json_body=body)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_oauth_client(data)
 
@@ -84,6 +101,7 @@ class OAuthClients(_Service):
         """Read an OAuth client by its ID."""
         return self.read_with_options(oauth_client_id, None)
 
+    @cached("oauth_clients", variant=_include_key)
     def read_with_options(
         self, oauth_client_id: str, options: OAuthClientReadOptions | None
     ) -> OAuthClient:
@@ -98,10 +116,23 @@ class OAuthClients(_Service):
             params["include"] = ",".join([opt.value for opt in options.include])
 
         response = self.t.request("GET", path, params=params)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_oauth_client(data)
 
+    def exists(self, oauth_client_id: str) -> bool:
+        """Check whether an OAuth client exists without fetching its body."""
+        if not valid_string_id(oauth_client_id):
+            raise ValueError(ERR_INVALID_OAUTH_CLIENT_ID)
+
+        path = f"/api/v2/oauth-clients/{quote(oauth_client_id)}"
+        try:
+            self.t.request("HEAD", path)
+        except NotFound:
+            return False
+        return True
+
+    @cache_invalidate("oauth_clients")
     def update(
         self, oauth_client_id: str, options: OAuthClientUpdateOptions
     ) -> OAuthClient:
@@ -122,10 +153,11 @@ class OAuthClients(_Service):
 
         path = f"/api/v2/oauth-clients/{quote(oauth_client_id)}"
         response = self.t.request("PATCH", path, json_body=body)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_oauth_client(data)
 
+    @cache_invalidate("oauth_clients")
     def delete(self, oauth_client_id: str) -> None:
         """Delete an OAuth client by its ID."""
         if not valid_string_id(oauth_client_id):
@@ -134,6 +166,7 @@ class OAuthClients(_Service):
         path = f"/api/v2/oauth-clients/{quote(oauth_client_id)}"
         self.t.request("DELETE", path)
 
+    @cache_invalidate("oauth_clients")
     def add_projects(
         self, oauth_client_id: str, options: OAuthClientAddProjectsOptions
     ) -> None:
@@ -144,8 +177,10 @@ class OAuthClients(_Service):
         validate_oauth_client_add_projects_options(options)
 
         path = f"/api/v2/oauth-clients/{quote(oauth_client_id)}/relationships/projects"
-        self.t.request("POST", path, json_body={"data": options.projects})
+        for batch in _project_batches(options.projects):
+            self.t.request("POST", path, json_body={"data": batch})
 
+    @cache_invalidate("oauth_clients")
     def remove_projects(
         self, oauth_client_id: str, options: OAuthClientRemoveProjectsOptions
     ) -> None:
@@ -156,7 +191,8 @@ class OAuthClients(_Service):
         validate_oauth_client_remove_projects_options(options)
 
         path = f"/api/v2/oauth-clients/{quote(oauth_client_id)}/relationships/projects"
-        self.t.request("DELETE", path, json_body={"data": options.projects})
+        for batch in _project_batches(options.projects):
+            self.t.request("DELETE", path, json_body={"data": batch})
 
     def _parse_oauth_client(self, data: dict[str, Any]) -> OAuthClient:
         """Parse OAuth client data from API response."""
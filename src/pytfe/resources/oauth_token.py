@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Any
 from urllib.parse import quote
 
+from .._jsonapi import loads
 from ..errors import ERR_INVALID_OAUTH_TOKEN_ID, ERR_INVALID_ORG
 from ..models.oauth_token import (
     OAuthToken,
@@ -42,7 +43,7 @@ class OAuthTokens(_Service):
 
         path = f"/api/v2/oauth-tokens/{quote(oauth_token_id)}"
         response = self.t.request("GET", path)
-        data = response.json()
+        data = loads(response.content)
 
         if "data" in data:
             return self._parse_oauth_token(data["data"])
@@ -68,7 +69,7 @@ class OAuthTokens(_Service):
 
         path = f"/api/v2/oauth-tokens/{quote(oauth_token_id)}"
         response = self.t.request("PATCH", path, json_body=body)
-        data = response.json()
+        data = loads(response.content)
 
         if "data" in data:
             return self._parse_oauth_token(data["data"])
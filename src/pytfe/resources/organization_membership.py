@@ -4,6 +4,7 @@ import re
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import ERR_INVALID_EMAIL, ERR_INVALID_ORG
 from ..models.organization import Organization
 from ..models.organization_membership import (
@@ -36,6 +37,21 @@ def _validate_email_params(emails: list[str] | None) -> None:
             raise ValueError(ERR_INVALID_EMAIL)
 
 
+def _options_params(
+    options: OrganizationMembershipListOptions | OrganizationMembershipReadOptions,
+) -> dict[str, Any]:
+    """Serialize options to query parameters in a single model_dump pass.
+
+    ``mode="json"`` lets pydantic-core emit enum values directly, so only
+    list values (includes, email filters) need joining afterwards.
+    """
+    params = options.model_dump(mode="json", by_alias=True, exclude_none=True)
+    for key, value in params.items():
+        if isinstance(value, list):
+            params[key] = ",".join(value)
+    return params
+
+
 class OrganizationMemberships(_Service):
     """Organization memberships service for managing organization members."""
 
@@ -90,7 +106,7 @@ class OrganizationMemberships(_Service):
 
         # Make the POST request
         response = self.t.request("POST", path, json_body=body)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_membership(data["data"])
 
@@ -98,12 +114,16 @@ class OrganizationMemberships(_Service):
         self,
         organization: str,
         options: OrganizationMembershipListOptions | None = None,
+        *,
+        prefetch: bool = False,
     ) -> Iterator[OrganizationMembership]:
         """List all the organization memberships of the given organization.
 
         Args:
             organization: The name of the organization
             options: Optional filters and pagination options
+            prefetch: Fetch the next page in the background while the current
+                page is being consumed
 
         Yields:
             OrganizationMembership instances one at a time
@@ -124,31 +144,10 @@ class OrganizationMemberships(_Service):
         # Build query parameters from options
         params: dict[str, Any] = {}
         if options:
-            options_dict = options.model_dump(by_alias=True, exclude_none=True)
-
-            # Handle include parameter - convert list to comma-separated string
-            if "include" in options_dict and isinstance(options_dict["include"], list):
-                options_dict["include"] = ",".join(
-                    opt.value if hasattr(opt, "value") else str(opt)
-                    for opt in options.include or []
-                )
-
-            # Handle emails filter - convert list to comma-separated string
-            if "filter[email]" in options_dict and isinstance(
-                options_dict["filter[email]"], list
-            ):
-                options_dict["filter[email]"] = ",".join(options_dict["filter[email]"])
-
-            # Handle status filter - extract value from enum
-            if "filter[status]" in options_dict:
-                status_value = options_dict["filter[status]"]
-                if hasattr(status_value, "value"):
-                    options_dict["filter[status]"] = status_value.value
-
-            params.update(options_dict)
+            params.update(_options_params(options))
 
         # Use the _list helper for automatic pagination
-        for item in self._list(path, params=params):
+        for item in self._list(path, params=params, prefetch=prefetch):
             yield self._parse_membership(item)
 
     def read(self, organization_membership_id: str) -> OrganizationMembership:
@@ -195,21 +194,12 @@ class OrganizationMemberships(_Service):
         # Build query parameters from options
         params: dict[str, Any] = {}
         if options:
-            options_dict = options.model_dump(by_alias=True, exclude_none=True)
-
-            # Handle include parameter - convert list to comma-separated string
-            if "include" in options_dict and isinstance(options_dict["include"], list):
-                options_dict["include"] = ",".join(
-                    opt.value if hasattr(opt, "value") else str(opt)
-                    for opt in options.include or []
-                )
-
-            params.update(options_dict)
+            params.update(_options_params(options))
 
         # Make the GET request
         # NotFound exception will be raised by self.t.request if resource doesn't exist
         response = self.t.request("GET", path, params=params)
-        data = response.json()
+        data = loads(response.content)
         return self._parse_membership(data["data"])
 
     def delete(self, organization_membership_id: str) -> None:
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 from collections.abc import Iterator
-from typing import Any
+from typing import Any, cast
 
+from .._jsonapi import loads
+from ..cache import cache_invalidate, cached
 from ..errors import (
     ERR_INVALID_NAME,
     ERR_INVALID_ORG,
@@ -36,12 +38,17 @@ def _safe_str(v: Any, default: str = "") -> str:
 
 
 class Organizations(_Service):
+    @cache_invalidate("organization_etags")
+    @cache_invalidate("organization_capacity")
+    @cache_invalidate("organization_entitlements")
     def delete(self, name: str) -> None:
         if not valid_string_id(name):
             raise ValueError(ERR_INVALID_ORG)
         self.t.request("DELETE", f"/api/v2/organizations/{name}")
         return None
 
+    @cache_invalidate("organization_etags")
+    @cache_invalidate("organization_entitlements")
     def update(self, name: str, options: OrganizationUpdateOptions) -> Organization:
         if not valid_string_id(name):
             raise ValueError(ERR_INVALID_ORG)
@@ -52,7 +59,7 @@ class Organizations(_Service):
             }
         }
         r = self.t.request("PATCH", f"/api/v2/organizations/{name}", json_body=body)
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
         org_id = _safe_str(d.get("id"))
         org_data = dict(attr)
@@ -68,7 +75,7 @@ class Organizations(_Service):
             }
         }
         r = self.t.request("POST", "/api/v2/organizations", json_body=body)
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
         org_id = _safe_str(d.get("id"))
         org_data = dict(attr)
@@ -85,14 +92,29 @@ class Organizations(_Service):
             yield Organization(**org_data)
 
     def read(self, name: str) -> Organization:
-        r = self.t.request("GET", f"/api/v2/organizations/{name}")
-        d = r.json()["data"]
+        path = f"/api/v2/organizations/{name}"
+        # With caching enabled, the last ETag and organization seen per name
+        # are kept in the service cache and used to revalidate reads
+        key = ("organization_etags", name)
+        known = self._cache.get(key) if self._cache is not None else None
+        if known is None:
+            r = self.t.request("GET", path)
+        else:
+            # Revalidate the last copy; a 304 carries no body to transfer
+            etag, org = cast(tuple[str, Organization], known)
+            r = self.t.request("GET", path, headers={"If-None-Match": etag})
+            if r.status_code == 304:
+                return org
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
         org_id = _safe_str(d.get("id"))
         # Unpack all attributes, override id
         org_data = dict(attr)
         org_data["id"] = org_id
-        return Organization(**org_data)
+        org = Organization(**org_data)
+        if self._cache is not None and (etag := r.headers.get("ETag")):
+            self._cache.set(key, (etag, org))
+        return org
 
     @staticmethod
     def validate(opts: OrganizationCreateOptions) -> None:
@@ -104,13 +126,14 @@ class Organizations(_Service):
         if not valid_string(opts.email):
             raise ValueError(ERR_REQUIRED_EMAIL)
 
+    @cached("organization_capacity")
     def read_capacity(self, organization: str) -> Capacity:
         """Read the currently used capacity of an organization."""
         if not valid_string_id(organization):
             raise ValueError(ERR_INVALID_ORG)
 
         r = self.t.request("GET", f"/api/v2/organizations/{organization}/capacity")
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         c = Capacity(
@@ -120,6 +143,7 @@ class Organizations(_Service):
         )
         return c
 
+    @cached("organization_entitlements")
     def read_entitlements(self, organization: str) -> Entitlements:
         """Read the entitlements of an organization."""
         if not valid_string_id(organization):
@@ -128,7 +152,7 @@ class Organizations(_Service):
         r = self.t.request(
             "GET", f"/api/v2/organizations/{organization}/entitlement-set"
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         e = Entitlements(
@@ -167,7 +191,7 @@ class Organizations(_Service):
         r = self.t.request(
             "GET", f"/api/v2/organizations/{organization}/runs/queue", params=params
         )
-        data = r.json()
+        data = loads(r.content)
 
         from ..models.organization import Pagination, Run, RunStatus
 
@@ -222,7 +246,7 @@ class Organizations(_Service):
                 "GET",
                 f"/api/v2/organizations/{organization}/relationships/data-retention-policy",
             )
-            d = r.json()["data"]
+            d = loads(r.content)["data"]
 
             choice = DataRetentionPolicyChoice()
 
@@ -281,7 +305,7 @@ class Organizations(_Service):
             f"/api/v2/organizations/{organization}/relationships/data-retention-policy",
             json_body=body,
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         drp = DataRetentionPolicy(
@@ -314,7 +338,7 @@ class Organizations(_Service):
             f"/api/v2/organizations/{organization}/relationships/data-retention-policy",
             json_body=body,
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         drp = DataRetentionPolicyDeleteOlder(
@@ -342,7 +366,7 @@ class Organizations(_Service):
             f"/api/v2/organizations/{organization}/relationships/data-retention-policy",
             json_body=body,
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
 
         drp = DataRetentionPolicyDontDelete(id=_safe_str(d.get("id")))
         return drp
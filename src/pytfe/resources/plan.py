@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import InvalidPlanIDError
 from ..models.plan import (
     Plan,
@@ -21,7 +23,7 @@ class Plans(_Service):
             "GET",
             f"/api/v2/plans/{plan_id}",
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
         return Plan(
             id=d.get("id"),
@@ -67,7 +69,7 @@ class Plans(_Service):
 
         # Return the raw JSON data - this endpoint returns JSON directly
         # not wrapped in a JSON:API format
-        json_data = r.json()
+        json_data = loads(r.content)
         # Ensure we return a dictionary, not Any
         if isinstance(json_data, dict):
             return json_data
@@ -75,6 +77,17 @@ class Plans(_Service):
             # If somehow the response isn't a dict, wrap it
             return {"data": json_data}
 
+    def stream_json_output(self, plan_id: str) -> Iterator[bytes]:
+        """Stream the JSON execution plan for a plan as raw bytes.
+
+        Unlike :meth:`read_json_output` the document is neither buffered
+        nor parsed, so large plans can be written straight to a file.
+        """
+        if not valid_string_id(plan_id):
+            raise InvalidPlanIDError()
+
+        return self.t.stream("GET", f"/api/v2/plans/{plan_id}/json-output")
+
     def _done(self, plan_id: str) -> bool:
         """Create a done function for plan log reading."""
         plan = self.read(plan_id)
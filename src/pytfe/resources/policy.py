@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidNameError,
     InvalidOrgError,
@@ -34,7 +35,7 @@ class Policies(_Service):
             f"/api/v2/organizations/{organization}/policies",
             params=params,
         )
-        jd = r.json()
+        jd = loads(r.content)
         items = []
         meta = jd.get("meta", {})
         pagination = meta.get("pagination", {})
@@ -70,7 +71,7 @@ class Policies(_Service):
             f"/api/v2/organizations/{organization}/policies",
             json_body=payload,
         )
-        jd = r.json()
+        jd = loads(r.content)
         d = jd.get("data", {})
         attrs = d.get("attributes", {})
         attrs["id"] = d.get("id")
@@ -84,7 +85,7 @@ class Policies(_Service):
             "GET",
             f"/api/v2/policies/{policy_id}",
         )
-        jd = r.json()
+        jd = loads(r.content)
         d = jd.get("data", {})
         attrs = d.get("attributes", {})
         attrs["id"] = d.get("id")
@@ -106,7 +107,7 @@ class Policies(_Service):
             f"/api/v2/policies/{policy_id}",
             json_body=payload,
         )
-        jd = r.json()
+        jd = loads(r.content)
         d = jd.get("data", {})
         attrs = d.get("attributes", {})
         attrs["id"] = d.get("id")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import time
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidPolicyCheckIDError,
     InvalidRunIDError,
@@ -36,7 +37,7 @@ class PolicyChecks(_Service):
             f"/api/v2/runs/{run_id}/policy-checks",
             params=params,
         )
-        jd = r.json()
+        jd = loads(r.content)
         items = []
         meta = jd.get("meta", {})
         pagination = meta.get("pagination", {})
@@ -62,7 +63,7 @@ class PolicyChecks(_Service):
             "GET",
             f"/api/v2/policy-checks/{policy_check_id}",
         )
-        jd = r.json()
+        jd = loads(r.content)
         d = jd.get("data", {})
         attrs = d.get("attributes", {})
         attrs["id"] = d.get("id")
@@ -77,7 +78,7 @@ class PolicyChecks(_Service):
             "POST",
             f"/api/v2/policy-checks/{policy_check_id}/actions/override",
         )
-        jd = r.json()
+        jd = loads(r.content)
         d = jd.get("data", {})
         attrs = d.get("attributes", {})
         attrs["id"] = d.get("id")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidNameError,
     InvalidOrgError,
@@ -48,7 +49,7 @@ class PolicySets(_Service):
             f"/api/v2/organizations/{organization}/policy-sets",
             params=params,
         )
-        jd = r.json()
+        jd = loads(r.content)
         items = []
         meta = jd.get("meta", {})
         pagination = meta.get("pagination", {})
@@ -134,7 +135,7 @@ class PolicySets(_Service):
             f"/api/v2/organizations/{organization}/policy-sets",
             json_body=payload,
         )
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
         attrs = data.get("attributes", {})
         attrs["id"] = data.get("id")
@@ -171,7 +172,7 @@ class PolicySets(_Service):
             f"/api/v2/policy-sets/{policy_set_id}",
             params=params,
         )
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
         attrs = data.get("attributes", {})
         attrs["id"] = data.get("id")
@@ -210,7 +211,7 @@ class PolicySets(_Service):
             f"/api/v2/policy-sets/{policy_set_id}",
             json_body=payload,
         )
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
         attrs = data.get("attributes", {})
         attrs["id"] = data.get("id")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidPolicyEvaluationIDError,
     InvalidPolicySetOutcomeIDError,
@@ -63,7 +64,7 @@ class PolicySetOutcomes(_Service):
             raise InvalidPolicySetOutcomeIDError()
         path = f"api/v2/policy-set-outcomes/{policy_set_outcome_id}"
         r = self.t.request("GET", path)
-        data = r.json().get("data", {})
+        data = loads(r.content).get("data", {})
         return PolicySetOutcome.model_validate(data)
 
     def _policy_set_outcome_from(self, d: dict[str, Any]) -> PolicySetOutcome:
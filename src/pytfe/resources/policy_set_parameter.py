@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidCategoryError,
     InvalidParamIDError,
@@ -65,7 +66,7 @@ class PolicySetParameters(_Service):
             path=f"api/v2/policy-sets/{policy_set_id}/parameters",
             json_body=payload,
         )
-        data = r.json().get("data", {})
+        data = loads(r.content).get("data", {})
         return self._policy_set_parameter_from(data)
 
     def read(self, policy_set_id: str, parameter_id: str) -> PolicySetParameter:
@@ -80,7 +81,7 @@ class PolicySetParameters(_Service):
             "GET",
             path=f"api/v2/policy-sets/{policy_set_id}/parameters/{parameter_id}",
         )
-        data = r.json().get("data", {})
+        data = loads(r.content).get("data", {})
         return self._policy_set_parameter_from(data)
 
     def update(
@@ -108,7 +109,7 @@ class PolicySetParameters(_Service):
             path=f"api/v2/policy-sets/{policy_set_id}/parameters/{parameter_id}",
             json_body=payload,
         )
-        data = r.json().get("data", {})
+        data = loads(r.content).get("data", {})
         return self._policy_set_parameter_from(data)
 
     def delete(self, policy_set_id: str, parameter_id: str) -> None:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidPolicySetIDError,
 )
@@ -24,7 +25,7 @@ class PolicySetVersions(_Service):
             "POST",
             f"/api/v2/policy-sets/{policy_set_id}/versions",
         )
-        jd = r.json()
+        jd = loads(r.content)
         attrs = jd.get("data", {}).get("attributes", {})
         attrs["id"] = jd.get("data", {}).get("id")
         attrs["links"] = jd.get("data", {}).get("links", {})
@@ -44,7 +45,7 @@ class PolicySetVersions(_Service):
             "GET",
             f"/api/v2/policy-set-versions/{policy_set_version_id}",
         )
-        jd = r.json()
+        jd = loads(r.content)
         attrs = jd.get("data", {}).get("attributes", {})
         attrs["id"] = jd.get("data", {}).get("id")
         attrs["links"] = jd.get("data", {}).get("links", {})
@@ -5,6 +5,7 @@ import re
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..models.common import (
     EffectiveTagBinding,
     TagBinding,
@@ -158,7 +159,7 @@ class Projects(_Service):
         payload = {"data": {"type": "projects", "attributes": attributes}}
 
         response = self.t.request("POST", path, json_body=payload)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract project data
         attr = data.get("attributes", {}) or {}
@@ -194,7 +195,7 @@ class Projects(_Service):
         else:
             response = self.t.request("GET", path)
 
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract organization from relationships
         relationships = data.get("relationships", {})
@@ -235,7 +236,7 @@ class Projects(_Service):
         }
 
         response = self.t.request("PATCH", path, json_body=payload)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Extract organization from relationships
         relationships = data.get("relationships", {})
@@ -275,7 +276,7 @@ class Projects(_Service):
 
         path = f"/api/v2/projects/{project_id}/tag-bindings"
         response = self.t.request("GET", path)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         tag_bindings = []
         for item in data:
@@ -299,7 +300,7 @@ class Projects(_Service):
 
         path = f"/api/v2/projects/{project_id}/tag-bindings/effective"
         response = self.t.request("GET", path)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         effective_tag_bindings = []
         for item in data:
@@ -353,7 +354,7 @@ class Projects(_Service):
 
         # Use PATCH method as per API documentation
         response = self.t.request("PATCH", path, json_body=payload)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Parse response into TagBinding objects
         tag_bindings = []
@@ -4,6 +4,7 @@ import io
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidQueryRunIDError,
     InvalidWorkspaceIDError,
@@ -88,7 +89,7 @@ class QueryRuns(_Service):
             json_body=body,
         )
 
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
         attrs = data.get("attributes", {})
         attrs["id"] = data.get("id")
@@ -102,7 +103,7 @@ class QueryRuns(_Service):
 
         r = self.t.request("GET", f"/api/v2/queries/{query_run_id}")
 
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
         attrs = data.get("attributes", {})
         attrs["id"] = data.get("id")
@@ -123,7 +124,7 @@ class QueryRuns(_Service):
 
         r = self.t.request("GET", f"/api/v2/queries/{query_run_id}", params=params)
 
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
         attrs = data.get("attributes", {})
         attrs["id"] = data.get("id")
@@ -4,6 +4,7 @@ import io
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     ERR_INVALID_NAME,
     ERR_INVALID_ORG,
@@ -78,7 +79,7 @@ class RegistryModules(_Service):
         path = f"/api/v2/registry-modules/{module_id.organization}/{module_id.name}/{module_id.provider}/commits"
 
         response = self.t.request("GET", path)
-        data = response.json()
+        data = loads(response.content)
 
         commits = []
         if "data" in data:
@@ -106,7 +107,7 @@ class RegistryModules(_Service):
 
         path = f"/api/v2/organizations/{organization}/registry-modules"
         response = self.t.request("POST", path, json_body=body)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_registry_module(data)
 
@@ -129,7 +130,7 @@ class RegistryModules(_Service):
 
         path = f"/api/v2/registry-modules/{module_id.organization}/{module_id.name}/{module_id.provider}/versions"
         response = self.t.request("POST", path, json_body=body)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_registry_module_version(data)
 
@@ -166,7 +167,7 @@ class RegistryModules(_Service):
             raise ValueError("Agent pool not required for remote execution")
 
         response = self.t.request("POST", path, json_body=body)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_registry_module(data)
 
@@ -188,7 +189,7 @@ class RegistryModules(_Service):
             )
 
         response = self.t.request("GET", path)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_registry_module(data)
 
@@ -210,7 +211,7 @@ class RegistryModules(_Service):
         )
 
         response = self.t.request("GET", path)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_registry_module_version(data)
 
@@ -233,7 +234,7 @@ class RegistryModules(_Service):
                 )
 
             response = self.t.request("GET", path)
-            response_data = response.json()
+            response_data = loads(response.content)
 
             # Handle the case where data might be None or empty
             data = response_data.get("data", []) if response_data else []
@@ -287,7 +288,7 @@ class RegistryModules(_Service):
             )
 
         response = self.t.request("GET", path)
-        data = response.json()
+        data = loads(response.content)
 
         return TerraformRegistryModule(**data)
 
@@ -367,7 +368,7 @@ class RegistryModules(_Service):
         )
 
         response = self.t.request("PATCH", path, json_body=body)
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         return self._parse_registry_module(data)
 
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     ERR_INVALID_ORG,
 )
@@ -76,7 +77,7 @@ class RegistryProviders(_Service):
         }
 
         response = self.t.request("POST", path, json_body=data)
-        response_data = response.json()
+        response_data = loads(response.content)
         return self._parse_registry_provider(response_data["data"])
 
     def read(
@@ -99,7 +100,7 @@ class RegistryProviders(_Service):
             params["include"] = ",".join([opt.value for opt in options.include])
 
         response = self.t.request("GET", path, params=params)
-        response_data = response.json()
+        response_data = loads(response.content)
         return self._parse_registry_provider(response_data["data"])
 
     def delete(self, provider_id: RegistryProviderID) -> None:
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     RequiredPrivateRegistryError,
 )
@@ -47,7 +48,7 @@ class RegistryProviderVersions(_Service):
             path=path,
             json_body=payload,
         )
-        data = r.json().get("data", {})
+        data = loads(r.content).get("data", {})
         return self._registry_provider_version_from(data)
 
     def _validate_provider_id(self, provider_id: RegistryProviderID) -> bool:
@@ -108,7 +109,7 @@ class RegistryProviderVersions(_Service):
             "GET",
             path=path,
         )
-        data = r.json().get("data", {})
+        data = loads(r.content).get("data", {})
         return self._registry_provider_version_from(data)
 
     def delete(self, version_id: RegistryProviderVersionID) -> None:
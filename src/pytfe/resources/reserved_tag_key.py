@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidOrgError,
     ValidationError,
@@ -55,7 +56,7 @@ class ReservedTagKeys(_Service):
             json_body=body,
         )
 
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
 
         return self._parse_reserved_tag_key(data)
@@ -81,7 +82,7 @@ class ReservedTagKeys(_Service):
             json_body=body,
         )
 
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
 
         return self._parse_reserved_tag_key(data)
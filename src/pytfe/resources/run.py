@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidOrgError,
     InvalidRunIDError,
@@ -39,7 +40,7 @@ class Runs(_Service):
             f"/api/v2/workspaces/{workspace_id}/runs",
             params=params,
         )
-        jd = r.json()
+        jd = loads(r.content)
         items = []
         meta = jd.get("meta", {})
         pagination = meta.get("pagination", {})
@@ -70,7 +71,7 @@ class Runs(_Service):
             f"/api/v2/organizations/{organization}/runs",
             params=params,
         )
-        jd = r.json()
+        jd = loads(r.content)
         items = []
         meta = jd.get("meta", {})
         pagination = meta.get("pagination", {})
@@ -123,7 +124,7 @@ class Runs(_Service):
             "/api/v2/runs",
             json_body=body,
         )
-        d = r.json().get("data", {})
+        d = loads(r.content).get("data", {})
         attrs = d.get("attributes", {})
         return Run(
             id=_safe_str(d.get("id")),
@@ -148,7 +149,7 @@ class Runs(_Service):
             f"/api/v2/runs/{run_id}",
             params=params,
         )
-        d = r.json().get("data", {})
+        d = loads(r.content).get("data", {})
         attrs = d.get("attributes", {})
         return Run(
             id=_safe_str(d.get("id")),
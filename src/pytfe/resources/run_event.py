@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import InvalidRunEventIDError, InvalidRunIDError
 from ..models.run_event import (
     RunEvent,
@@ -28,7 +29,7 @@ class RunEvents(_Service):
             f"/api/v2/runs/{run_id}/run-events",
             params=params,
         )
-        jd = r.json()
+        jd = loads(r.content)
         items = []
         meta = jd.get("meta", {})
         pagination = meta.get("pagination", {})
@@ -63,7 +64,7 @@ class RunEvents(_Service):
             f"/api/v2/run-events/{run_event_id}",
             params=params,
         )
-        d = r.json().get("data", {})
+        d = loads(r.content).get("data", {})
         attr = d.get("attributes", {}) or {}
         return RunEvent(
             id=d.get("id"),
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidOrgError,
     InvalidRunTaskCategoryError,
@@ -188,7 +189,7 @@ class RunTasks(_Service):
             f"/api/v2/organizations/{organization_id}/tasks",
             json_body=body,
         )
-        return _run_task_from(r.json()["data"], organization_id)
+        return _run_task_from(loads(r.content)["data"], organization_id)
 
     def read(self, run_task_id: str) -> RunTask:
         return self.read_with_options(run_task_id)
@@ -204,7 +205,7 @@ class RunTasks(_Service):
 
         path = f"/api/v2/tasks/{run_task_id}"
         r = self.t.request("GET", path, params=params)
-        return _run_task_from(r.json()["data"])
+        return _run_task_from(loads(r.content)["data"])
 
     def update(self, run_task_id: str, options: RunTaskUpdateOptions) -> RunTask:
         if not valid_string_id(run_task_id):
@@ -253,7 +254,7 @@ class RunTasks(_Service):
             f"/api/v2/tasks/{run_task_id}",
             json_body=body,
         )
-        return _run_task_from(r.json()["data"])
+        return _run_task_from(loads(r.content)["data"])
 
     def delete(self, run_task_id: str) -> None:
         if not valid_string_id(run_task_id):
@@ -5,6 +5,7 @@ from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidRunTriggerIDError,
     InvalidRunTriggerTypeError,
@@ -124,7 +125,7 @@ class RunTriggers(_Service):
             f"/api/v2/workspaces/{workspace_id}/run-triggers",
             json_body=body,
         )
-        rt = _run_trigger_from(r.json()["data"])
+        rt = _run_trigger_from(loads(r.content)["data"])
         self.backfill_deprecated_sourceable(rt)
         return rt
 
@@ -133,7 +134,7 @@ class RunTriggers(_Service):
             raise InvalidRunTriggerIDError()
         path = f"/api/v2/run-triggers/{run_trigger_id}"
         r = self.t.request("GET", path)
-        rt = _run_trigger_from(r.json()["data"])
+        rt = _run_trigger_from(loads(r.content)["data"])
         self.backfill_deprecated_sourceable(rt)
         return rt
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidOrgError,
     InvalidSSHKeyIDError,
@@ -37,7 +38,7 @@ class SSHKeys(_Service):
             params=params,
         )
 
-        jd = r.json()
+        jd = loads(r.content)
         items = []
         meta = jd.get("meta", {})
         pagination = meta.get("pagination", {})
@@ -73,7 +74,7 @@ class SSHKeys(_Service):
             json_body=body,
         )
 
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
 
         return self._parse_ssh_key(data)
@@ -85,7 +86,7 @@ class SSHKeys(_Service):
 
         r = self.t.request("GET", f"/api/v2/ssh-keys/{ssh_key_id}")
 
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
 
         return self._parse_ssh_key(data)
@@ -109,7 +110,7 @@ class SSHKeys(_Service):
             json_body=body,
         )
 
-        jd = r.json()
+        jd = loads(r.content)
         data = jd.get("data", {})
 
         return self._parse_ssh_key(data)
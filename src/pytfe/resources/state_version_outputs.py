@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from .._jsonapi import loads
 from ..models.state_version_output import (
     StateVersionOutput,
     StateVersionOutputsList,
@@ -30,7 +31,7 @@ class StateVersionOutputs(_Service):
             raise ValueError("invalid output id")
 
         r = self.t.request("GET", f"/api/v2/state-version-outputs/{output_id}")
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         return StateVersionOutput(
@@ -62,7 +63,7 @@ class StateVersionOutputs(_Service):
             f"/api/v2/workspaces/{workspace_id}/current-state-version-outputs",
             params=params,
         )
-        data = r.json()
+        data = loads(r.content)
 
         items: list[StateVersionOutput] = []
         for item in data.get("data", []):
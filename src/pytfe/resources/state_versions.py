@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any
 from urllib.parse import urlencode
 
+from .._jsonapi import loads
 from ..errors import NotFound
 
 # Pydantic models for this feature
@@ -52,7 +53,7 @@ class StateVersions(_Service):
         r = self.t.request(
             "GET", f"/api/v2/organizations/{organization}/workspaces/{workspace}"
         )
-        data = r.json().get("data") or {}
+        data = loads(r.content).get("data") or {}
         ws_id = _safe_str(data.get("id"))
         if not ws_id:
             raise NotFound(f"workspace '{workspace}' not found in org '{organization}'")
@@ -77,7 +78,7 @@ class StateVersions(_Service):
         params = options.model_dump(by_alias=True, exclude_none=True) if options else {}
         path = f"/api/v2/state-versions{self._encode_query(params)}"
         r = self.t.request("GET", path)
-        jd = r.json()
+        jd = loads(r.content)
         # Expecting JSON:API list. Normalize to models.
         items = []
         meta = jd.get("meta", {})
@@ -98,7 +99,7 @@ class StateVersions(_Service):
             raise ValueError("invalid state version id")
 
         r = self.t.request("GET", f"/api/v2/state-versions/{state_version_id}")
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         return StateVersion(
@@ -120,7 +121,7 @@ class StateVersions(_Service):
         r = self.t.request(
             "GET", f"/api/v2/state-versions/{state_version_id}", params=params
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         return StateVersion(
@@ -136,7 +137,7 @@ class StateVersions(_Service):
         r = self.t.request(
             "GET", f"/api/v2/workspaces/{workspace_id}/current-state-version"
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         return StateVersion(
@@ -160,7 +161,7 @@ class StateVersions(_Service):
             f"/api/v2/workspaces/{workspace_id}/current-state-version",
             params=params,
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
 
         return StateVersion(
@@ -193,7 +194,7 @@ class StateVersions(_Service):
         r = self.t.request(
             "POST", f"/api/v2/workspaces/{ws_id}/state-versions", json_body=body
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
         attr = d.get("attributes", {}) or {}
         return StateVersion(
             id=_safe_str(d.get("id")),
@@ -278,7 +279,7 @@ class StateVersions(_Service):
         r = self.t.request(
             "GET", f"/api/v2/state-versions/{state_version_id}/outputs", params=params
         )
-        data = r.json()
+        data = loads(r.content)
 
         items: list[StateVersionOutput] = []
         for item in data.get("data", []):
@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     ERR_INVALID_VARIABLE_ID,
     ERR_INVALID_WORKSPACE_ID,
@@ -81,7 +82,7 @@ class Variables(_Service):
         response = self.t.request(
             "POST", f"/api/v2/workspaces/{workspace_id}/vars", json_body=body
         )
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Parse the response and create Variable object
         attr = data.get("attributes", {}) or {}
@@ -101,7 +102,7 @@ class Variables(_Service):
         response = self.t.request(
             "GET", f"/api/v2/workspaces/{workspace_id}/vars/{variable_id}"
         )
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Parse the response and create Variable object
         attr = data.get("attributes", {}) or {}
@@ -132,7 +133,7 @@ class Variables(_Service):
             f"/api/v2/workspaces/{workspace_id}/vars/{variable_id}",
             json_body=body,
         )
-        data = response.json()["data"]
+        data = loads(response.content)["data"]
 
         # Parse the response and create Variable object
         attr = data.get("attributes", {}) or {}
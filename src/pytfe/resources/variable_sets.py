@@ -4,6 +4,7 @@ import builtins
 from typing import Any
 
 from .._http import HTTPTransport
+from .._jsonapi import loads
 from ..models.variable_set import (
     VariableSet,
     VariableSetApplyToProjectsOptions,
@@ -79,7 +80,7 @@ class VariableSets(_Service):
                 params["include"] = ",".join([opt.value for opt in options.include])
 
         response = self.t.request("GET", path, params=params)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_sets_response(data)
 
@@ -118,7 +119,7 @@ class VariableSets(_Service):
                 params["include"] = ",".join([opt.value for opt in options.include])
 
         response = self.t.request("GET", path, params=params)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_sets_response(data)
 
@@ -157,7 +158,7 @@ class VariableSets(_Service):
                 params["include"] = ",".join([opt.value for opt in options.include])
 
         response = self.t.request("GET", path, params=params)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_sets_response(data)
 
@@ -230,7 +231,7 @@ class VariableSets(_Service):
                 payload["data"]["relationships"] = relationships
 
         response = self.t.request("POST", path, json_body=payload)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_set(data["data"])
 
@@ -262,7 +263,7 @@ class VariableSets(_Service):
             params["include"] = ",".join([opt.value for opt in options.include])
 
         response = self.t.request("GET", path, params=params)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_set(data["data"])
 
@@ -316,7 +317,7 @@ class VariableSets(_Service):
             attributes["priority"] = options.priority
 
         response = self.t.request("PATCH", path, json_body=payload)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_set(data["data"])
 
@@ -572,7 +573,7 @@ class VariableSets(_Service):
         }
 
         response = self.t.request("PATCH", path, json_body=payload, params=params)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_set(data["data"])
 
@@ -741,7 +742,7 @@ class VariableSetVariables(_Service):
                 params["page[size]"] = str(options.page_size)
 
         response = self.t.request("GET", path, params=params)
-        data = response.json()
+        data = loads(response.content)
 
         variables = []
         for item in data.get("data", []):
@@ -807,7 +808,7 @@ class VariableSetVariables(_Service):
             attributes["sensitive"] = options.sensitive
 
         response = self.t.request("POST", path, json_body=payload)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_set_variable(data["data"])
 
@@ -838,7 +839,7 @@ class VariableSetVariables(_Service):
         path = f"/api/v2/varsets/{variable_set_id}/relationships/vars/{variable_id}"
 
         response = self.t.request("GET", path)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_set_variable(data["data"])
 
@@ -900,7 +901,7 @@ class VariableSetVariables(_Service):
             attributes["sensitive"] = options.sensitive
 
         response = self.t.request("PATCH", path, json_body=payload)
-        data = response.json()
+        data = loads(response.content)
 
         return self._parse_variable_set_variable(data["data"])
 
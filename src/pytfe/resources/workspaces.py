@@ -4,6 +4,7 @@ import builtins
 from collections.abc import Iterator
 from typing import Any
 
+from .._jsonapi import loads
 from ..errors import (
     InvalidOrgError,
     InvalidSSHKeyIDError,
@@ -333,7 +334,7 @@ class Workspaces(_Service):
             f"/api/v2/organizations/{organization}/workspaces/{workspace}",
             params=params,
         )
-        ws = _ws_from(r.json()["data"], organization)
+        ws = _ws_from(loads(r.content)["data"], organization)
         ws.data_retention_policy = (
             ws.data_retention_policy_choice.convert_to_legacy_struct()
             if ws.data_retention_policy_choice
@@ -357,7 +358,7 @@ class Workspaces(_Service):
             if options.include:
                 params["include"] = ",".join([i.value for i in options.include])
         r = self.t.request("GET", f"/api/v2/workspaces/{workspace_id}", params=params)
-        ws = _ws_from(r.json()["data"], None)
+        ws = _ws_from(loads(r.content)["data"], None)
         if ws.data_retention_policy_choice is not None:
             ws.data_retention_policy = (
                 ws.data_retention_policy_choice.convert_to_legacy_struct()
@@ -381,7 +382,7 @@ class Workspaces(_Service):
         r = self.t.request(
             "POST", f"/api/v2/organizations/{organization}/workspaces", json_body=body
         )
-        return _ws_from(r.json()["data"], organization)
+        return _ws_from(loads(r.content)["data"], organization)
 
     # Convenience methods for org+name operations
     def update(
@@ -403,7 +404,7 @@ class Workspaces(_Service):
             f"/api/v2/organizations/{organization}/workspaces/{workspace}",
             json_body=body,
         )
-        return _ws_from(r.json()["data"], organization)
+        return _ws_from(loads(r.content)["data"], organization)
 
     def update_by_id(
         self, workspace_id: str, options: WorkspaceUpdateOptions
@@ -420,7 +421,7 @@ class Workspaces(_Service):
         r = self.t.request(
             "PATCH", f"/api/v2/workspaces/{workspace_id}", json_body=body
         )
-        return _ws_from(r.json()["data"], None)
+        return _ws_from(loads(r.content)["data"], None)
 
     def _build_workspace_payload(
         self,
@@ -643,7 +644,7 @@ class Workspaces(_Service):
             f"/api/v2/organizations/{organization}/workspaces/{workspace}",
             json_body=body,
         )
-        return _ws_from(r.json()["data"], organization)
+        return _ws_from(loads(r.content)["data"], organization)
 
     def remove_vcs_connection_by_id(self, workspace_id: str) -> Workspace:
         """Remove VCS connection from workspace by workspace ID."""
@@ -666,7 +667,7 @@ class Workspaces(_Service):
             f"/api/v2/workspaces/{workspace_id}",
             json_body=body,
         )
-        return _ws_from(r.json()["data"], None)
+        return _ws_from(loads(r.content)["data"], None)
 
     def lock(self, workspace_id: str, options: WorkspaceLockOptions) -> Workspace:
         """Lock a workspace by workspace ID."""
@@ -681,7 +682,7 @@ class Workspaces(_Service):
             f"/api/v2/workspaces/{workspace_id}/actions/lock",
             json_body=body,
         )
-        return _ws_from(r.json()["data"], None)
+        return _ws_from(loads(r.content)["data"], None)
 
     def unlock(self, workspace_id: str) -> Workspace:
         """Unlock a workspace by workspace ID."""
@@ -693,7 +694,7 @@ class Workspaces(_Service):
                 "POST",
                 f"/api/v2/workspaces/{workspace_id}/actions/unlock",
             )
-            return _ws_from(r.json()["data"], None)
+            return _ws_from(loads(r.content)["data"], None)
         except Exception as e:
             if "latest state version is still pending" in str(e):
                 raise WorkspaceLockedStateVersionStillPending(str(e)) from e
@@ -709,7 +710,7 @@ class Workspaces(_Service):
             "POST",
             f"/api/v2/workspaces/{workspace_id}/actions/force-unlock",
         )
-        return _ws_from(r.json()["data"], None)
+        return _ws_from(loads(r.content)["data"], None)
 
     def assign_ssh_key(
         self, workspace_id: str, options: WorkspaceAssignSSHKeyOptions
@@ -737,7 +738,7 @@ class Workspaces(_Service):
             f"/api/v2/workspaces/{workspace_id}/relationships/ssh-key",
             json_body=body,
         )
-        return _ws_from(r.json()["data"], None)
+        return _ws_from(loads(r.content)["data"], None)
 
     def unassign_ssh_key(self, workspace_id: str) -> Workspace:
         """Unassign the SSH key from a workspace by workspace ID."""
@@ -758,7 +759,7 @@ class Workspaces(_Service):
             json_body=body,
         )
 
-        return _ws_from(r.json()["data"], None)
+        return _ws_from(loads(r.content)["data"], None)
 
     def list_remote_state_consumers(
         self, workspace_id: str, options: WorkspaceListRemoteStateConsumersOptions
@@ -956,7 +957,7 @@ class Workspaces(_Service):
             json_body=body,
         )
         out: builtins.list[TagBinding] = []
-        for item in r.json().get("data", []):
+        for item in loads(r.content).get("data", []):
             attr = item.get("attributes", {}) or {}
             out.append(
                 TagBinding(
@@ -990,7 +991,7 @@ class Workspaces(_Service):
 
         try:
             r = self.t.request("GET", self._data_retention_policy_link(workspace_id))
-            d = r.json().get("data")
+            d = loads(r.content).get("data")
             if not d:
                 return None
 
@@ -1027,7 +1028,7 @@ class Workspaces(_Service):
 
         # Get the specific data retention policy data from the relationships endpoint
         r = self.t.request("GET", self._data_retention_policy_link(workspace_id))
-        drp_data = r.json().get("data")
+        drp_data = loads(r.content).get("data")
 
         if not drp_data:
             return None
@@ -1081,7 +1082,7 @@ class Workspaces(_Service):
         r = self.t.request(
             "PATCH", self._data_retention_policy_link(workspace_id), json_body=body
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
 
         return DataRetentionPolicy(
             id=d.get("id"),
@@ -1113,7 +1114,7 @@ class Workspaces(_Service):
         r = self.t.request(
             "POST", self._data_retention_policy_link(workspace_id), json_body=body
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
 
         return DataRetentionPolicyDeleteOlder(
             id=d.get("id"),
@@ -1139,7 +1140,7 @@ class Workspaces(_Service):
         r = self.t.request(
             "POST", self._data_retention_policy_link(workspace_id), json_body=body
         )
-        d = r.json()["data"]
+        d = loads(r.content)["data"]
 
         return DataRetentionPolicyDontDelete(id=d.get("id"))
 
@@ -1157,7 +1158,7 @@ class Workspaces(_Service):
         r = self.t.request(
             "GET", f"/api/v2/workspaces/{workspace_id}", params={"include": "readme"}
         )
-        payload = r.json()
+        payload = loads(r.content)
 
         # First check if workspace has a readme relationship
         data = payload.get("data", {})
@@ -11,6 +11,7 @@ Run with:
     pytest tests/units/test_agent_pools.py -v
 """
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -120,7 +121,7 @@ class TestAgentPoolOperations:
             ]
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         agent_pools = list(agent_pools_service.list("test-org"))
 
@@ -136,7 +137,7 @@ class TestAgentPoolOperations:
     def test_list_agent_pools_with_options(self, agent_pools_service, mock_transport):
         """Test listing agent pools with options"""
         mock_response = {"data": []}
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         options = AgentPoolListOptions(
             page_number=2,
@@ -154,6 +155,55 @@ class TestAgentPoolOperations:
         assert params["page[size]"] == 10
         assert params["filter[allowed_workspace_policy]"] == "all-workspaces"
 
+    def test_list_agent_pools_with_prefetch(self, agent_pools_service, mock_transport):
+        """Test listing agent pools across pages with prefetching enabled"""
+        pages = [
+            {"data": [{"id": "apool-1", "attributes": {"name": "pool-1"}}]},
+            {"data": [{"id": "apool-2", "attributes": {"name": "pool-2"}}]},
+            {"data": []},
+        ]
+        responses = []
+        for page in pages:
+            response = Mock()
+            response.content = json.dumps(page).encode()
+            responses.append(response)
+        mock_transport.request.side_effect = responses
+
+        options = AgentPoolListOptions(page_size=1)
+        agent_pools = list(agent_pools_service.list("test-org", options, prefetch=True))
+
+        assert [pool.id for pool in agent_pools] == ["apool-1", "apool-2"]
+        assert mock_transport.request.call_count == 3
+        page_numbers = [
+            call[1]["params"]["page[number]"]
+            for call in mock_transport.request.call_args_list
+        ]
+        assert page_numbers == [1, 2, 3]
+
+    def test_list_agent_pools_uses_server_page_size(
+        self, agent_pools_service, mock_transport
+    ):
+        """Test pagination continues when the server caps the page size"""
+        pages = [
+            {
+                "data": [{"id": "apool-1", "attributes": {"name": "pool-1"}}],
+                "meta": {"pagination": {"page-size": 1}},
+            },
+            {"data": [], "meta": {"pagination": {"page-size": 1}}},
+        ]
+        responses = []
+        for page in pages:
+            response = Mock()
+            response.content = json.dumps(page).encode()
+            responses.append(response)
+        mock_transport.request.side_effect = responses
+
+        options = AgentPoolListOptions(page_size=500)
+        agent_pools = list(agent_pools_service.list("test-org", options))
+
+        assert [pool.id for pool in agent_pools] == ["apool-1"]
+        assert mock_transport.request.call_count == 2
+
     def test_create_agent_pool(self, agent_pools_service, mock_transport):
         """Test creating an agent pool"""
         mock_response = {
@@ -170,7 +220,7 @@ class TestAgentPoolOperations:
             }
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         options = AgentPoolCreateOptions(
             name="new-pool",
@@ -206,7 +256,7 @@ class TestAgentPoolOperations:
             }
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         agent_pool = agent_pools_service.read("apool-123456789abcdef0")
 
@@ -237,7 +287,7 @@ class TestAgentPoolOperations:
             }
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         options = AgentPoolUpdateOptions(name="updated-pool", organization_scoped=False)
 
@@ -296,7 +346,7 @@ class TestAgentTokenOperations:
             ]
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         tokens = list(agent_tokens_service.list("apool-123456789abcdef0"))
 
@@ -327,7 +377,7 @@ class TestAgentTokenOperations:
             }
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         options = AgentTokenCreateOptions(description="New token")
         token = agent_tokens_service.create("apool-123456789abcdef0", options)
@@ -360,7 +410,7 @@ class TestAgentTokenOperations:
             }
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         token = agent_tokens_service.read("at-123456789abcdef0")
 
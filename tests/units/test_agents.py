@@ -10,6 +10,7 @@ Run with:
     pytest tests/units/test_agents.py -v
 """
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -94,7 +95,7 @@ class TestAgentOperations:
             ]
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         agents = list(agents_service.list("apool-123456789abcdef0"))
 
@@ -121,7 +122,7 @@ class TestAgentOperations:
             }
         }
 
-        mock_transport.request.return_value.json.return_value = mock_response
+        mock_transport.request.return_value.content = json.dumps(mock_response).encode()
 
         agent = agents_service.read("agent-123456789abcdef0")
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -31,21 +32,23 @@ class TestApplies(unittest.TestCase):
         """Test successful apply read."""
         # Mock the transport response
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "apply-123",
-                "attributes": {
-                    "status": "finished",
-                    "resource-additions": 2,
-                    "resource-changes": 1,
-                    "resource-destructions": 0,
-                    "resource-imports": 0,
-                    "created-at": "2023-01-01T00:00:00Z",
-                    "log-read-url": "https://app.terraform.io/api/v2/applies/apply-123/logs",
-                    "status-timestamps": {},
-                },
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "apply-123",
+                    "attributes": {
+                        "status": "finished",
+                        "resource-additions": 2,
+                        "resource-changes": 1,
+                        "resource-destructions": 0,
+                        "resource-imports": 0,
+                        "created-at": "2023-01-01T00:00:00Z",
+                        "log-read-url": "https://app.terraform.io/api/v2/applies/apply-123/logs",
+                        "status-timestamps": {},
+                    },
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
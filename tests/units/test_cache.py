@@ -0,0 +1,267 @@
+"""Unit tests for the in-process read cache.
+
+These tests focus on:
+1. TTL expiry and LRU eviction of TTLCache entries
+2. Cached reads, cache priming and invalidation on decorated services
+3. Resource IDs passed by keyword
+4. Reads cached per include set, invalidated together
+5. Organization capacity and entitlements reads
+
+Run with:
+    pytest tests/units/test_cache.py -v
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pytfe.cache import TTLCache
+from pytfe.models.agent import AgentPoolCreateOptions, AgentPoolUpdateOptions
+from pytfe.models.oauth_client import (
+    OAuthClientAddProjectsOptions,
+    OAuthClientIncludeOpt,
+    OAuthClientReadOptions,
+)
+from pytfe.resources.agent_pools import AgentPools
+from pytfe.resources.notification_configuration import NotificationConfigurations
+from pytfe.resources.oauth_client import OAuthClients
+from pytfe.resources.organizations import Organizations
+
+POOL_RESPONSE = {
+    "data": {
+        "id": "apool-123456789abcdef0",
+        "type": "agent-pools",
+        "attributes": {"name": "test-pool", "agent-count": 0},
+    }
+}
+
+
+NOTIFICATION_RESPONSE = {
+    "data": {
+        "id": "nc-123456789",
+        "attributes": {"name": "Test Notification", "enabled": True},
+    }
+}
+
+OAUTH_CLIENT_RESPONSE = {
+    "data": {
+        "id": "oc-123456789",
+        "type": "oauth-clients",
+        "attributes": {"name": "test-client", "service-provider": "github"},
+    }
+}
+
+ENTITLEMENTS_RESPONSE = {
+    "data": {
+        "id": "my-org",
+        "type": "entitlement-sets",
+        "attributes": {"agents": True, "teams": True},
+    }
+}
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and eviction"""
+
+    def test_get_and_set(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+
+    def test_entries_expire_after_ttl(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        with patch("pytfe.cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("pytfe.cache.time.monotonic", return_value=129.0):
+            assert cache.get("a") == 1
+        with patch("pytfe.cache.time.monotonic", return_value=131.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop_prefix(self):
+        cache = TTLCache(maxsize=4, ttl=30)
+        cache.set(("ns", "a"), 1)
+        cache.set(("ns", "a", "x"), 2)
+        cache.set(("ns", "b"), 3)
+        cache.set("a", 4)
+
+        cache.pop_prefix(("ns", "a"))
+
+        assert len(cache) == 2
+        assert cache.get(("ns", "b")) == 3
+        assert cache.get("a") == 4
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
+        with pytest.raises(ValueError):
+            TTLCache(ttl=0)
+
+
+class TestCachedService:
+    """Test cache decorators on the agent pools service"""
+
+    @pytest.fixture
+    def mock_transport(self):
+        transport = Mock()
+        transport.request.return_value.content = json.dumps(POOL_RESPONSE).encode()
+        return transport
+
+    def test_read_is_served_from_cache(self, mock_transport):
+        service = AgentPools(mock_transport, TTLCache())
+
+        first = service.read("apool-123456789abcdef0")
+        second = service.read("apool-123456789abcdef0")
+
+        assert first is second
+        mock_transport.request.assert_called_once()
+
+    def test_read_without_cache_always_requests(self, mock_transport):
+        service = AgentPools(mock_transport)
+
+        service.read("apool-123456789abcdef0")
+        service.read("apool-123456789abcdef0")
+
+        assert mock_transport.request.call_count == 2
+
+    def test_create_primes_cache(self, mock_transport):
+        service = AgentPools(mock_transport, TTLCache())
+
+        created = service.create("test-org", AgentPoolCreateOptions(name="test-pool"))
+        read = service.read(created.id)
+
+        assert read is created
+        mock_transport.request.assert_called_once()
+
+    def test_update_and_delete_invalidate(self, mock_transport):
+        service = AgentPools(mock_transport, TTLCache())
+
+        service.read("apool-123456789abcdef0")
+        service.update("apool-123456789abcdef0", AgentPoolUpdateOptions(name="new"))
+        service.read("apool-123456789abcdef0")
+        service.delete("apool-123456789abcdef0")
+        service.read("apool-123456789abcdef0")
+
+        methods = [call[0][0] for call in mock_transport.request.call_args_list]
+        assert methods == ["GET", "PATCH", "GET", "DELETE", "GET"]
+
+    def test_keyword_resource_id(self, mock_transport):
+        mock_transport.request.return_value.content = json.dumps(
+            NOTIFICATION_RESPONSE
+        ).encode()
+        service = NotificationConfigurations(mock_transport, TTLCache())
+
+        service.read(notification_config_id="nc-123456789")
+        service.read("nc-123456789")
+        service.delete(notification_config_id="nc-123456789")
+        service.read(notification_config_id="nc-123456789")
+
+        methods = [call[0][0] for call in mock_transport.request.call_args_list]
+        assert methods == ["GET", "DELETE", "GET"]
+
+    def test_reads_are_cached_per_include_set(self, mock_transport):
+        mock_transport.request.return_value.content = json.dumps(
+            OAUTH_CLIENT_RESPONSE
+        ).encode()
+        service = OAuthClients(mock_transport, TTLCache())
+        projects = OAuthClientReadOptions(include=[OAuthClientIncludeOpt.PROJECTS])
+        both = OAuthClientReadOptions(
+            include=[OAuthClientIncludeOpt.PROJECTS, OAuthClientIncludeOpt.OAUTH_TOKENS]
+        )
+        both_reordered = OAuthClientReadOptions(
+            include=[OAuthClientIncludeOpt.OAUTH_TOKENS, OAuthClientIncludeOpt.PROJECTS]
+        )
+
+        service.read("oc-123456789")
+        service.read_with_options("oc-123456789", None)
+        service.read_with_options("oc-123456789", projects)
+        service.read_with_options("oc-123456789", projects)
+        service.read_with_options("oc-123456789", both)
+        service.read_with_options("oc-123456789", both_reordered)
+
+        params = [call[1]["params"] for call in mock_transport.request.call_args_list]
+        assert params == [
+            {},
+            {"include": "projects"},
+            {"include": "projects,oauth_tokens"},
+        ]
+
+    def test_writes_invalidate_every_include_set(self, mock_transport):
+        mock_transport.request.return_value.content = json.dumps(
+            OAUTH_CLIENT_RESPONSE
+        ).encode()
+        service = OAuthClients(mock_transport, TTLCache())
+        projects = OAuthClientReadOptions(include=[OAuthClientIncludeOpt.PROJECTS])
+        add_options = OAuthClientAddProjectsOptions(
+            projects=[{"type": "projects", "id": "prj-123456789"}]
+        )
+
+        service.read("oc-123456789")
+        service.read_with_options("oc-123456789", projects)
+        service.add_projects("oc-123456789", add_options)
+        service.read("oc-123456789")
+        service.read_with_options("oc-123456789", projects)
+
+        methods = [call[0][0] for call in mock_transport.request.call_args_list]
+        assert methods == ["GET", "GET", "POST", "GET", "GET"]
+
+    def test_organization_entitlements_and_capacity_are_cached(self, mock_transport):
+        mock_transport.request.return_value.content = json.dumps(
+            ENTITLEMENTS_RESPONSE
+        ).encode()
+        service = Organizations(mock_transport, TTLCache())
+
+        first = service.read_entitlements("my-org")
+        second = service.read_entitlements("my-org")
+        service.read_capacity("my-org")
+        service.read_capacity("my-org")
+
+        assert first is second
+        paths = [call[0][1] for call in mock_transport.request.call_args_list]
+        assert paths == [
+            "/api/v2/organizations/my-org/entitlement-set",
+            "/api/v2/organizations/my-org/capacity",
+        ]
+
+    def test_organization_delete_invalidates_reads(self, mock_transport):
+        mock_transport.request.return_value.content = json.dumps(
+            ENTITLEMENTS_RESPONSE
+        ).encode()
+        service = Organizations(mock_transport, TTLCache())
+
+        service.read_entitlements("my-org")
+        service.read_capacity("my-org")
+        service.delete("my-org")
+        service.read_entitlements("my-org")
+        service.read_capacity("my-org")
+
+        methods = [call[0][0] for call in mock_transport.request.call_args_list]
+        assert methods == ["GET", "GET", "DELETE", "GET", "GET"]
+
+    def test_failed_write_still_invalidates(self, mock_transport):
+        service = AgentPools(mock_transport, TTLCache())
+        read_response = mock_transport.request.return_value
+
+        service.read("apool-123456789abcdef0")
+        mock_transport.request.side_effect = [RuntimeError("boom"), read_response]
+        with pytest.raises(RuntimeError):
+            service.update("apool-123456789abcdef0", AgentPoolUpdateOptions(name="x"))
+        service.read("apool-123456789abcdef0")
+
+        methods = [call[0][0] for call in mock_transport.request.call_args_list]
+        assert methods == ["GET", "PATCH", "GET"]
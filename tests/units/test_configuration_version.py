@@ -17,8 +17,10 @@ This test suite covers all 12 configuration version methods:
 """
 
 import io
+import json
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
 from pytfe.models.configuration_version import (
@@ -120,13 +122,15 @@ class TestConfigurationVersionsList:
         """Test basic list functionality."""
         # Mock the paginated response for the _list method
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [sample_cv_data],
-            "meta": {
-                "pagination": {"current-page": 1, "page-size": 20, "total-pages": 1}
-            },
-            "links": {"next": None},
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [sample_cv_data],
+                "meta": {
+                    "pagination": {"current-page": 1, "page-size": 20, "total-pages": 1}
+                },
+                "links": {"next": None},
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         workspace_id = "ws-YnyXLq9fy38afEeb"
@@ -153,13 +157,15 @@ class TestConfigurationVersionsList:
     ):
         """Test list with options."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [sample_cv_data],
-            "meta": {
-                "pagination": {"current-page": 1, "page-size": 5, "total-pages": 1}
-            },
-            "links": {"next": None},
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [sample_cv_data],
+                "meta": {
+                    "pagination": {"current-page": 1, "page-size": 5, "total-pages": 1}
+                },
+                "links": {"next": None},
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         workspace_id = "ws-YnyXLq9fy38afEeb"
@@ -195,7 +201,7 @@ class TestConfigurationVersionsCreate:
     ):
         """Test basic create functionality."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_cv_data}
+        mock_response.content = json.dumps({"data": sample_cv_data}).encode()
         mock_transport.request.return_value = mock_response
 
         workspace_id = "ws-YnyXLq9fy38afEeb"
@@ -228,7 +234,7 @@ class TestConfigurationVersionsCreate:
     ):
         """Test create with provisional option."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_cv_data}
+        mock_response.content = json.dumps({"data": sample_cv_data}).encode()
         mock_transport.request.return_value = mock_response
 
         workspace_id = "ws-YnyXLq9fy38afEeb"
@@ -248,7 +254,7 @@ class TestConfigurationVersionsCreate:
     ):
         """Test create with default options."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_cv_data}
+        mock_response.content = json.dumps({"data": sample_cv_data}).encode()
         mock_transport.request.return_value = mock_response
 
         workspace_id = "ws-YnyXLq9fy38afEeb"
@@ -269,7 +275,7 @@ class TestConfigurationVersionsRead:
     ):
         """Test basic read functionality."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_cv_data}
+        mock_response.content = json.dumps({"data": sample_cv_data}).encode()
         mock_transport.request.return_value = mock_response
 
         cv_id = "cv-ntv3HbhJqvFzamy7"
@@ -299,7 +305,9 @@ class TestConfigurationVersionsReadWithOptions:
     ):
         """Test read with options - basic functionality."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_cv_with_ingress_data}
+        mock_response.content = json.dumps(
+            {"data": sample_cv_with_ingress_data}
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         cv_id = "cv-ntv3HbhJqvFzamy7"
@@ -327,7 +335,7 @@ class TestConfigurationVersionsReadWithOptions:
     ):
         """Test read with options when no ingress attributes present."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_cv_data}
+        mock_response.content = json.dumps({"data": sample_cv_data}).encode()
         mock_transport.request.return_value = mock_response
 
         cv_id = "cv-ntv3HbhJqvFzamy7"
@@ -403,6 +411,36 @@ class TestConfigurationVersionsUploadTarGzip:
             follow_redirects=True,
         )
 
+    def test_upload_tar_gzip_streams_file_archive(
+        self, configuration_versions_service, tmp_path
+    ):
+        """Test file archives are streamed with an explicit Content-Length."""
+        archive_data = b"x" * (200 * 1024)
+        archive_path = tmp_path / "archive.tar.gz"
+        archive_path.write_bytes(archive_data)
+
+        requests = []
+
+        def handler(request):
+            requests.append((request, request.read()))
+            return httpx.Response(200)
+
+        configuration_versions_service.t._sync = httpx.Client(
+            transport=httpx.MockTransport(handler)
+        )
+
+        with open(archive_path, "rb") as archive:
+            archive.seek(10)
+            configuration_versions_service.upload_tar_gzip(
+                "https://example.com/upload", archive
+            )
+            assert archive.tell() == 10
+
+        request, body = requests[0]
+        assert body == archive_data
+        assert request.headers["Content-Length"] == str(len(archive_data))
+        assert "Transfer-Encoding" not in request.headers
+
 
 class TestConfigurationVersionsUploadErrors:
     """Test configuration version upload error functionality."""
@@ -478,7 +516,7 @@ class TestConfigurationVersionsRegistryModule:
     ):
         """Test successful registry module configuration version creation."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_cv_data}
+        mock_response.content = json.dumps({"data": sample_cv_data}).encode()
         mock_transport.request.return_value = mock_response
 
         module_id = {
@@ -703,11 +741,11 @@ class TestConfigurationVersionsIntegration:
 
         # Step 1: Create configuration version
         create_response = Mock()
-        create_response.json.return_value = {"data": pending_cv_data}
+        create_response.content = json.dumps({"data": pending_cv_data}).encode()
 
         # Step 2: Read after upload
         read_response = Mock()
-        read_response.json.return_value = {"data": uploaded_cv_data}
+        read_response.content = json.dumps({"data": uploaded_cv_data}).encode()
 
         # Step 3: Archive
         archive_response = Mock()
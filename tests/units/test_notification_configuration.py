@@ -4,6 +4,7 @@ Unit tests for Notification Configuration API.
 Tests all CRUD operations: List, Create, Read, Update, Delete, and Verify.
 """
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -56,19 +57,21 @@ class TestNotificationConfigurations:
         """Test listing notification configurations for a workspace."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [self.sample_nc_data],
-            "meta": {
-                "pagination": {
-                    "current-page": 1,
-                    "page-size": 20,
-                    "prev-page": None,
-                    "next-page": None,
-                    "total-pages": 1,
-                    "total-count": 1,
-                }
-            },
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [self.sample_nc_data],
+                "meta": {
+                    "pagination": {
+                        "current-page": 1,
+                        "page-size": 20,
+                        "prev-page": None,
+                        "next-page": None,
+                        "total-pages": 1,
+                        "total-count": 1,
+                    }
+                },
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Test list operation
@@ -92,12 +95,14 @@ class TestNotificationConfigurations:
         """Test listing notification configurations for a team."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [self.sample_nc_data],
-            "meta": {
-                "pagination": {"current-page": 1, "page-size": 20, "total-count": 1}
-            },
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [self.sample_nc_data],
+                "meta": {
+                    "pagination": {"current-page": 1, "page-size": 20, "total-count": 1}
+                },
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Test list operation with team
@@ -120,12 +125,14 @@ class TestNotificationConfigurations:
         """Test listing with pagination options."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [],
-            "meta": {
-                "pagination": {"current-page": 2, "page-size": 50, "total-count": 0}
-            },
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [],
+                "meta": {
+                    "pagination": {"current-page": 2, "page-size": 50, "total-count": 0}
+                },
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Test with pagination
@@ -150,7 +157,7 @@ class TestNotificationConfigurations:
         """Test creating a notification configuration for a workspace."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": self.sample_nc_data}
+        mock_response.content = json.dumps({"data": self.sample_nc_data}).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Create options
@@ -192,7 +199,7 @@ class TestNotificationConfigurations:
         """Test creating a notification configuration for a team."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": self.sample_nc_data}
+        mock_response.content = json.dumps({"data": self.sample_nc_data}).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Create options with team choice
@@ -220,7 +227,7 @@ class TestNotificationConfigurations:
         """Test creating an email notification configuration."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": self.sample_nc_data}
+        mock_response.content = json.dumps({"data": self.sample_nc_data}).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Create email notification options
@@ -288,7 +295,7 @@ class TestNotificationConfigurations:
         """Test reading a notification configuration by ID."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": self.sample_nc_data}
+        mock_response.content = json.dumps({"data": self.sample_nc_data}).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Test read operation
@@ -319,7 +326,7 @@ class TestNotificationConfigurations:
         updated_data["attributes"]["enabled"] = False
 
         mock_response = Mock()
-        mock_response.json.return_value = {"data": updated_data}
+        mock_response.content = json.dumps({"data": updated_data}).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Update options
@@ -350,7 +357,7 @@ class TestNotificationConfigurations:
         """Test updating notification triggers."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": self.sample_nc_data}
+        mock_response.content = json.dumps({"data": self.sample_nc_data}).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Update triggers
@@ -413,7 +420,7 @@ class TestNotificationConfigurations:
         """Test verifying a notification configuration."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": self.sample_nc_data}
+        mock_response.content = json.dumps({"data": self.sample_nc_data}).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Test verify operation
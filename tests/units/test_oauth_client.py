@@ -5,6 +5,7 @@ This test suite covers all OAuth client methods including CRUD operations,
 project management, and validation.
 """
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,6 +14,7 @@ from src.pytfe._http import HTTPTransport
 from src.pytfe.errors import (
     ERR_INVALID_OAUTH_CLIENT_ID,
     ERR_INVALID_ORG,
+    NotFound,
 )
 from src.pytfe.models.oauth_client import (
     OAuthClientAddProjectsOptions,
@@ -256,18 +258,20 @@ class TestOAuthClients:
         )
 
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "oc-created",
-                "attributes": {
-                    "name": "Test GitHub Client",
-                    "api-url": "https://api.github.com",
-                    "http-url": "https://github.com",
-                    "service-provider": "github",
-                    "organization-scoped": True,
-                },
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "oc-created",
+                    "attributes": {
+                        "name": "Test GitHub Client",
+                        "api-url": "https://api.github.com",
+                        "http-url": "https://github.com",
+                        "service-provider": "github",
+                        "organization-scoped": True,
+                    },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         result = oauth_clients_service.create("test-org", create_options)
@@ -299,15 +303,17 @@ class TestOAuthClients:
         )
 
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "oc-with-projects",
-                "attributes": {
-                    "name": "Test Client with Projects",
-                    "service-provider": "github",
-                },
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "oc-with-projects",
+                    "attributes": {
+                        "name": "Test Client with Projects",
+                        "service-provider": "github",
+                    },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         result = oauth_clients_service.create("test-org", create_options)
@@ -340,16 +346,18 @@ class TestOAuthClients:
     def test_read_oauth_client_success(self, oauth_clients_service, mock_transport):
         """Test reading an OAuth client successfully."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "oc-test123",
-                "attributes": {
-                    "name": "Test OAuth Client",
-                    "service-provider": "github",
-                    "created-at": "2023-10-02T10:30:00.000Z",
-                },
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "oc-test123",
+                    "attributes": {
+                        "name": "Test OAuth Client",
+                        "service-provider": "github",
+                        "created-at": "2023-10-02T10:30:00.000Z",
+                    },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         result = oauth_clients_service.read("oc-test123")
@@ -375,21 +383,23 @@ class TestOAuthClients:
         )
 
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "oc-test123",
-                "attributes": {
-                    "name": "Test OAuth Client",
-                    "service-provider": "github",
-                },
-                "relationships": {
-                    "oauth-tokens": {
-                        "data": [{"id": "ot-token1", "type": "oauth-tokens"}]
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "oc-test123",
+                    "attributes": {
+                        "name": "Test OAuth Client",
+                        "service-provider": "github",
                     },
-                    "projects": {"data": [{"id": "prj-proj1", "type": "projects"}]},
-                },
+                    "relationships": {
+                        "oauth-tokens": {
+                            "data": [{"id": "ot-token1", "type": "oauth-tokens"}]
+                        },
+                        "projects": {"data": [{"id": "prj-proj1", "type": "projects"}]},
+                    },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         result = oauth_clients_service.read_with_options("oc-test123", read_options)
@@ -422,16 +432,18 @@ class TestOAuthClients:
         )
 
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "oc-test123",
-                "attributes": {
-                    "name": "Updated OAuth Client",
-                    "service-provider": "github",
-                    "organization-scoped": False,
-                },
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "oc-test123",
+                    "attributes": {
+                        "name": "Updated OAuth Client",
+                        "service-provider": "github",
+                        "organization-scoped": False,
+                    },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         result = oauth_clients_service.update("oc-test123", update_options)
@@ -465,6 +477,25 @@ class TestOAuthClients:
         with pytest.raises(ValueError, match=ERR_INVALID_OAUTH_CLIENT_ID):
             oauth_clients_service.delete("")
 
+    def test_exists_oauth_client(self, oauth_clients_service, mock_transport):
+        """Test that exists() probes the OAuth client with a HEAD request."""
+        assert oauth_clients_service.exists("oc-test123") is True
+
+        mock_transport.request.assert_called_once_with(
+            "HEAD", "/api/v2/oauth-clients/oc-test123"
+        )
+
+    def test_exists_oauth_client_not_found(self, oauth_clients_service, mock_transport):
+        """Test that exists() returns False when the OAuth client is missing."""
+        mock_transport.request.side_effect = NotFound("not found", status=404)
+
+        assert oauth_clients_service.exists("oc-test123") is False
+
+    def test_exists_oauth_client_invalid_id(self, oauth_clients_service):
+        """Test exists() with an invalid OAuth client ID."""
+        with pytest.raises(ValueError, match=ERR_INVALID_OAUTH_CLIENT_ID):
+            oauth_clients_service.exists("")
+
     def test_add_projects_success(self, oauth_clients_service, mock_transport):
         """Test adding projects to an OAuth client successfully."""
         add_options = OAuthClientAddProjectsOptions(
@@ -522,6 +553,25 @@ class TestOAuthClients:
             {"type": "projects", "id": "prj-test2"},
         ]
 
+    def test_add_and_remove_projects_in_batches(
+        self, oauth_clients_service, mock_transport
+    ):
+        """Test that long project lists are sent in batches of 100."""
+        projects = [{"type": "projects", "id": f"prj-test{i}"} for i in range(250)]
+
+        oauth_clients_service.add_projects(
+            "oc-test123", OAuthClientAddProjectsOptions(projects=projects)
+        )
+        oauth_clients_service.remove_projects(
+            "oc-test123", OAuthClientRemoveProjectsOptions(projects=projects)
+        )
+
+        calls = mock_transport.request.call_args_list
+        assert [call[0][0] for call in calls] == ["POST"] * 3 + ["DELETE"] * 3
+        batches = [call[1]["json_body"]["data"] for call in calls]
+        assert [len(batch) for batch in batches] == [100, 100, 50] * 2
+        assert batches[0] + batches[1] + batches[2] == projects
+
     def test_remove_projects_invalid_id(self, oauth_clients_service):
         """Test removing projects with invalid OAuth client ID."""
         remove_options = OAuthClientRemoveProjectsOptions(
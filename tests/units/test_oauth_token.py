@@ -4,6 +4,7 @@ Comprehensive unit tests for OAuth token operations in the Python TFE SDK.
 This test suite covers all OAuth token methods including list, read, update, and delete operations.
 """
 
+import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -110,37 +111,39 @@ class TestOAuthTokens:
     def test_list_oauth_tokens_basic(self, oauth_tokens_service, mock_transport):
         """Test listing OAuth tokens without options."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "ot-test1",
-                    "attributes": {
-                        "created-at": "2023-01-01T00:00:00Z",
-                        "has-ssh-key": False,
-                        "service-provider-user": "testuser1",
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "ot-test1",
+                        "attributes": {
+                            "created-at": "2023-01-01T00:00:00Z",
+                            "has-ssh-key": False,
+                            "service-provider-user": "testuser1",
+                        },
+                        "relationships": {},
                     },
-                    "relationships": {},
-                },
-                {
-                    "id": "ot-test2",
-                    "attributes": {
-                        "created-at": "2023-01-02T00:00:00Z",
-                        "has-ssh-key": True,
-                        "service-provider-user": "testuser2",
+                    {
+                        "id": "ot-test2",
+                        "attributes": {
+                            "created-at": "2023-01-02T00:00:00Z",
+                            "has-ssh-key": True,
+                            "service-provider-user": "testuser2",
+                        },
+                        "relationships": {},
                     },
-                    "relationships": {},
+                ],
+                "meta": {
+                    "pagination": {
+                        "current-page": 1,
+                        "prev-page": None,
+                        "next-page": None,
+                        "total-pages": 1,
+                        "total-count": 2,
+                    }
                 },
-            ],
-            "meta": {
-                "pagination": {
-                    "current-page": 1,
-                    "prev-page": None,
-                    "next-page": None,
-                    "total-pages": 1,
-                    "total-count": 2,
-                }
-            },
-        }
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         result = list(oauth_tokens_service.list("test-org"))
@@ -174,17 +177,19 @@ class TestOAuthTokens:
     def test_read_oauth_token_success(self, oauth_tokens_service, mock_transport):
         """Test reading an OAuth token successfully."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "ot-test123",
-                "attributes": {
-                    "created-at": "2023-01-01T00:00:00Z",
-                    "has-ssh-key": False,
-                    "service-provider-user": "testuser",
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "ot-test123",
+                    "attributes": {
+                        "created-at": "2023-01-01T00:00:00Z",
+                        "has-ssh-key": False,
+                        "service-provider-user": "testuser",
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         result = oauth_tokens_service.read("ot-test123")
@@ -202,17 +207,19 @@ class TestOAuthTokens:
     def test_update_oauth_token_success(self, oauth_tokens_service, mock_transport):
         """Test updating an OAuth token successfully."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "ot-test123",
-                "attributes": {
-                    "created-at": "2023-01-01T00:00:00Z",
-                    "has-ssh-key": True,
-                    "service-provider-user": "testuser",
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "ot-test123",
+                    "attributes": {
+                        "created-at": "2023-01-01T00:00:00Z",
+                        "has-ssh-key": True,
+                        "service-provider-user": "testuser",
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         options = OAuthTokenUpdateOptions(private_ssh_key="test-ssh-key")
@@ -235,17 +242,19 @@ class TestOAuthTokens:
     def test_update_oauth_token_no_ssh_key(self, oauth_tokens_service, mock_transport):
         """Test updating an OAuth token without SSH key."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "ot-test123",
-                "attributes": {
-                    "created-at": "2023-01-01T00:00:00Z",
-                    "has-ssh-key": False,
-                    "service-provider-user": "testuser",
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "ot-test123",
+                    "attributes": {
+                        "created-at": "2023-01-01T00:00:00Z",
+                        "has-ssh-key": False,
+                        "service-provider-user": "testuser",
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         options = OAuthTokenUpdateOptions()
@@ -5,6 +5,7 @@ This test suite covers all organization membership methods including list, creat
 read with options, and delete operations.
 """
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -82,7 +83,7 @@ class TestOrganizationMembershipList:
     ):
         """Test listing organization memberships without options."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_membership_response
+        mock_response.content = json.dumps(sample_membership_response).encode()
         mock_transport.request.return_value = mock_response
 
         memberships = list(membership_service.list("test-org"))
@@ -97,10 +98,12 @@ class TestOrganizationMembershipList:
     def test_list_with_pagination_options(self, membership_service, mock_transport):
         """Test listing with pagination options."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [],
-            "meta": {"pagination": {"current-page": 999, "total-count": 2}},
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [],
+                "meta": {"pagination": {"current-page": 999, "total-count": 2}},
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipListOptions(page_number=999, page_size=100)
@@ -111,12 +114,64 @@ class TestOrganizationMembershipList:
         call_args = mock_transport.request.call_args
         assert call_args is not None
 
+    def test_list_with_prefetch(self, membership_service, mock_transport):
+        """Test listing across pages with prefetching enabled."""
+        pages = [
+            {"data": [{"id": "ou-1", "attributes": {"status": "active"}}]},
+            {"data": [{"id": "ou-2", "attributes": {"status": "invited"}}]},
+            {"data": []},
+        ]
+        responses = []
+        for page in pages:
+            response = Mock()
+            response.content = json.dumps(page).encode()
+            responses.append(response)
+        mock_transport.request.side_effect = responses
+
+        options = OrganizationMembershipListOptions(page_size=1)
+        memberships = list(membership_service.list("test-org", options, prefetch=True))
+
+        assert [membership.id for membership in memberships] == ["ou-1", "ou-2"]
+        assert mock_transport.request.call_count == 3
+        page_numbers = [
+            call[1]["params"]["page[number]"]
+            for call in mock_transport.request.call_args_list
+        ]
+        assert page_numbers == [1, 2, 3]
+
+    def test_list_serializes_options_to_query_params(
+        self, membership_service, mock_transport
+    ):
+        """Test enum values and list filters are sent as query strings."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({"data": []}).encode()
+        mock_transport.request.return_value = mock_response
+
+        options = OrganizationMembershipListOptions(
+            page_size=10,
+            include=[OrgMembershipIncludeOpt.USER, OrgMembershipIncludeOpt.TEAMS],
+            emails=["a@example.com", "b@example.com"],
+            status=OrganizationMembershipStatus.ACTIVE,
+            query="example",
+        )
+        list(membership_service.list("test-org", options))
+
+        params = mock_transport.request.call_args[1]["params"]
+        assert params == {
+            "page[number]": 1,
+            "page[size]": 10,
+            "include": "user,teams",
+            "filter[email]": "a@example.com,b@example.com",
+            "filter[status]": "active",
+            "q": "example",
+        }
+
     def test_list_with_include_options(
         self, membership_service, mock_transport, sample_membership_response
     ):
         """Test listing with include options for user and teams."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_membership_response
+        mock_response.content = json.dumps(sample_membership_response).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipListOptions(
@@ -130,23 +185,25 @@ class TestOrganizationMembershipList:
     def test_list_with_email_filter(self, membership_service, mock_transport):
         """Test listing with email filter option."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "type": "organization-memberships",
-                    "id": "ou-abc123",
-                    "attributes": {"status": "active"},
-                    "relationships": {
-                        "teams": {"data": [{"type": "teams", "id": "team-xyz"}]},
-                        "user": {"data": {"type": "users", "id": "user-abc"}},
-                        "organization": {
-                            "data": {"type": "organizations", "id": "test-org"}
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "type": "organization-memberships",
+                        "id": "ou-abc123",
+                        "attributes": {"status": "active"},
+                        "relationships": {
+                            "teams": {"data": [{"type": "teams", "id": "team-xyz"}]},
+                            "user": {"data": {"type": "users", "id": "user-abc"}},
+                            "organization": {
+                                "data": {"type": "organizations", "id": "test-org"}
+                            },
                         },
-                    },
-                }
-            ],
-            "meta": {"pagination": {"current-page": 1, "total-count": 1}},
-        }
+                    }
+                ],
+                "meta": {"pagination": {"current-page": 1, "total-count": 1}},
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipListOptions(emails=["specific@example.com"])
@@ -158,23 +215,25 @@ class TestOrganizationMembershipList:
     def test_list_with_status_filter(self, membership_service, mock_transport):
         """Test listing with status filter option."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "type": "organization-memberships",
-                    "id": "ou-abc123",
-                    "attributes": {"status": "invited"},
-                    "relationships": {
-                        "teams": {"data": [{"type": "teams", "id": "team-xyz"}]},
-                        "user": {"data": {"type": "users", "id": "user-abc"}},
-                        "organization": {
-                            "data": {"type": "organizations", "id": "test-org"}
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "type": "organization-memberships",
+                        "id": "ou-abc123",
+                        "attributes": {"status": "invited"},
+                        "relationships": {
+                            "teams": {"data": [{"type": "teams", "id": "team-xyz"}]},
+                            "user": {"data": {"type": "users", "id": "user-abc"}},
+                            "organization": {
+                                "data": {"type": "organizations", "id": "test-org"}
+                            },
                         },
-                    },
-                }
-            ],
-            "meta": {"pagination": {"current-page": 1, "total-count": 1}},
-        }
+                    }
+                ],
+                "meta": {"pagination": {"current-page": 1, "total-count": 1}},
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipListOptions(
@@ -188,23 +247,25 @@ class TestOrganizationMembershipList:
     def test_list_with_query_string(self, membership_service, mock_transport):
         """Test listing with search query string."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "type": "organization-memberships",
-                    "id": "ou-abc123",
-                    "attributes": {"status": "active"},
-                    "relationships": {
-                        "teams": {"data": [{"type": "teams", "id": "team-xyz"}]},
-                        "user": {"data": {"type": "users", "id": "user-abc"}},
-                        "organization": {
-                            "data": {"type": "organizations", "id": "test-org"}
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "type": "organization-memberships",
+                        "id": "ou-abc123",
+                        "attributes": {"status": "active"},
+                        "relationships": {
+                            "teams": {"data": [{"type": "teams", "id": "team-xyz"}]},
+                            "user": {"data": {"type": "users", "id": "user-abc"}},
+                            "organization": {
+                                "data": {"type": "organizations", "id": "test-org"}
+                            },
                         },
-                    },
-                }
-            ],
-            "meta": {"pagination": {"current-page": 1, "total-count": 1}},
-        }
+                    }
+                ],
+                "meta": {"pagination": {"current-page": 1, "total-count": 1}},
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipListOptions(query="example.com")
@@ -285,7 +346,7 @@ class TestOrganizationMembershipCreate:
     ):
         """Test creating organization membership with valid options."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_create_response
+        mock_response.content = json.dumps(sample_create_response).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipCreateOptions(email="newuser@example.com")
@@ -301,25 +362,27 @@ class TestOrganizationMembershipCreate:
     def test_create_with_teams(self, membership_service, mock_transport):
         """Test creating organization membership with initial teams."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "type": "organization-memberships",
-                "id": "ou-withteams123",
-                "attributes": {"status": "invited"},
-                "relationships": {
-                    "teams": {
-                        "data": [
-                            {"type": "teams", "id": "team-123"},
-                            {"type": "teams", "id": "team-456"},
-                        ]
-                    },
-                    "user": {"data": {"type": "users", "id": "user-xyz"}},
-                    "organization": {
-                        "data": {"type": "organizations", "id": "test-org"}
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "type": "organization-memberships",
+                    "id": "ou-withteams123",
+                    "attributes": {"status": "invited"},
+                    "relationships": {
+                        "teams": {
+                            "data": [
+                                {"type": "teams", "id": "team-123"},
+                                {"type": "teams", "id": "team-456"},
+                            ]
+                        },
+                        "user": {"data": {"type": "users", "id": "user-xyz"}},
+                        "organization": {
+                            "data": {"type": "organizations", "id": "test-org"}
+                        },
                     },
-                },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         team1 = Team(id="team-123")
@@ -336,20 +399,22 @@ class TestOrganizationMembershipCreate:
     def test_create_with_organization_access(self, membership_service, mock_transport):
         """Test creating membership with team that has organization access."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "type": "organization-memberships",
-                "id": "ou-orgaccess123",
-                "attributes": {"status": "invited"},
-                "relationships": {
-                    "teams": {"data": [{"type": "teams", "id": "team-123"}]},
-                    "user": {"data": {"type": "users", "id": "user-abc"}},
-                    "organization": {
-                        "data": {"type": "organizations", "id": "test-org"}
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "type": "organization-memberships",
+                    "id": "ou-orgaccess123",
+                    "attributes": {"status": "invited"},
+                    "relationships": {
+                        "teams": {"data": [{"type": "teams", "id": "team-123"}]},
+                        "user": {"data": {"type": "users", "id": "user-abc"}},
+                        "organization": {
+                            "data": {"type": "organizations", "id": "test-org"}
+                        },
                     },
-                },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         team = Team(
@@ -421,7 +486,7 @@ class TestOrganizationMembershipRead:
     ):
         """Test reading organization membership when it exists."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_read_response
+        mock_response.content = json.dumps(sample_read_response).encode()
         mock_transport.request.return_value = mock_response
 
         membership = membership_service.read("ou-abc123def456")
@@ -508,7 +573,7 @@ class TestOrganizationMembershipReadWithOptions:
     ):
         """Test reading with include user option."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_read_with_user_response
+        mock_response.content = json.dumps(sample_read_with_user_response).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipReadOptions(
@@ -523,25 +588,27 @@ class TestOrganizationMembershipReadWithOptions:
     def test_read_with_options_include_teams(self, membership_service, mock_transport):
         """Test reading with include teams option."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "type": "organization-memberships",
-                "id": "ou-abc123def456",
-                "attributes": {"status": "active"},
-                "relationships": {
-                    "teams": {
-                        "data": [
-                            {"type": "teams", "id": "team-123"},
-                            {"type": "teams", "id": "team-456"},
-                        ]
-                    },
-                    "user": {"data": {"type": "users", "id": "user-123"}},
-                    "organization": {
-                        "data": {"type": "organizations", "id": "org-test"}
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "type": "organization-memberships",
+                    "id": "ou-abc123def456",
+                    "attributes": {"status": "active"},
+                    "relationships": {
+                        "teams": {
+                            "data": [
+                                {"type": "teams", "id": "team-123"},
+                                {"type": "teams", "id": "team-456"},
+                            ]
+                        },
+                        "user": {"data": {"type": "users", "id": "user-123"}},
+                        "organization": {
+                            "data": {"type": "organizations", "id": "org-test"}
+                        },
                     },
-                },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipReadOptions(
@@ -558,22 +625,24 @@ class TestOrganizationMembershipReadWithOptions:
     ):
         """Test reading with empty options."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "type": "organization-memberships",
-                "id": "ou-abc123def456",
-                "attributes": {"status": "active"},
-                "relationships": {
-                    "teams": {
-                        "data": [{"type": "teams", "id": "team-97LkM7QciNkwb2nh"}]
-                    },
-                    "user": {"data": {"type": "users", "id": "user-123"}},
-                    "organization": {
-                        "data": {"type": "organizations", "id": "org-test"}
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "type": "organization-memberships",
+                    "id": "ou-abc123def456",
+                    "attributes": {"status": "active"},
+                    "relationships": {
+                        "teams": {
+                            "data": [{"type": "teams", "id": "team-97LkM7QciNkwb2nh"}]
+                        },
+                        "user": {"data": {"type": "users", "id": "user-123"}},
+                        "organization": {
+                            "data": {"type": "organizations", "id": "org-test"}
+                        },
                     },
-                },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         options = OrganizationMembershipReadOptions()
@@ -670,20 +739,22 @@ class TestOrganizationMembershipValidation:
     def test_validate_valid_email_format(self, membership_service, mock_transport):
         """Test email validation with valid formats."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "type": "organization-memberships",
-                "id": "ou-test",
-                "attributes": {"status": "invited"},
-                "relationships": {
-                    "teams": {"data": [{"type": "teams", "id": "team-abc"}]},
-                    "user": {"data": {"type": "users", "id": "user-xyz"}},
-                    "organization": {
-                        "data": {"type": "organizations", "id": "test-org"}
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "type": "organization-memberships",
+                    "id": "ou-test",
+                    "attributes": {"status": "invited"},
+                    "relationships": {
+                        "teams": {"data": [{"type": "teams", "id": "team-abc"}]},
+                        "user": {"data": {"type": "users", "id": "user-xyz"}},
+                        "organization": {
+                            "data": {"type": "organizations", "id": "test-org"}
+                        },
                     },
-                },
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         valid_emails = [
@@ -716,37 +787,41 @@ class TestOrganizationMembershipIntegration:
         """Test complete workflow: create, read, then delete."""
         # Mock create response
         create_response = Mock()
-        create_response.json.return_value = {
-            "data": {
-                "type": "organization-memberships",
-                "id": "ou-workflow123",
-                "attributes": {"status": "invited"},
-                "relationships": {
-                    "teams": {"data": [{"type": "teams", "id": "team-abc"}]},
-                    "user": {"data": {"type": "users", "id": "user-xyz"}},
-                    "organization": {
-                        "data": {"type": "organizations", "id": "test-org"}
+        create_response.content = json.dumps(
+            {
+                "data": {
+                    "type": "organization-memberships",
+                    "id": "ou-workflow123",
+                    "attributes": {"status": "invited"},
+                    "relationships": {
+                        "teams": {"data": [{"type": "teams", "id": "team-abc"}]},
+                        "user": {"data": {"type": "users", "id": "user-xyz"}},
+                        "organization": {
+                            "data": {"type": "organizations", "id": "test-org"}
+                        },
                     },
-                },
+                }
             }
-        }
+        ).encode()
 
         # Mock read response
         read_response = Mock()
-        read_response.json.return_value = {
-            "data": {
-                "type": "organization-memberships",
-                "id": "ou-workflow123",
-                "attributes": {"status": "invited"},
-                "relationships": {
-                    "teams": {"data": [{"type": "teams", "id": "team-abc"}]},
-                    "user": {"data": {"type": "users", "id": "user-xyz"}},
-                    "organization": {
-                        "data": {"type": "organizations", "id": "test-org"}
+        read_response.content = json.dumps(
+            {
+                "data": {
+                    "type": "organization-memberships",
+                    "id": "ou-workflow123",
+                    "attributes": {"status": "invited"},
+                    "relationships": {
+                        "teams": {"data": [{"type": "teams", "id": "team-abc"}]},
+                        "user": {"data": {"type": "users", "id": "user-xyz"}},
+                        "organization": {
+                            "data": {"type": "organizations", "id": "test-org"}
+                        },
                     },
-                },
+                }
             }
-        }
+        ).encode()
 
         # Mock delete response
         delete_response = Mock()
@@ -776,9 +851,35 @@ class TestOrganizationMembershipIntegration:
         """Test workflow: list with filters, then read specific member."""
         # Mock list response
         list_response = Mock()
-        list_response.json.return_value = {
-            "data": [
-                {
+        list_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "type": "organization-memberships",
+                        "id": "ou-member1",
+                        "attributes": {"status": "active"},
+                        "relationships": {
+                            "teams": {
+                                "data": [
+                                    {"type": "teams", "id": "team-yUrEehvfG4pdmSjc"}
+                                ]
+                            },
+                            "user": {"data": {"type": "users", "id": "user-123"}},
+                            "organization": {
+                                "data": {"type": "organizations", "id": "test-org"}
+                            },
+                        },
+                    }
+                ],
+                "meta": {"pagination": {"current-page": 1, "total-count": 1}},
+            }
+        ).encode()
+
+        # Mock read response
+        read_response = Mock()
+        read_response.content = json.dumps(
+            {
+                "data": {
                     "type": "organization-memberships",
                     "id": "ou-member1",
                     "attributes": {"status": "active"},
@@ -792,28 +893,8 @@ class TestOrganizationMembershipIntegration:
                         },
                     },
                 }
-            ],
-            "meta": {"pagination": {"current-page": 1, "total-count": 1}},
-        }
-
-        # Mock read response
-        read_response = Mock()
-        read_response.json.return_value = {
-            "data": {
-                "type": "organization-memberships",
-                "id": "ou-member1",
-                "attributes": {"status": "active"},
-                "relationships": {
-                    "teams": {
-                        "data": [{"type": "teams", "id": "team-yUrEehvfG4pdmSjc"}]
-                    },
-                    "user": {"data": {"type": "users", "id": "user-123"}},
-                    "organization": {
-                        "data": {"type": "organizations", "id": "test-org"}
-                    },
-                },
             }
-        }
+        ).encode()
 
         mock_transport.request.side_effect = [list_response, read_response]
 
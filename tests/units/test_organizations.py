@@ -0,0 +1,92 @@
+"""Unit tests for organization read operations in the Python TFE SDK."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.pytfe.cache import TTLCache
+from src.pytfe.errors import NotFound
+from src.pytfe.models.organization import OrganizationUpdateOptions
+from src.pytfe.resources.organizations import Organizations
+
+READ_RESPONSE = {"data": {"id": "my-org", "attributes": {"name": "my-org"}}}
+
+
+def _response(status_code=200, payload=None, etag=None):
+    response = Mock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode() if payload is not None else b""
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class TestOrganizationRead:
+    """Test suite for organization read operations."""
+
+    @pytest.fixture
+    def mock_transport(self):
+        """Mock HTTP transport."""
+        return Mock()
+
+    def test_read_organization(self, mock_transport):
+        """Test reading an organization by name."""
+        mock_transport.request.return_value = _response(payload=READ_RESPONSE)
+
+        org = Organizations(mock_transport).read("my-org")
+
+        assert org.id == "my-org"
+        assert org.name == "my-org"
+        mock_transport.request.assert_called_once_with(
+            "GET", "/api/v2/organizations/my-org"
+        )
+
+    def test_read_organization_not_found(self, mock_transport):
+        """Test reading an organization that does not exist."""
+        mock_transport.request.side_effect = NotFound("not found", status=404)
+
+        with pytest.raises(NotFound):
+            Organizations(mock_transport).read("missing-org")
+
+    def test_read_revalidates_with_etag(self, mock_transport):
+        """Test a cached read is revalidated and reused on 304 Not Modified."""
+        mock_transport.request.side_effect = [
+            _response(payload=READ_RESPONSE, etag='"v1"'),
+            _response(status_code=304),
+        ]
+        organizations = Organizations(mock_transport, TTLCache())
+
+        first = organizations.read("my-org")
+        second = organizations.read("my-org")
+
+        assert second is first
+        calls = mock_transport.request.call_args_list
+        assert calls[0].kwargs == {}
+        assert calls[1].kwargs == {"headers": {"If-None-Match": '"v1"'}}
+
+    def test_read_without_cache_is_unconditional(self, mock_transport):
+        """Test no ETag is kept when caching is disabled."""
+        mock_transport.request.return_value = _response(
+            payload=READ_RESPONSE, etag='"v1"'
+        )
+        organizations = Organizations(mock_transport)
+
+        organizations.read("my-org")
+        organizations.read("my-org")
+
+        assert all(c.kwargs == {} for c in mock_transport.request.call_args_list)
+
+    def test_update_drops_stored_etag(self, mock_transport):
+        """Test updating an organization forgets its ETag."""
+        mock_transport.request.return_value = _response(
+            payload=READ_RESPONSE, etag='"v1"'
+        )
+        organizations = Organizations(mock_transport, TTLCache())
+
+        organizations.read("my-org")
+        organizations.update(
+            "my-org", OrganizationUpdateOptions(email="admin@example.com")
+        )
+        organizations.read("my-org")
+
+        assert mock_transport.request.call_args_list[-1].kwargs == {}
@@ -1,5 +1,6 @@
 """Unit tests for the plan module."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -60,7 +61,7 @@ class TestPlans:
 
         with patch.object(plans_service, "t") as mock_transport:
             mock_response = Mock()
-            mock_response.json.return_value = mock_response_data
+            mock_response.content = json.dumps(mock_response_data).encode()
             mock_transport.request.return_value = mock_response
 
             result = plans_service.read("plan-123")
@@ -121,7 +122,7 @@ class TestPlans:
 
         with patch.object(plans_service, "t") as mock_transport:
             mock_response = Mock()
-            mock_response.json.return_value = mock_json_data
+            mock_response.content = json.dumps(mock_json_data).encode()
             mock_transport.request.return_value = mock_response
 
             result = plans_service.read_json_output("plan-123")
@@ -137,3 +138,22 @@ class TestPlans:
             assert result["terraform_version"] == "1.5.0"
             assert len(result["resource_changes"]) == 1
             assert result["resource_changes"][0]["change"]["actions"] == ["create"]
+
+    def test_stream_json_output(self, plans_service):
+        """Test stream_json_output passes the raw body chunks through."""
+        with patch.object(plans_service, "t") as mock_transport:
+            mock_transport.stream.return_value = iter(
+                [b'{"format_', b'version": "1.1"}']
+            )
+
+            chunks = list(plans_service.stream_json_output("plan-123"))
+
+            mock_transport.stream.assert_called_once_with(
+                "GET", "/api/v2/plans/plan-123/json-output"
+            )
+            assert b"".join(chunks) == b'{"format_version": "1.1"}'
+
+    def test_stream_json_output_validation_error(self, plans_service):
+        """Test stream_json_output rejects invalid plan IDs."""
+        with pytest.raises(InvalidPlanIDError):
+            plans_service.stream_json_output("")
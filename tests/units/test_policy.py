@@ -1,5 +1,6 @@
 """Unit tests for the policy module."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -81,7 +82,7 @@ class TestPolicies:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         result = policies_service.list("org-123")
@@ -131,7 +132,7 @@ class TestPolicies:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         options = PolicyCreateOptions(
@@ -180,7 +181,7 @@ class TestPolicies:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         result = policies_service.read("pol-789")
@@ -212,7 +213,7 @@ class TestPolicies:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         options = PolicyUpdateOptions(
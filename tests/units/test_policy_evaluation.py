@@ -1,5 +1,6 @@
 """Unit tests for the policy evaluation module."""
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -77,7 +78,7 @@ class TestPolicyEvaluations:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         options = PolicyEvaluationListOptions(page_size=5)
@@ -107,7 +108,7 @@ class TestPolicyEvaluations:
         mock_response_data = {"data": []}
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         result = list(policy_evaluations_service.list("ts-empty"))
@@ -196,7 +197,7 @@ class TestPolicyEvaluations:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         result = list(policy_evaluations_service.list("ts-multi"))
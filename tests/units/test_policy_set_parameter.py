@@ -1,5 +1,6 @@
 """Unit tests for the policy_set_parameter module."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -156,7 +157,7 @@ class TestPolicySetParameters:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         options = PolicySetParameterCreateOptions(
@@ -209,7 +210,7 @@ class TestPolicySetParameters:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         options = PolicySetParameterCreateOptions(
@@ -258,7 +259,7 @@ class TestPolicySetParameters:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         result = policy_set_parameters_service.read("polset-123", "var-789")
@@ -308,7 +309,7 @@ class TestPolicySetParameters:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         options = PolicySetParameterUpdateOptions(
@@ -357,7 +358,7 @@ class TestPolicySetParameters:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         options = PolicySetParameterUpdateOptions(sensitive=True)
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import Mock
 
 from pytfe.models import (
@@ -28,15 +29,17 @@ class TestProjects:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "tb-flag123",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "flag", "value": None},
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "tb-flag123",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "flag", "value": None},
+                    }
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -114,13 +117,15 @@ class TestProjects:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "prj-123",
-                "type": "projects",
-                "attributes": {"name": project_name},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "prj-123",
+                    "type": "projects",
+                    "attributes": {"name": project_name},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         result = self.projects_service.create(organization, options)
@@ -146,14 +151,16 @@ class TestProjects:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": project_id,
-                "type": "projects",
-                "attributes": {"name": "Test Project"},
-                "relationships": {"organization": {"data": {"id": "test-org"}}},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": project_id,
+                    "type": "projects",
+                    "attributes": {"name": "Test Project"},
+                    "relationships": {"organization": {"data": {"id": "test-org"}}},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         result = self.projects_service.read(project_id)
@@ -176,14 +183,16 @@ class TestProjects:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": project_id,
-                "type": "projects",
-                "attributes": {"name": new_name},
-                "relationships": {"organization": {"data": {"id": "test-org"}}},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": project_id,
+                    "type": "projects",
+                    "attributes": {"name": new_name},
+                    "relationships": {"organization": {"data": {"id": "test-org"}}},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         result = self.projects_service.update(project_id, options)
@@ -256,14 +265,16 @@ class TestProjects:
 
         # Mock API response without organization relationship
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": project_id,
-                "type": "projects",
-                "attributes": {"name": "Test Project"},
-                # No relationships field
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": project_id,
+                    "type": "projects",
+                    "attributes": {"name": "Test Project"},
+                    # No relationships field
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         result = self.projects_service.read(project_id)
@@ -284,20 +295,22 @@ class TestProjectTagBindings:
         """Test successful listing of tag bindings"""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "tb-123",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "environment", "value": "production"},
-                },
-                {
-                    "id": "tb-456",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "team", "value": "platform"},
-                },
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "tb-123",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "environment", "value": "production"},
+                    },
+                    {
+                        "id": "tb-456",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "team", "value": "platform"},
+                    },
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -325,7 +338,7 @@ class TestProjectTagBindings:
         """Test listing tag bindings with empty response"""
         # Mock empty API response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps({"data": []}).encode()
         self.mock_transport.request.return_value = mock_response
 
         result = self.projects_service.list_tag_bindings(self.project_id)
@@ -353,18 +366,20 @@ class TestProjectTagBindings:
         """Test successful listing of effective tag bindings"""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "etb-123",
-                    "type": "effective-tag-bindings",
-                    "attributes": {"key": "environment", "value": "production"},
-                    "links": {
-                        "self": "/api/v2/projects/prj-test123/tag-bindings/etb-123"
-                    },
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "etb-123",
+                        "type": "effective-tag-bindings",
+                        "attributes": {"key": "environment", "value": "production"},
+                        "links": {
+                            "self": "/api/v2/projects/prj-test123/tag-bindings/etb-123"
+                        },
+                    }
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -404,20 +419,22 @@ class TestProjectTagBindings:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "tb-new123",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "environment", "value": "staging"},
-                },
-                {
-                    "id": "tb-new456",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "team", "value": "backend"},
-                },
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "tb-new123",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "environment", "value": "staging"},
+                    },
+                    {
+                        "id": "tb-new456",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "team", "value": "backend"},
+                    },
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -463,15 +480,17 @@ class TestProjectTagBindings:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "tb-flag123",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "flag", "value": None},
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "tb-flag123",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "flag", "value": None},
+                    }
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
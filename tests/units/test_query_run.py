@@ -14,6 +14,7 @@ Usage:
     pytest tests/units/test_query_run.py -v
 """
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -139,7 +140,7 @@ class TestQueryRunsList:
     ):
         """Test basic query run listing."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_query_run_list_response
+        mock_response.content = json.dumps(sample_query_run_list_response).encode()
         mock_transport.request.return_value = mock_response
 
         workspace_id = "ws-abc123"
@@ -177,7 +178,7 @@ class TestQueryRunsList:
     ):
         """Test list with options."""
         mock_response = Mock()
-        mock_response.json.return_value = sample_query_run_list_response
+        mock_response.content = json.dumps(sample_query_run_list_response).encode()
         mock_transport.request.return_value = mock_response
 
         workspace_id = "ws-abc123"
@@ -225,7 +226,7 @@ class TestQueryRunsCreate:
     ):
         """Test basic query run creation."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_query_run_data}
+        mock_response.content = json.dumps({"data": sample_query_run_data}).encode()
         mock_transport.request.return_value = mock_response
 
         options = QueryRunCreateOptions(
@@ -263,7 +264,7 @@ class TestQueryRunsCreate:
     ):
         """Test query run creation with variables."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_query_run_data}
+        mock_response.content = json.dumps({"data": sample_query_run_data}).encode()
         mock_transport.request.return_value = mock_response
 
         variables = [
@@ -304,7 +305,7 @@ class TestQueryRunsRead:
     ):
         """Test successful query run read."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_query_run_data}
+        mock_response.content = json.dumps({"data": sample_query_run_data}).encode()
         mock_transport.request.return_value = mock_response
 
         result = query_runs_service.read("qr-123abc456def")
@@ -334,7 +335,7 @@ class TestQueryRunsRead:
     ):
         """Test read with options."""
         mock_response = Mock()
-        mock_response.json.return_value = {"data": sample_query_run_data}
+        mock_response.content = json.dumps({"data": sample_query_run_data}).encode()
         mock_transport.request.return_value = mock_response
 
         options = QueryRunReadOptions(
@@ -1,5 +1,6 @@
 """Unit tests for the registry_provider_version module."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -136,7 +137,7 @@ class TestRegistryProviderVersions:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         options = RegistryProviderVersionCreateOptions(
@@ -220,7 +221,7 @@ class TestRegistryProviderVersions:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         with patch.object(
@@ -288,7 +289,7 @@ class TestRegistryProviderVersions:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
         mock_transport.request.return_value = mock_response
 
         result = versions_service.read(valid_version_id)
@@ -1,5 +1,6 @@
 """Unit tests for the run module."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -88,7 +89,7 @@ class TestRuns:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
 
         with patch.object(runs_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response
@@ -156,7 +157,7 @@ class TestRuns:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
 
         with patch.object(runs_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response
@@ -222,7 +223,7 @@ class TestRuns:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
 
         with patch.object(runs_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response
@@ -298,7 +299,7 @@ class TestRuns:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
 
         with patch.object(runs_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response
@@ -334,7 +335,7 @@ class TestRuns:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode()
 
         with patch.object(runs_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response
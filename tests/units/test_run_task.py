@@ -1,5 +1,6 @@
 """Unit tests for the run task module."""
 
+import json
 from unittest.mock import Mock, patch
 
 import pytest
@@ -231,7 +232,9 @@ class TestRunTasks:
         }
 
         mock_response_full = Mock()
-        mock_response_full.json.return_value = {"data": mock_response_data_full}
+        mock_response_full.content = json.dumps(
+            {"data": mock_response_data_full}
+        ).encode()
 
         with patch.object(run_tasks_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response_full
@@ -284,31 +287,35 @@ class TestRunTasks:
 
         # Mock response for read request with included relationships
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "task-123",
-                "type": "tasks",
-                "attributes": {
-                    "name": "test-task",
-                    "url": "https://example.com/task",
-                    "description": "Test task description",
-                    "category": "task",
-                    "enabled": True,
-                    "hmac-key": "secret-key",
-                },
-                "relationships": {
-                    "organization": {"data": {"id": "org-123", "type": "organizations"}}
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "task-123",
+                    "type": "tasks",
+                    "attributes": {
+                        "name": "test-task",
+                        "url": "https://example.com/task",
+                        "description": "Test task description",
+                        "category": "task",
+                        "enabled": True,
+                        "hmac-key": "secret-key",
+                    },
+                    "relationships": {
+                        "organization": {
+                            "data": {"id": "org-123", "type": "organizations"}
+                        }
+                    },
+                    "links": {"self": "/api/v2/tasks/task-123"},
                 },
-                "links": {"self": "/api/v2/tasks/task-123"},
-            },
-            "included": [
-                {
-                    "id": "org-123",
-                    "type": "organizations",
-                    "attributes": {"name": "test-org"},
-                }
-            ],
-        }
+                "included": [
+                    {
+                        "id": "org-123",
+                        "type": "organizations",
+                        "attributes": {"name": "test-org"},
+                    }
+                ],
+            }
+        ).encode()
 
         with patch.object(run_tasks_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response
@@ -368,20 +375,22 @@ class TestRunTasks:
         """Test cases for RunTask update operations."""
 
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "task-123",
-                "type": "tasks",
-                "attributes": {
-                    "name": "comprehensive-update",
-                    "url": "https://updated-example.com/webhook",
-                    "description": "Comprehensive update test",
-                    "category": "task",
-                    "enabled": False,
-                    "hmac-key": "new-secret-key",
-                },
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "task-123",
+                    "type": "tasks",
+                    "attributes": {
+                        "name": "comprehensive-update",
+                        "url": "https://updated-example.com/webhook",
+                        "description": "Comprehensive update test",
+                        "category": "task",
+                        "enabled": False,
+                        "hmac-key": "new-secret-key",
+                    },
+                }
             }
-        }
+        ).encode()
 
         options = RunTaskUpdateOptions(
             name="comprehensive-update",
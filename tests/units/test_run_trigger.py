@@ -1,5 +1,6 @@
 """Unit tests for the run trigger module."""
 
+import json
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -221,7 +222,7 @@ class TestRunTriggers:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = {"data": mock_response_data}
+        mock_response.content = json.dumps({"data": mock_response_data}).encode()
 
         with patch.object(run_triggers_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response
@@ -273,7 +274,7 @@ class TestRunTriggers:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = {"data": mock_response_data}
+        mock_response.content = json.dumps({"data": mock_response_data}).encode()
 
         with patch.object(run_triggers_service, "t") as mock_transport:
             mock_transport.request.return_value = mock_response
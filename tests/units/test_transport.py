@@ -1,21 +1,164 @@
+import gzip
+import json
+
+import httpx
+import pytest
+
 from pytfe._http import HTTPTransport
 from pytfe.config import TFEConfig
+from pytfe.errors import NotFound
 
 
-def test_http_transport_init():
+def _transport(handler=None, **overrides) -> HTTPTransport:
+    """Build a transport with fast test defaults.
+
+    ``overrides`` replace individual constructor keywords; ``handler``, when
+    given, answers every request instead of the network.
+    """
     cfg = TFEConfig()
-    t = HTTPTransport(
-        cfg.address,
-        "",
-        timeout=cfg.timeout,
-        verify_tls=cfg.verify_tls,
-        user_agent_suffix=None,
-        max_retries=1,
-        backoff_base=0.01,
-        backoff_cap=0.02,
-        backoff_jitter=False,
-        http2=False,
-        proxies=None,
-        ca_bundle=None,
-    )
+    options = {
+        "timeout": cfg.timeout,
+        "verify_tls": cfg.verify_tls,
+        "user_agent_suffix": None,
+        "max_retries": 0,
+        "backoff_base": 0.01,
+        "backoff_cap": 0.02,
+        "backoff_jitter": False,
+        "http2": False,
+        "proxies": None,
+        "ca_bundle": None,
+    }
+    options.update(overrides)
+    t = HTTPTransport(cfg.address, "", **options)
+    if handler is not None:
+        t._sync = httpx.Client(transport=httpx.MockTransport(handler))
+    return t
+
+
+def test_http_transport_init():
+    t = _transport(max_retries=1)
     assert t.base.startswith("https://")
+
+
+def test_http_transport_pool_limits():
+    cfg = TFEConfig(
+        max_connections=16, max_keepalive_connections=8, keepalive_expiry=60
+    )
+    t = _transport(
+        max_connections=cfg.max_connections,
+        max_keepalive_connections=cfg.max_keepalive_connections,
+        keepalive_expiry=cfg.keepalive_expiry,
+    )
+    assert t.limits.max_connections == 16
+    assert t.limits.max_keepalive_connections == 8
+    assert t.limits.keepalive_expiry == 60
+
+
+def test_http_transport_json_round_trip():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["body"] = json.loads(request.content)
+        seen["content_type"] = request.headers["Content-Type"]
+        seen["accept_encoding"] = request.headers["Accept-Encoding"]
+        return httpx.Response(200, content=b'{"data": {"id": "ws-123"}}')
+
+    t = _transport(handler)
+
+    resp = t.request("POST", "/api/v2/workspaces", json_body={"data": {"a": 1}})
+
+    assert seen["body"] == {"data": {"a": 1}}
+    assert seen["content_type"] == "application/vnd.api+json"
+    assert "gzip" in seen["accept_encoding"]
+    assert resp.json() == {"data": {"id": "ws-123"}}
+
+
+def test_json_helpers_fall_back_to_stdlib(monkeypatch):
+    from pytfe import _jsonapi
+
+    monkeypatch.setattr(_jsonapi, "_HAS_ORJSON", False)
+
+    assert _jsonapi.dumps({"data": [1, 2]}) == b'{"data":[1,2]}'
+    assert _jsonapi.loads(b'{"data": [1, 2]}') == {"data": [1, 2]}
+
+
+def test_http_transport_decodes_gzip_responses():
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = gzip.compress(b'{"data": [{"id": "apool-1"}]}')
+        return httpx.Response(200, content=body, headers={"Content-Encoding": "gzip"})
+
+    t = _transport(handler)
+
+    assert t.request("GET", "/api/v2/agent-pools").json() == {
+        "data": [{"id": "apool-1"}]
+    }
+
+
+def test_http2_enabled_by_default():
+    cfg = TFEConfig()
+    t = _transport(http2=cfg.http2)
+    assert cfg.http2 is True
+    assert t.http2 is True
+
+
+def test_pooled_connections_enable_tcp_keepalive():
+    import socket
+
+    from pytfe._http import _SOCKET_OPTIONS
+
+    t = _transport(max_retries=1)
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in _SOCKET_OPTIONS
+    pool = t._sync._transport_for_url(httpx.URL(t.base))._pool
+    assert pool._socket_options == _SOCKET_OPTIONS
+
+
+def test_prewarm_pings_in_background():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path))
+        return httpx.Response(204)
+
+    t = _transport(handler)
+
+    thread = t.prewarm()
+    thread.join(timeout=5)
+
+    assert thread.daemon
+    assert seen == [("HEAD", "/api/v2/ping")]
+
+
+def test_prewarm_swallows_connection_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("unreachable")
+
+    t = _transport(handler)
+
+    t.prewarm().join(timeout=5)
+
+
+def test_stream_yields_body_in_chunks_and_retries():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, content=b"x" * 10)
+
+    t = _transport(handler, max_retries=1)
+
+    chunks = list(t.stream("GET", "/api/v2/plans/plan-1/json-output", chunk_size=4))
+
+    assert calls == ["/api/v2/plans/plan-1/json-output"] * 2
+    assert chunks == [b"xxxx", b"xxxx", b"xx"]
+
+
+def test_stream_raises_sdk_errors():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, content=b'{"errors": [{"detail": "missing"}]}')
+
+    t = _transport(handler)
+
+    with pytest.raises(NotFound, match="missing"):
+        list(t.stream("GET", "/api/v2/plans/plan-1/json-output"))
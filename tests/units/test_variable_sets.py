@@ -1,5 +1,6 @@
 """Unit tests for Variable Set resources."""
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -47,28 +48,32 @@ class TestVariableSets:
         """Test successful listing of variable sets."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "varset-123",
-                    "type": "varsets",
-                    "attributes": {
-                        "name": "test-varset",
-                        "description": "Test variable set",
-                        "global": False,
-                        "priority": True,
-                        "created-at": "2023-01-01T00:00:00.000Z",
-                        "updated-at": "2023-01-01T00:00:00.000Z",
-                    },
-                    "relationships": {
-                        "workspaces": {
-                            "data": [{"id": "ws-123", "type": "workspaces"}]
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "varset-123",
+                        "type": "varsets",
+                        "attributes": {
+                            "name": "test-varset",
+                            "description": "Test variable set",
+                            "global": False,
+                            "priority": True,
+                            "created-at": "2023-01-01T00:00:00.000Z",
+                            "updated-at": "2023-01-01T00:00:00.000Z",
                         },
-                        "projects": {"data": [{"id": "prj-123", "type": "projects"}]},
-                    },
-                }
-            ]
-        }
+                        "relationships": {
+                            "workspaces": {
+                                "data": [{"id": "ws-123", "type": "workspaces"}]
+                            },
+                            "projects": {
+                                "data": [{"id": "prj-123", "type": "projects"}]
+                            },
+                        },
+                    }
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -92,7 +97,7 @@ class TestVariableSets:
         """Test listing variable sets with options."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = json.dumps({"data": []}).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Create options
@@ -134,21 +139,23 @@ class TestVariableSets:
         """Test successful listing of variable sets for workspace."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "varset-123",
-                    "type": "varsets",
-                    "attributes": {
-                        "name": "workspace-varset",
-                        "description": "Workspace variable set",
-                        "global": False,
-                        "priority": False,
-                    },
-                    "relationships": {},
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "varset-123",
+                        "type": "varsets",
+                        "attributes": {
+                            "name": "workspace-varset",
+                            "description": "Workspace variable set",
+                            "global": False,
+                            "priority": False,
+                        },
+                        "relationships": {},
+                    }
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -172,21 +179,23 @@ class TestVariableSets:
         """Test successful listing of variable sets for project."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "varset-123",
-                    "type": "varsets",
-                    "attributes": {
-                        "name": "project-varset",
-                        "description": "Project variable set",
-                        "global": False,
-                        "priority": False,
-                    },
-                    "relationships": {},
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "varset-123",
+                        "type": "varsets",
+                        "attributes": {
+                            "name": "project-varset",
+                            "description": "Project variable set",
+                            "global": False,
+                            "priority": False,
+                        },
+                        "relationships": {},
+                    }
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -220,19 +229,21 @@ class TestVariableSets:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "varset-new123",
-                "type": "varsets",
-                "attributes": {
-                    "name": "new-varset",
-                    "description": "New variable set",
-                    "global": False,
-                    "priority": True,
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "varset-new123",
+                    "type": "varsets",
+                    "attributes": {
+                        "name": "new-varset",
+                        "description": "New variable set",
+                        "global": False,
+                        "priority": True,
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -280,20 +291,22 @@ class TestVariableSets:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "varset-project123",
-                "type": "varsets",
-                "attributes": {
-                    "name": "project-varset",
-                    "description": "Project scoped variable set",
-                    "global": False,
-                },
-                "relationships": {
-                    "parent": {"data": {"type": "projects", "id": "prj-parent123"}}
-                },
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "varset-project123",
+                    "type": "varsets",
+                    "attributes": {
+                        "name": "project-varset",
+                        "description": "Project scoped variable set",
+                        "global": False,
+                    },
+                    "relationships": {
+                        "parent": {"data": {"type": "projects", "id": "prj-parent123"}}
+                    },
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -351,19 +364,21 @@ class TestVariableSets:
         """Test successful variable set read."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": self.variable_set_id,
-                "type": "varsets",
-                "attributes": {
-                    "name": "read-varset",
-                    "description": "Variable set for reading",
-                    "global": True,
-                    "priority": False,
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": self.variable_set_id,
+                    "type": "varsets",
+                    "attributes": {
+                        "name": "read-varset",
+                        "description": "Variable set for reading",
+                        "global": True,
+                        "priority": False,
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -384,14 +399,16 @@ class TestVariableSets:
         """Test reading variable set with include options."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": self.variable_set_id,
-                "type": "varsets",
-                "attributes": {"name": "test", "global": False},
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": self.variable_set_id,
+                    "type": "varsets",
+                    "attributes": {"name": "test", "global": False},
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Create options
@@ -427,19 +444,21 @@ class TestVariableSets:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": self.variable_set_id,
-                "type": "varsets",
-                "attributes": {
-                    "name": "updated-varset",
-                    "description": "Updated variable set",
-                    "global": True,
-                    "priority": False,
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": self.variable_set_id,
+                    "type": "varsets",
+                    "attributes": {
+                        "name": "updated-varset",
+                        "description": "Updated variable set",
+                        "global": True,
+                        "priority": False,
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -622,24 +641,26 @@ class TestVariableSets:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": self.variable_set_id,
-                "type": "varsets",
-                "attributes": {
-                    "name": "test-varset",
-                    "global": False,
-                },
-                "relationships": {
-                    "workspaces": {
-                        "data": [
-                            {"type": "workspaces", "id": "ws-1"},
-                            {"type": "workspaces", "id": "ws-2"},
-                        ]
-                    }
-                },
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": self.variable_set_id,
+                    "type": "varsets",
+                    "attributes": {
+                        "name": "test-varset",
+                        "global": False,
+                    },
+                    "relationships": {
+                        "workspaces": {
+                            "data": [
+                                {"type": "workspaces", "id": "ws-1"},
+                                {"type": "workspaces", "id": "ws-2"},
+                            ]
+                        }
+                    },
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -706,28 +727,30 @@ class TestVariableSetVariables:
         """Test successful listing of variables."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "var-123",
-                    "type": "vars",
-                    "attributes": {
-                        "key": "TF_VAR_test",
-                        "value": "test-value",
-                        "description": "Test variable",
-                        "category": "terraform",
-                        "hcl": False,
-                        "sensitive": False,
-                        "version-id": "v1",
-                    },
-                    "relationships": {
-                        "varset": {
-                            "data": {"id": self.variable_set_id, "type": "varsets"}
-                        }
-                    },
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "var-123",
+                        "type": "vars",
+                        "attributes": {
+                            "key": "TF_VAR_test",
+                            "value": "test-value",
+                            "description": "Test variable",
+                            "category": "terraform",
+                            "hcl": False,
+                            "sensitive": False,
+                            "version-id": "v1",
+                        },
+                        "relationships": {
+                            "varset": {
+                                "data": {"id": self.variable_set_id, "type": "varsets"}
+                            }
+                        },
+                    }
+                ]
+            }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -770,21 +793,23 @@ class TestVariableSetVariables:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "var-new123",
-                "type": "vars",
-                "attributes": {
-                    "key": "NEW_VAR",
-                    "value": "new-value",
-                    "description": "New variable",
-                    "category": "env",
-                    "hcl": False,
-                    "sensitive": True,
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "var-new123",
+                    "type": "vars",
+                    "attributes": {
+                        "key": "NEW_VAR",
+                        "value": "new-value",
+                        "description": "New variable",
+                        "category": "env",
+                        "hcl": False,
+                        "sensitive": True,
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -846,21 +871,23 @@ class TestVariableSetVariables:
         """Test successful variable read."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": self.variable_id,
-                "type": "vars",
-                "attributes": {
-                    "key": "READ_VAR",
-                    "value": "read-value",
-                    "description": "Variable for reading",
-                    "category": "terraform",
-                    "hcl": True,
-                    "sensitive": False,
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": self.variable_id,
+                    "type": "vars",
+                    "attributes": {
+                        "key": "READ_VAR",
+                        "value": "read-value",
+                        "description": "Variable for reading",
+                        "category": "terraform",
+                        "hcl": True,
+                        "sensitive": False,
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -901,21 +928,23 @@ class TestVariableSetVariables:
 
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": self.variable_id,
-                "type": "vars",
-                "attributes": {
-                    "key": "UPDATED_VAR",
-                    "value": "updated-value",
-                    "description": "Updated variable",
-                    "category": "terraform",
-                    "hcl": True,
-                    "sensitive": False,
-                },
-                "relationships": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": self.variable_id,
+                    "type": "vars",
+                    "attributes": {
+                        "key": "UPDATED_VAR",
+                        "value": "updated-value",
+                        "description": "Updated variable",
+                        "category": "terraform",
+                        "hcl": True,
+                        "sensitive": False,
+                    },
+                    "relationships": {},
+                }
             }
-        }
+        ).encode()
         self.mock_transport.request.return_value = mock_response
 
         # Call the method
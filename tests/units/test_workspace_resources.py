@@ -1,5 +1,6 @@
 """Unit tests for workspace resources service."""
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -91,7 +92,7 @@ class TestWorkspaceResourcesService:
         """Test successful listing of workspace resources."""
         # Mock the transport response
         mock_response = Mock()
-        mock_response.json.return_value = sample_workspace_resource_response
+        mock_response.content = json.dumps(sample_workspace_resource_response).encode()
         mock_transport.request.return_value = mock_response
 
         # Call the service
@@ -139,7 +140,7 @@ class TestWorkspaceResourcesService:
         """Test listing workspace resources with pagination options."""
         # Mock the transport response
         mock_response = Mock()
-        mock_response.json.return_value = sample_workspace_resource_response
+        mock_response.content = json.dumps(sample_workspace_resource_response).encode()
         mock_transport.request.return_value = mock_response
 
         # Create options
@@ -165,7 +166,7 @@ class TestWorkspaceResourcesService:
         """Test listing workspace resources when no resources exist."""
         # Mock the transport response
         mock_response = Mock()
-        mock_response.json.return_value = sample_empty_response
+        mock_response.content = json.dumps(sample_empty_response).encode()
         mock_transport.request.return_value = mock_response
 
         # Call the service
@@ -194,7 +195,7 @@ class TestWorkspaceResourcesService:
         """Test handling of malformed API response."""
         # Mock malformed response
         mock_response = Mock()
-        mock_response.json.return_value = {"invalid": "response"}
+        mock_response.content = json.dumps({"invalid": "response"}).encode()
         mock_transport.request.return_value = mock_response
 
         # Call the service
@@ -5,6 +5,7 @@ This test suite covers all workspace methods including CRUD operations,
 VCS management, locking/unlocking, SSH key management, and validation.
 """
 
+import json
 from unittest.mock import Mock
 
 import pytest
@@ -146,9 +147,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_list_response
     ):
         """Test basic workspace listing."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_list_response
-        )
+        ).encode()
 
         options = WorkspaceListOptions()
         workspaces = list(workspaces_service.list("test-org", options=options))
@@ -161,7 +162,7 @@ class TestWorkspaceOperations:
 
     def test_list_workspaces_with_search(self, workspaces_service, mock_transport):
         """Test workspace listing with search options."""
-        mock_transport.request.return_value.json.return_value = {"data": []}
+        mock_transport.request.return_value.content = json.dumps({"data": []}).encode()
 
         options = WorkspaceListOptions(
             search="production",
@@ -198,9 +199,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test reading workspace by organization and name."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         workspace = workspaces_service.read("test-workspace", organization="test-org")
 
@@ -220,9 +221,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test reading workspace by ID."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         workspace = workspaces_service.read_by_id("ws-abc123def456")
 
@@ -233,9 +234,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test reading workspace with include options."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         from src.pytfe.models.workspace import WorkspaceIncludeOpt
 
@@ -273,9 +274,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test basic workspace creation."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         options = WorkspaceCreateOptions(
             name="new-workspace",
@@ -300,9 +301,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test workspace creation with VCS configuration."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         vcs_repo = VCSRepo(
             identifier="myorg/myrepo",
@@ -335,9 +336,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test workspace creation with project relationship."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         project = Project(id="prj-123", name="Test Project", organization="test-org")
 
@@ -367,9 +368,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test updating workspace by name."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         options = WorkspaceUpdateOptions(
             name="test-workspace",  # Required field
@@ -393,9 +394,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test updating workspace by ID."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         options = WorkspaceUpdateOptions(name="dummy", auto_apply=True)
 
@@ -455,9 +456,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test removing VCS connection by name."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         workspace = workspaces_service.remove_vcs_connection(
             "test-workspace", organization="test-org"
@@ -475,9 +476,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test removing VCS connection by ID."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         workspace = workspaces_service.remove_vcs_connection_by_id("ws-123")
 
@@ -491,9 +492,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test locking a workspace."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         options = WorkspaceLockOptions(reason="Maintenance in progress")
         workspace = workspaces_service.lock("ws-123", options=options)
@@ -512,9 +513,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test unlocking a workspace."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         workspace = workspaces_service.unlock("ws-123")
 
@@ -529,9 +530,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test force unlocking a workspace."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         workspace = workspaces_service.force_unlock("ws-123")
 
@@ -549,9 +550,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test assigning SSH key to workspace."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         options = WorkspaceAssignSSHKeyOptions(ssh_key_id="sshkey-123")
         workspace = workspaces_service.assign_ssh_key("ws-123", options=options)
@@ -588,9 +589,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_workspace_response
     ):
         """Test unassigning SSH key from workspace."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_workspace_response
-        )
+        ).encode()
 
         workspace = workspaces_service.unassign_ssh_key("ws-123")
 
@@ -647,7 +648,7 @@ class TestWorkspaceOperations:
 
     def test_empty_workspace_list(self, workspaces_service, mock_transport):
         """Test handling empty workspace list."""
-        mock_transport.request.return_value.json.return_value = {"data": []}
+        mock_transport.request.return_value.content = json.dumps({"data": []}).encode()
 
         options = WorkspaceListOptions()
         workspaces = list(workspaces_service.list("test-org", options=options))
@@ -657,7 +658,7 @@ class TestWorkspaceOperations:
     def test_malformed_response_handling(self, workspaces_service, mock_transport):
         """Test handling of malformed API responses."""
         # Test missing data field
-        mock_transport.request.return_value.json.return_value = {}
+        mock_transport.request.return_value.content = json.dumps({}).encode()
 
         options = WorkspaceListOptions()
         workspaces = list(workspaces_service.list("test-org", options=options))
@@ -721,9 +722,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_remote_state_consumers_response
     ):
         """Test basic remote state consumers listing."""
-        mock_transport.request.return_value.json.return_value = (
+        mock_transport.request.return_value.content = json.dumps(
             sample_remote_state_consumers_response
-        )
+        ).encode()
 
         options = WorkspaceListRemoteStateConsumersOptions(page_size=10)
         consumers = list(
@@ -749,7 +750,7 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport
     ):
         """Test remote state consumers listing with pagination options."""
-        mock_transport.request.return_value.json.return_value = {"data": []}
+        mock_transport.request.return_value.content = json.dumps({"data": []}).encode()
 
         options = WorkspaceListRemoteStateConsumersOptions(page_number=2, page_size=5)
 
@@ -900,7 +901,9 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport, sample_tags_response
     ):
         """Test basic tag listing."""
-        mock_transport.request.return_value.json.return_value = sample_tags_response
+        mock_transport.request.return_value.content = json.dumps(
+            sample_tags_response
+        ).encode()
 
         options = WorkspaceTagListOptions(page_size=10)
         tags = list(workspaces_service.list_tags("ws-123", options))
@@ -919,7 +922,7 @@ class TestWorkspaceOperations:
         self, workspaces_service, mock_transport
     ):
         """Test tag listing with query and pagination options."""
-        mock_transport.request.return_value.json.return_value = {"data": []}
+        mock_transport.request.return_value.content = json.dumps({"data": []}).encode()
 
         options = WorkspaceTagListOptions(query="env", page_number=2, page_size=5)
 
@@ -1018,20 +1021,22 @@ class TestWorkspaceOperations:
         """Test listing tag bindings for a workspace."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "tb-123",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "environment", "value": "production"},
-                },
-                {
-                    "id": "tb-456",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "team", "value": "infrastructure"},
-                },
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "tb-123",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "environment", "value": "production"},
+                    },
+                    {
+                        "id": "tb-456",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "team", "value": "infrastructure"},
+                    },
+                ]
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -1060,32 +1065,34 @@ class TestWorkspaceOperations:
         """Test listing effective tag bindings for a workspace."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "etb-123",
-                    "type": "effective-tag-bindings",
-                    "attributes": {
-                        "key": "environment",
-                        "value": "production",
-                        "links": {
-                            "self": "/api/v2/workspaces/ws-123/effective-tag-bindings/etb-123"
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "etb-123",
+                        "type": "effective-tag-bindings",
+                        "attributes": {
+                            "key": "environment",
+                            "value": "production",
+                            "links": {
+                                "self": "/api/v2/workspaces/ws-123/effective-tag-bindings/etb-123"
+                            },
                         },
                     },
-                },
-                {
-                    "id": "etb-456",
-                    "type": "effective-tag-bindings",
-                    "attributes": {
-                        "key": "cost-center",
-                        "value": "engineering",
-                        "links": {
-                            "self": "/api/v2/workspaces/ws-123/effective-tag-bindings/etb-456"
+                    {
+                        "id": "etb-456",
+                        "type": "effective-tag-bindings",
+                        "attributes": {
+                            "key": "cost-center",
+                            "value": "engineering",
+                            "links": {
+                                "self": "/api/v2/workspaces/ws-123/effective-tag-bindings/etb-456"
+                            },
                         },
                     },
-                },
-            ]
-        }
+                ]
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -1114,20 +1121,22 @@ class TestWorkspaceOperations:
         """Test adding tag bindings to a workspace."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "tb-123",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "environment", "value": "staging"},
-                },
-                {
-                    "id": "tb-456",
-                    "type": "tag-bindings",
-                    "attributes": {"key": "team", "value": "backend"},
-                },
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "tb-123",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "environment", "value": "staging"},
+                    },
+                    {
+                        "id": "tb-456",
+                        "type": "tag-bindings",
+                        "attributes": {"key": "team", "value": "backend"},
+                    },
+                ]
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         # Create tag binding options
@@ -1177,18 +1186,20 @@ class TestWorkspaceOperations:
         """Test updating existing tag bindings."""
         # Mock API response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "tb-123",
-                    "type": "tag-bindings",
-                    "attributes": {
-                        "key": "environment",
-                        "value": "production",  # Updated value
-                    },
-                }
-            ]
-        }
+        mock_response.content = json.dumps(
+            {
+                "data": [
+                    {
+                        "id": "tb-123",
+                        "type": "tag-bindings",
+                        "attributes": {
+                            "key": "environment",
+                            "value": "production",  # Updated value
+                        },
+                    }
+                ]
+            }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         # Create options to update existing tag binding
@@ -1235,13 +1246,15 @@ class TestWorkspaceOperations:
         """Test reading a workspace's data retention policy (legacy method)."""
         # Mock successful response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "drp-legacy123",
-                "type": "data-retention-policies",
-                "attributes": {"delete-older-than-n-days": 30},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "drp-legacy123",
+                    "type": "data-retention-policies",
+                    "attributes": {"delete-older-than-n-days": 30},
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -1262,32 +1275,36 @@ class TestWorkspaceOperations:
         """Test reading a workspace's data retention policy choice (delete older type)."""
         # Mock the read_by_id call first
         workspace_mock_response = Mock()
-        workspace_mock_response.json.return_value = {
-            "data": {
-                "id": "ws-123",
-                "type": "workspaces",
-                "attributes": {"name": "test-workspace"},
-                "relationships": {
-                    "data-retention-policy-choice": {
-                        "data": {
-                            "id": "drp-delete123",
-                            "type": "data-retention-policy-delete-olders",
-                            "attributes": {"delete-older-than-n-days": 45},
+        workspace_mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "ws-123",
+                    "type": "workspaces",
+                    "attributes": {"name": "test-workspace"},
+                    "relationships": {
+                        "data-retention-policy-choice": {
+                            "data": {
+                                "id": "drp-delete123",
+                                "type": "data-retention-policy-delete-olders",
+                                "attributes": {"delete-older-than-n-days": 45},
+                            }
                         }
-                    }
-                },
+                    },
+                }
             }
-        }
+        ).encode()
 
         # Mock the relationships endpoint call
         drp_mock_response = Mock()
-        drp_mock_response.json.return_value = {
-            "data": {
-                "id": "drp-delete123",
-                "type": "data-retention-policy-delete-olders",
-                "attributes": {"delete-older-than-n-days": 45},
+        drp_mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "drp-delete123",
+                    "type": "data-retention-policy-delete-olders",
+                    "attributes": {"delete-older-than-n-days": 45},
+                }
             }
-        }
+        ).encode()
 
         # Configure mock to return different responses for different URLs
         def side_effect(*args, **kwargs):
@@ -1318,32 +1335,36 @@ class TestWorkspaceOperations:
         """Test reading a workspace's data retention policy choice (don't delete type)."""
         # Mock the read_by_id call first
         workspace_mock_response = Mock()
-        workspace_mock_response.json.return_value = {
-            "data": {
-                "id": "ws-123",
-                "type": "workspaces",
-                "attributes": {"name": "test-workspace"},
-                "relationships": {
-                    "data-retention-policy-choice": {
-                        "data": {
-                            "id": "drp-dontdelete123",
-                            "type": "data-retention-policy-dont-deletes",
-                            "attributes": {},
+        workspace_mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "ws-123",
+                    "type": "workspaces",
+                    "attributes": {"name": "test-workspace"},
+                    "relationships": {
+                        "data-retention-policy-choice": {
+                            "data": {
+                                "id": "drp-dontdelete123",
+                                "type": "data-retention-policy-dont-deletes",
+                                "attributes": {},
+                            }
                         }
-                    }
-                },
+                    },
+                }
             }
-        }
+        ).encode()
 
         # Mock the relationships endpoint call
         drp_mock_response = Mock()
-        drp_mock_response.json.return_value = {
-            "data": {
-                "id": "drp-dontdelete123",
-                "type": "data-retention-policy-dont-deletes",
-                "attributes": {},
+        drp_mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "drp-dontdelete123",
+                    "type": "data-retention-policy-dont-deletes",
+                    "attributes": {},
+                }
             }
-        }
+        ).encode()
 
         # Configure mock to return different responses for different URLs
         def side_effect(*args, **kwargs):
@@ -1371,13 +1392,15 @@ class TestWorkspaceOperations:
 
         # Mock successful response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "drp-new123",
-                "type": "data-retention-policy-delete-olders",
-                "attributes": {"delete-older-than-n-days": 60},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "drp-new123",
+                    "type": "data-retention-policy-delete-olders",
+                    "attributes": {"delete-older-than-n-days": 60},
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         # Create options
@@ -1418,13 +1441,15 @@ class TestWorkspaceOperations:
 
         # Mock successful response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "drp-dontdelete456",
-                "type": "data-retention-policy-dont-deletes",
-                "attributes": {},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "drp-dontdelete456",
+                    "type": "data-retention-policy-dont-deletes",
+                    "attributes": {},
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         # Call the method
@@ -1457,13 +1482,15 @@ class TestWorkspaceOperations:
 
         # Mock successful response
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "data": {
-                "id": "drp-legacy789",
-                "type": "data-retention-policies",
-                "attributes": {"delete-older-than-n-days": 90},
+        mock_response.content = json.dumps(
+            {
+                "data": {
+                    "id": "drp-legacy789",
+                    "type": "data-retention-policies",
+                    "attributes": {"delete-older-than-n-days": 90},
+                }
             }
-        }
+        ).encode()
         mock_transport.request.return_value = mock_response
 
         # Create options